@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- chunked dispatch benchmark
+# :Created:   dom 18 ott 2026 23:05:48 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+"""Measure the longest stall of the loop while notifying a signal with lots
+of synchronous handlers, executed all at once or in chunks.
+
+Run it with ``python bench/bench_chunked.py``.
+"""
+
+import asyncio
+import time
+
+from metapensiero.signal import Signal
+
+
+HANDLERS = 20000
+
+
+def make_handler():
+    def handler(value):
+        return value * 2
+    return handler
+
+
+async def measure(asignal):
+    stalls = []
+    running = True
+
+    async def ticker():
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            stalls.append(now - last)
+            last = now
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asignal.notify(1)
+    total = time.perf_counter() - start
+    running = False
+    await task
+    return total, max(stalls)
+
+
+def main():
+    handlers = [make_handler() for _ in range(HANDLERS)]
+    loop = asyncio.get_event_loop()
+    for label, options in (('all at once', {}),
+                           ('chunk_size=500', {'chunk_size': 500}),
+                           ('chunk_time=1ms', {'chunk_time': 0.001})):
+        asignal = Signal(**options)
+        for h in handlers:
+            asignal.connect(h)
+        total, stall = loop.run_until_complete(measure(asignal))
+        print('{:<16} total {:8.2f} ms, max stall {:8.2f} ms'.format(
+            label, total * 1000, stall * 1000))
+
+
+if __name__ == '__main__':
+    main()
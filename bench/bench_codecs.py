@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- codecs benchmark
+# :Created:   dom 18 ott 2026 18:02:55 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+"""Measure the encode and decode throughput of the available codecs.
+
+Run it with ``python bench/bench_codecs.py``.
+"""
+
+import timeit
+
+from metapensiero.signal import signal
+from metapensiero.signal.serialization import (JSONCodec, PickleCodec,
+                                               StructCodec)
+
+
+@signal
+def tick(symbol: str, price: float, volume: int):
+    pass
+
+
+ARGS = ('ACME', 101.25, 1200)
+KWARGS = {}
+NUMBER = 100000
+REPEAT = 5
+
+
+def bench(name, codec):
+    # measure the encoding, not the reuse of the encoded payloads
+    codec.reuse_size = 0
+    encode = min(timeit.repeat(
+        lambda: codec.encode('tick', None, ARGS, KWARGS),
+        number=NUMBER, repeat=REPEAT))
+    payload, buffers = codec.encode('tick', None, ARGS, KWARGS)
+    decode = min(timeit.repeat(lambda: codec.decode(payload),
+                               number=NUMBER, repeat=REPEAT))
+    print('{:<8} {:>6} bytes  encode {:>10.0f}/s  decode {:>10.0f}/s'.format(
+        name, len(payload), NUMBER / encode, NUMBER / decode))
+
+
+def main():
+    struct_codec = StructCodec()
+    struct_codec.register_signal(tick, 'tick')
+    bench('pickle', PickleCodec())
+    bench('json', JSONCodec())
+    bench('struct', struct_codec)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- eager tasks benchmark
+# :Created:   lun 19 ott 2026 03:46:09 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+"""Measure the latency of a notification of a concurrent signal whose
+asynchronous handlers complete without suspending, like on a cache hit,
+with and without the ``EAGER_TASKS`` flag.
+
+Run it with ``python bench/bench_eager.py``.
+"""
+
+import asyncio
+import time
+
+from metapensiero.signal import Signal, SignalOptions
+
+
+ROUNDS = 50
+
+
+def make_handler():
+    async def handler(key):
+        return key
+    return handler
+
+
+async def measure(asignal):
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await asignal.notify(1)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    loop = asyncio.get_event_loop()
+    for count in (10, 100, 1000):
+        handlers = [make_handler() for _ in range(count)]
+        timings = []
+        for flags in ((SignalOptions.EXEC_CONCURRENT,),
+                      (SignalOptions.EXEC_CONCURRENT,
+                       SignalOptions.EAGER_TASKS)):
+            asignal = Signal(*flags)
+            for h in handlers:
+                asignal.connect(h)
+            timings.append(loop.run_until_complete(measure(asignal)))
+        print('{:>5} handlers  gather {:9.1f} us  eager {:9.1f} us  '
+              '({:.1f}x)'.format(count, timings[0] * 1e6, timings[1] * 1e6,
+                                 timings[0] / timings[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- weak and strong handlers benchmark
+# :Created:   lun 19 ott 2026 02:04:33 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+"""Measure the cost of a notification when the handlers are referenced
+weakly, the default, or strongly, connected with ``weak=False``. The cost
+of the execution alone, without adapting the arguments to the signature of
+each handler, is shown too, because that dominates the total.
+
+Run it with ``python bench/bench_strong.py``.
+"""
+
+import timeit
+
+from metapensiero.signal import Signal
+from metapensiero.signal.utils import Executor
+
+
+NUMBER = 2000
+REPEAT = 5
+
+
+class Handler:
+
+    def method(self, symbol, price):
+        pass
+
+
+def measure(func):
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main():
+    keep = [Handler() for _ in range(100)]
+    for count in (1, 10, 100):
+        for kind in ('function', 'method'):
+            notify_timings = []
+            exec_timings = []
+            for weak in (True, False):
+                asignal = Signal(weak=weak)
+                for ix in range(count):
+                    if kind == 'function':
+                        # distinct functions, the same one is connected once
+                        def h(symbol, price):
+                            pass
+                        keep.append(h)
+                        asignal.connect(h)
+                    else:
+                        asignal.connect(keep[ix].method)
+                endpoints = asignal.subscribers.copy()
+                notify_timings.append(measure(
+                    lambda: asignal.notify('ACME', 101.25)))
+                exec_timings.append(measure(
+                    lambda: Executor(endpoints, adapt_params=False).run(
+                        'ACME', 101.25)))
+            print('{:>3} {:<8}  notify: weak {:8.2f} us strong {:8.2f} us  '
+                  'execution: weak {:8.2f} us strong {:8.2f} us'.format(
+                      count, kind, *[t * 1e6 for t in
+                                     notify_timings + exec_timings]))
+
+
+if __name__ == '__main__':
+    main()
@@ -34,8 +34,12 @@ setup(
         'Development Status :: 5 - Production/Stable',
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: 3.13",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)",
         ],
@@ -44,6 +48,7 @@ setup(
     packages=['metapensiero.' + pkg
               for pkg in find_packages('src/metapensiero')],
     package_dir={'': 'src'},
+    python_requires='>=3.8',
     install_requires=[
         'setuptools>=36.7.2',
         'weakreflist>=0.4',
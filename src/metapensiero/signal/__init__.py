@@ -16,25 +16,46 @@ def log_noisy_error(logger, *args, **kwargs):
     NOISY_ERROR_LOGGER(logger, *args, **kwargs)
 
 
-from .external import ExternalSignaller, ExternalSignallerAndHandler
+from .external import (BatchingExternalSignaller, CompositeExternalSignaller,
+                       ExternalSignaller, ExternalSignallerAndHandler,
+                       NamedExternalSignaller, RelayingSignallerAndHandler)
 from .user import SignalNameHandlerDecorator, handler, SignalAndHandlerInitMeta
 from .core import Signal
-from .utils import (Executor, ExecutionError, MultipleResults, NoResult,
+from .deferred import Deferral, MergePolicy
+from .subscribers import (Notification, QueuePolicy, QueueSubscriber,
+                          SignalStream)
+from .topic import TopicRegistry
+from .utils import (AggregatedResults, ChunkedResults, Executor,
+                    ExecutionError, MultipleResults, NoResult, ResultPolicy,
                     SignalError, SignalOptions, signal)
 
 
 __all__ = (
+    'AggregatedResults',
+    'BatchingExternalSignaller',
+    'ChunkedResults',
+    'CompositeExternalSignaller',
+    'Deferral',
     'Executor',
     'ExecutionError',
     'ExternalSignaller',
     'ExternalSignallerAndHandler',
+    'MergePolicy',
     'MultipleResults',
+    'NamedExternalSignaller',
     'NoResult',
+    'Notification',
+    'QueuePolicy',
+    'QueueSubscriber',
+    'RelayingSignallerAndHandler',
+    'ResultPolicy',
     'Signal',
     'SignalAndHandlerInitMeta',
     'SignalError',
     'SignalNameHandlerDecorator',
     'SignalOptions',
+    'SignalStream',
+    'TopicRegistry',
     'handler',
     'signal'
 )
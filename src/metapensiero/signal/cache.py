@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- memoization of the handlers results
+# :Created:   dom 18 ott 2026 22:20:05 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+import asyncio
+from collections import OrderedDict
+import inspect
+import time
+
+from .utils import MultipleResults, SignalError
+from .weak import Subscription
+
+
+_MISSING = object()
+
+
+class ResultCache:
+    """A cache of the results of a handler, with a maximum size, evicting the
+    least recently used entries, and an optional time to live.
+
+    :param int maxsize: the maximum number of results kept
+    :param float ttl: optional number of seconds after which a result
+      expires
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        """The number of calls answered from the cache."""
+        self.misses = 0
+        """The number of calls that executed the handler."""
+        self.evictions = 0
+        """The number of results removed to make room or because expired."""
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all the results. The calls in flight aren't shared with
+        the following ones anymore and their results aren't stored."""
+        self._entries.clear()
+        self._inflight.clear()
+        self._generation += 1
+
+    def get(self, key):
+        """Return the result stored with `key` or ``_MISSING``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires = entry
+        if expires is not None and expires < time.monotonic():
+            del self._entries[key]
+            self.evictions += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Store a result."""
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        entries = self._entries
+        entries[key] = (value, expires)
+        entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def stats(self):
+        """A dictionary with the current figures about the cache."""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'inflight': len(self._inflight),
+        }
+
+
+def make_cache(spec):
+    """Create a `ResultCache`:class: given the value of the ``cache``
+    option, that can be ``True`` for the defaults, an integer for the
+    maximum size, a mapping of the keyword arguments or a `ResultCache`
+    instance, to use as a template.
+    """
+    if spec is True:
+        return ResultCache()
+    elif isinstance(spec, int) and not isinstance(spec, bool):
+        return ResultCache(spec)
+    elif isinstance(spec, dict):
+        return ResultCache(**spec)
+    elif isinstance(spec, ResultCache):
+        return ResultCache(spec.maxsize, spec.ttl)
+    raise SignalError("Invalid cache specification {!r}".format(spec))
+
+
+class CachedHandler(Subscription):
+    """A `~.weak.Subscription`:class: that memoizes the results of a
+    handler, keyed by the arguments it receives, already adapted to its
+    signature by the `~.utils.Executor`:class:. Calls with arguments that
+    cannot be hashed aren't cached.
+
+    When the handler returns an awaitable, it's run as a task and the value
+    it returns is cached once it completes successfully. Meanwhile, the
+    calls with the same arguments share the same task. Each call gets it
+    shielded, so that a notification cancelling what it doesn't need
+    anymore, like one with a `~.utils.ResultPolicy`:class:, doesn't cancel
+    it for the others.
+
+    :param target: the handler
+    :param cache: the `ResultCache`:class: to use or a specification for
+      `make_cache`:func:
+    """
+
+    def __init__(self, target, cache=True):
+        super().__init__(target)
+        if not isinstance(cache, ResultCache):
+            cache = make_cache(cache)
+        self.cache = cache
+
+    def call(self, target, args, kwargs):
+        cache = self.cache
+        try:
+            key = (args, frozenset(kwargs.items())) if kwargs else args
+            value = cache.get(key)
+        except TypeError:
+            cache.misses += 1
+            return target(*args, **kwargs)
+        if value is not _MISSING:
+            cache.hits += 1
+            return value
+        inflight = cache._inflight.get(key)
+        if inflight is not None:
+            cache.hits += 1
+            return asyncio.shield(inflight)
+        cache.misses += 1
+        value = target(*args, **kwargs)
+        if inspect.isawaitable(value) and not (
+                isinstance(value, MultipleResults) and value.done):
+            task = asyncio.ensure_future(value)
+            cache._inflight[key] = task
+            generation = cache._generation
+            task.add_done_callback(
+                lambda t: self._completed(key, t, generation))
+            return asyncio.shield(task)
+        cache.put(key, value)
+        return value
+
+    def _completed(self, key, task, generation):
+        cache = self.cache
+        if cache._inflight.get(key) is task:
+            del cache._inflight[key]
+        if (generation == cache._generation and not task.cancelled() and
+            task.exception() is None):
+            cache.put(key, task.result())
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- signalling among partitioned nodes
+# :Created:   dom 18 ott 2026 18:05:37 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+import asyncio
+from bisect import bisect, insort
+import hashlib
+import logging
+
+from .external import BatchingExternalSignaller, RelayingSignallerAndHandler
+from .net import pack_frame, read_frame
+from .utils import NoResult, SignalError
+
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.blake2b(str(value).encode(),
+                                          digest_size=8).digest(), 'big')
+
+
+def _node_name(node):
+    return '{}:{}'.format(*node)
+
+
+class HashRing:
+    """A consistent hash ring that assigns keys to nodes. Each node is placed
+    on the ring `replicas` times, so that the keys are spread evenly and
+    adding or removing a node only moves the keys owned by it.
+
+    The hash doesn't depend on the process, so the same ring built in
+    different processes assigns the keys in the same way.
+
+    :param nodes: the initial nodes, ``(host, port)`` tuples
+    :param int replicas: the number of points of each node on the ring
+    """
+
+    def __init__(self, nodes=(), replicas=100):
+        self.replicas = replicas
+        self.nodes = set()
+        self._points = []
+        self._owners = {}
+        for node in nodes:
+            self.add(node)
+
+    def __contains__(self, node):
+        return node in self.nodes
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def add(self, node):
+        """Add a node to the ring."""
+        if node in self.nodes:
+            return
+        self.nodes.add(node)
+        name = _node_name(node)
+        for i in range(self.replicas):
+            point = _hash('{}#{}'.format(name, i))
+            # in the unlikely case of a collision the first one wins
+            if point not in self._owners:
+                self._owners[point] = node
+                insort(self._points, point)
+
+    def get(self, key):
+        """Return the node that owns `key`."""
+        if not self._points:
+            raise SignalError("The ring is empty")
+        ix = bisect(self._points, _hash(key))
+        if ix == len(self._points):
+            ix = 0
+        return self._owners[self._points[ix]]
+
+    def remove(self, node):
+        """Remove a node from the ring."""
+        if node not in self.nodes:
+            return
+        self.nodes.discard(node)
+        self._points = [p for p in self._points
+                        if self._owners[p] != node]
+        self._owners = {p: self._owners[p] for p in self._points}
+
+
+class PeerPool:
+    """A small pool of connections to a peer, opened lazily. Every key is
+    always sent over the same connection, so that the notifications about
+    an instance are delivered in the order they were made.
+
+    :param tuple address: the ``(host, port)`` of the peer
+    :param int size: the maximum number of connections
+    """
+
+    def __init__(self, address, size=2):
+        self.address = address
+        self.size = size
+        self._writers = [None] * size
+        self._locks = [None] * size
+
+    def slot(self, key):
+        """Return the index of the connection used for `key`."""
+        return _hash(key) % self.size
+
+    async def write(self, slot, data):
+        """Write `data` on a connection, opening it if needed."""
+        lock = self._locks[slot]
+        if lock is None:
+            lock = self._locks[slot] = asyncio.Lock()
+        async with lock:
+            writer = self._writers[slot]
+            if writer is None or writer.is_closing():
+                reader, writer = await asyncio.open_connection(*self.address)
+                self._writers[slot] = writer
+            try:
+                writer.write(data)
+                await writer.drain()
+            except Exception:
+                self._writers[slot] = None
+                writer.close()
+                raise
+
+    def close(self):
+        """Close all the connections."""
+        for ix, writer in enumerate(self._writers):
+            if writer is not None:
+                writer.close()
+                self._writers[ix] = None
+
+
+class PartitionedSignaller(BatchingExternalSignaller,
+                           RelayingSignallerAndHandler):
+    """An `~.external.RelayingSignallerAndHandler`:class: that partitions
+    the instances among many nodes connected over TCP. Each instance is
+    owned by the node that a `HashRing`:class: assigns to its key, and the
+    notifications made on it are executed only by the handlers of the
+    owner: when the owner is the current node they are executed as usual,
+    without touching the network, otherwise they are sent to the owner
+    only.
+
+    The notifications are batched as explained in
+    `~.external.BatchingExternalSignaller`:class: and the frames of a batch
+    directed to the same peer are written all at once, using a
+    `PeerPool`:class: per peer. The notifications received are executed in
+    order, one at a time, and aren't published again.
+
+    The subclasses have to implement
+    `~.external.RelayingSignallerAndHandler.instance_key`:meth: and
+    `~.external.RelayingSignallerAndHandler.resolve_instance`:meth:, the
+    notifications of the instances without a key and those made on the
+    signals themselves are executed locally only.
+
+    :param tuple address: the ``(host, port)`` to listen on, which is also
+      the identity of this node in the ring. When the port is ``0`` a free
+      one is chosen by `start`:meth:
+    :param peers: the addresses of the other nodes
+    :keyword int replicas: see `HashRing`:class:
+    :keyword int pool_size: the number of connections to each peer
+    :keyword codec: see `~.external.RelayingSignallerAndHandler`:class:
+    :param \\*\\*options: see `~.external.BatchingExternalSignaller`:class:
+    """
+
+    def __init__(self, address, peers=(), *, replicas=100, pool_size=2,
+                 codec=None, **options):
+        super().__init__(codec=codec, **options)
+        self.address = tuple(address)
+        self.ring = HashRing([self.address], replicas)
+        """The `HashRing`:class: of the nodes."""
+        self.pool_size = pool_size
+        self.pools = {}
+        """A mapping of the `PeerPool`:class: instances by address."""
+        self._server = None
+        self._serving = set()
+        for peer in peers:
+            self.add_peer(peer)
+
+    async def _deliver(self, payload):
+        try:
+            name, key, args, kwargs = self.codec.decode(payload)
+            result = self.deliver(name, key, args, kwargs)
+            if result is not None:
+                await result
+        except Exception:
+            logger.exception("Error while delivering a notification")
+
+    async def _deliver_local(self, name, key, args, kwargs):
+        result = self.deliver(name, key, args, kwargs)
+        if result is not None:
+            await result
+
+    async def _serve_peer(self, reader, writer):
+        self._serving.add(writer)
+        try:
+            while True:
+                payload = await read_frame(reader)
+                if payload is None:
+                    break
+                await self._deliver(payload)
+        except OSError:
+            pass
+        finally:
+            self._serving.discard(writer)
+            writer.close()
+
+    def add_peer(self, address):
+        """Add a node to the ring."""
+        address = tuple(address)
+        if address != self.address:
+            self.ring.add(address)
+            self.pools.setdefault(address,
+                                  PeerPool(address, self.pool_size))
+
+    async def close(self):
+        """Send what's buffered, stop listening and disconnect from the
+        peers."""
+        await self.flush()
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._serving):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        for pool in self.pools.values():
+            pool.close()
+
+    def handles_locally(self, signal, instance):
+        """Tell if this node owns `instance`."""
+        return self.owner(instance) == self.address
+
+    def owner(self, instance):
+        """Return the address of the node that owns `instance`."""
+        key = self.instance_key(instance)
+        if key is None:
+            return self.address
+        return self.ring.get(key)
+
+    def publish_signal(self, signal, instance, loop, args, kwargs):
+        """Buffer the notification if it's owned by another node."""
+        if instance is None or self.handles_locally(signal, instance):
+            return NoResult
+        return super().publish_signal(signal, instance, loop, args, kwargs)
+
+    def remove_peer(self, address):
+        """Remove a node from the ring and close the connections to it."""
+        address = tuple(address)
+        self.ring.remove(address)
+        pool = self.pools.pop(address, None)
+        if pool is not None:
+            pool.close()
+
+    async def send_batch(self, name, signal, batch):
+        """Send the frames of a batch to their owners, with a single write
+        per connection."""
+        remote = []
+        for instance, args, kwargs in batch:
+            key = self.instance_key(instance)
+            if self.ring.get(key) == self.address:
+                # the ring changed meanwhile
+                await self._deliver_local(name, key, args, kwargs)
+            else:
+                remote.append((key, args, kwargs))
+        # the peers may have changed while delivering, look the owners up
+        # again, without suspending until the writes are started
+        writes = {}
+        local = []
+        for key, args, kwargs in remote:
+            owner = self.ring.get(key)
+            pool = self.pools.get(owner)
+            if pool is None:
+                local.append((key, args, kwargs))
+                continue
+            payload, buffers = self.codec.encode(name, key, args, kwargs)
+            writes.setdefault((pool, pool.slot(key)), []).append(
+                pack_frame(payload))
+        results = await asyncio.gather(
+            *[pool.write(slot, b''.join(frames))
+              for (pool, slot), frames in writes.items()],
+            return_exceptions=True)
+        for key, args, kwargs in local:
+            await self._deliver_local(name, key, args, kwargs)
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            raise errors[0]
+
+    async def start(self):
+        """Start listening for the notifications sent by the peers."""
+        if self._server is None:
+            host, port = self.address
+            self._server = await asyncio.start_server(self._serve_peer, host,
+                                                      port)
+            if port == 0:
+                address = self._server.sockets[0].getsockname()[:2]
+                self.ring.remove(self.address)
+                self.address = address
+                self.ring.add(address)
@@ -16,13 +16,23 @@ import textwrap
 import types
 import weakref
 
+from .cache import CachedHandler
+from .deferred import Deferral, MergePolicy, _CURRENT as _DEFERRAL
 from .external import ExternalSignaller
-from .utils import Executor, pull_result, SignalOptions
-from .weak import MethodAwareWeakList
+from .filters import FilterStage, compile_where
+from .routing import KeyRouter, _MISSING
+from .subscribers import (NextNotification, QueuePolicy, QueueSubscriber,
+                          SignalStream)
+from .utils import (Executor, MultipleResults, NoResult, pull_result,
+                    ResultPolicy, SignalError, SignalOptions,
+                    dependency_levels, handler_names)
+from .weak import MethodAwareWeakList, StrongRef, Subscription
 from . import SignalAndHandlerInitMeta
 
 
 logger = logging.getLogger(__name__)
+STREAM_MAXSIZE = 100
+"The default size of the buffer of the streams."
 SIGN_DOC_TEMPLATE = """
 
 :returns: an awaitable that will return the results from the handlers
@@ -37,6 +47,8 @@ class InstanceProxy:
     member of a class.
     """
 
+    _executor = _executor_key = None
+
     def __init__(self, signal, instance):
         self.signal = signal
         self.instance = instance
@@ -53,17 +65,36 @@ class InstanceProxy:
         """Remove all the connected handlers, for this instance"""
         self.subscribers.clear()
 
-    def connect(self, cback):
+    def connect(self, cback, **options):
         "See signal"
         return self.signal.connect(cback,
                                    subscribers=self.subscribers,
-                                   instance=self.instance)
+                                   instance=self.instance, **options)
+
+    def connect_once(self, cback, **options):
+        "See signal"
+        return self.signal.connect_once(cback,
+                                        subscribers=self.subscribers,
+                                        instance=self.instance, **options)
 
-    def disconnect(self, cback):
+    def disconnect(self, cback, **options):
         "See signal"
         return self.signal.disconnect(cback,
                                       subscribers=self.subscribers,
-                                      instance=self.instance)
+                                      instance=self.instance, **options)
+
+    def emit(self, *args, **kwargs):
+        "See signal"
+        loop = kwargs.pop('loop', self.loop)
+        result = self.signal.prepare_notification(
+            subscribers=self.subscribers, instance=self.instance,
+            loop=loop, collect_results=False).run(*args, **kwargs)
+        return self.signal._track(result, self.instance, loop)
+
+    def get_cache(self, cback):
+        "See signal"
+        return self.signal.get_cache(cback, subscribers=self.subscribers,
+                                     instance=self.instance)
 
     def get_subscribers(self):
         """Get per-instance subscribers from the signal.
@@ -77,12 +108,21 @@ class InstanceProxy:
     def loop(self):
         return getattr(self.instance, 'loop', None)
 
+    def next(self):
+        "See signal"
+        return self.signal.next(subscribers=self.subscribers,
+                                instance=self.instance,
+                                loop=self.loop)
+
     def notify(self, *args, **kwargs):
         "See signal"
+        deferral = _DEFERRAL.get()
+        if deferral is not None:
+            return deferral.capture(self.signal, self.instance, self, args,
+                                    kwargs)
         loop = kwargs.pop('loop', self.loop)
-        return self.signal.prepare_notification(
-            subscribers=self.subscribers, instance=self.instance,
-            loop=loop).run(*args, **kwargs)
+        return self.signal._prepared(self, self.subscribers, self.instance,
+                                     loop).run(*args, **kwargs)
 
     __call__ = notify
 
@@ -97,6 +137,17 @@ class InstanceProxy:
           registered `~.external.ExternalSignaller` in the notification. It's
           ``True`` by default
 
+        collect_results : bool
+          a flag indicating if the values returned by the handlers should be
+          collected. When ``False`` the returned
+          `~.utils.MultipleResults`:class: is always empty and only waits
+          for the asynchronous handlers to complete. It's ``True`` by
+          default unless the signal has the
+          `~.utils.SignalOptions.DISCARD_RESULTS` flag
+
+        policy : `~.utils.ResultPolicy`
+          a policy to use in place of the signal's one
+
         """
         if args is None:
             args = ()
@@ -107,6 +158,14 @@ class InstanceProxy:
             subscribers=self.subscribers, instance=self.instance,
             loop=loop, **opts).run(*args, **kwargs)
 
+    def stream(self, maxsize=STREAM_MAXSIZE, policy=QueuePolicy.BLOCK):
+        "See signal"
+        return SignalStream(maxsize, policy).attach(self)
+
+    def subscribe_queue(self, maxsize, policy=QueuePolicy.BLOCK):
+        "See signal"
+        return QueueSubscriber(maxsize, policy).attach(self)
+
 
 class Signal:
     """The core class. It collects subscribers that can be either normal
@@ -126,18 +185,42 @@ class Signal:
       `disconnect`:meth: method
     :keyword fnotify: an optional callable that wraps the
       `notify`:meth: method
+    :keyword femit_error: an optional callable that receives the errors
+      raised by the handlers scheduled by `emit`:meth:
     :keyword fvalidation: an optional validation callable used to ensure that
       arguments passed to the `notify`:meth: invocation are those permitted
     :keyword str name: optional name of the signal
     :keyword loop: optional asyncio event loop to use
     :keyword external: optional external signaller that extends the signal
     :type external: `~.external.ExternalSignaller`:class:
+    :keyword policy: an optional `~.utils.ResultPolicy`:class: that
+      aggregates the values returned by the handlers, stopping their
+      execution as soon as the outcome is decided. The notifications then
+      return an `~.utils.AggregatedResults`:class:. It cannot be used with
+      chunking or with handlers that have dependencies
+    :keyword freduce: the function used by the
+      `~.utils.ResultPolicy.REDUCE` policy
+    :keyword reduce_initial: the initial value of the accumulator of the
+      `~.utils.ResultPolicy.REDUCE` policy
+    :keyword int chunk_size: if given, the handlers are executed in chunks
+      of at most this number of them, yielding to the loop between a chunk
+      and the next, see `~.utils.Executor.exec_chunked`:meth:
+    :keyword float chunk_time: if given, the handlers are executed in chunks
+      lasting at most this number of seconds
+    :keyword key_arg: the default name of the keyword argument, or the
+      index of the positional one, carrying the key of the notifications,
+      see `connect`:meth:
+    :keyword bool weak: ``False`` to keep strong references to the handlers
+      by default, see `connect`:meth:. ``True`` by default
     :param \*\*additional_params: optional additional params that will be
       stored in the instance
     """
     _external_signaller = None
     _name = None
     _concurrent_handlers = False
+    _has_dependencies = False
+    _executor = _executor_key = None
+    _signatures = None
 
     FLAGS = SignalOptions
     """All the available handlers sort modes. See `~.utils.SignalOptions`.
@@ -145,7 +228,10 @@ class Signal:
 
     def __init__(self, *flags, fconnect=None, fdisconnect=None,
                  fnotify=None, fvalidation=None, name=None,
-                 loop=None, external=None, **additional_params):
+                 loop=None, external=None, femit_error=None, policy=None,
+                 freduce=None, reduce_initial=None, chunk_size=None,
+                 chunk_time=None, key_arg=None, weak=True,
+                 **additional_params):
         self.name = name
         self.subscribers = MethodAwareWeakList()
         """A weak list containing the connected handlers"""
@@ -155,8 +241,18 @@ class Signal:
         self._fnotify = fnotify
         self._fconnect = fconnect
         self._fdisconnect = fdisconnect
+        self._femit_error = femit_error
+        self.policy = policy
+        self._freduce = freduce
+        self._reduce_initial = reduce_initial
+        self.chunk_size = chunk_size
+        self.chunk_time = chunk_time
+        self.key_arg = key_arg
+        self.weak = weak
         self._set_fvalidation(fvalidation)
         self._iproxies = weakref.WeakKeyDictionary()
+        self._emit_tasks = set()
+        self._levels_cache = {}
         if not all(isinstance(f, SignalOptions) for f in flags):
             raise ValueError("``flags`` elements must be instances of "
                              "`SignalOptions")
@@ -166,6 +262,9 @@ class Signal:
         elif not (SignalOptions.SORT_BOTTOMUP in flags or
                   SignalOptions.SORT_TOPDOWN in flags):
             flags = flags + (SignalOptions.SORT_BOTTOMUP,)
+        if (SignalOptions.EAGER_TASKS in flags and
+            SignalOptions.EXEC_CONCURRENT not in flags):
+            raise ValueError("Eager tasks need concurrent execution")
         self.flags = flags
         self.additional_params = additional_params
         """additional parameter passed at construction time"""
@@ -189,13 +288,139 @@ class Signal:
             self.__class__.__name__, self.name, len(self.subscribers)
         ))
 
-    def _connect(self, subscribers, cback):
+    def _connect(self, subscribers, cback, weak=True):
         if cback not in subscribers:
-            subscribers.append(cback)
+            if weak:
+                subscribers.append(cback)
+            else:
+                subscribers.append_strong(cback)
 
-    def _disconnect(self, subscribers, cback):
+    def _disconnect(self, subscribers, cback, key=_MISSING):
         if cback in subscribers:
             subscribers.remove(cback)
+        if subscribers.routers:
+            for router in subscribers.routers.values():
+                router.remove(cback, key)
+        if subscribers.filters:
+            subscribers.filters.remove(cback)
+        if subscribers.waiting:
+            subscribers.waiting.remove_all(cback)
+
+    def _exec_selected(self, selector, executor, *args, **kwargs):
+        """The endpoint that executes the handlers selected by a
+        `~.routing.KeyRouter`:class: or a `~.filters.FilterStage`:class:
+        for a notification, with the same configuration of the `executor`
+        it belongs to."""
+        endpoints = selector.select(
+            args, kwargs, self._validation_signature(executor.instance))
+        if endpoints is None:
+            return NoResult
+        endpoints = list(endpoints)
+        policy = executor.policy
+        levels = self._dependency_levels(endpoints, executor.instance)
+        self._check_execution(policy, levels)
+        if policy is ResultPolicy.REDUCE:
+            # the values are folded by the executor's aggregator, with the
+            # others
+            policy = None
+        selected = executor.replace(
+            endpoints=endpoints, exec_wrapper=None, fvalidation=None,
+            policy=policy, levels=levels)
+        if Executor.recorders:
+            selected = selected.recorded(Executor.recorders)
+        return selected.exec_all_endpoints(*args, **kwargs)
+
+    def _check_execution(self, policy, levels):
+        """Ensure that the ways of executing the handlers requested can be
+        used together."""
+        chunked = self.chunk_size is not None or self.chunk_time is not None
+        if policy is not None and (levels is not None or chunked):
+            raise SignalError("A result policy cannot be used with handlers "
+                              "that have dependencies or with chunking")
+        if levels is not None and chunked:
+            raise SignalError("Handlers that have dependencies cannot be "
+                              "executed in chunks")
+
+    def _notify_waiting(self, waiting, *args, **kwargs):
+        """The endpoint that resolves the futures returned by `next`:meth:,
+        whose subscriptions expire by themselves."""
+        for subscription in waiting.copy():
+            subscription(*args, **kwargs)
+        return NoResult
+
+    def _dependency_levels(self, subscribers, instance):
+        """Return the levels of the `subscribers` if some of them have
+        dependencies, ``None`` otherwise."""
+        if (instance is not None and
+            isinstance(instance.__class__, SignalAndHandlerInitMeta)):
+            class_deps = type(instance)._signal_handlers_dependencies
+        else:
+            class_deps = None
+        if not (class_deps or self._has_dependencies):
+            return None
+        entries = []
+        has_deps = False
+        for sub in subscribers:
+            if isinstance(sub, Subscription):
+                after, before = sub.after, sub.before
+                sub = sub.ref()
+            else:
+                after = before = ()
+                if isinstance(sub, weakref.ref):
+                    sub = sub()
+            name = getattr(sub, '__name__', None)
+            if (class_deps and not (after or before) and
+                getattr(sub, '__self__', None) is instance):
+                after, before = class_deps.get(name, ((), ()))
+            has_deps = has_deps or bool(after or before)
+            entries.append((name, after, before))
+        if not has_deps:
+            return None
+        key = tuple(entries)
+        levels = self._levels_cache.get(key)
+        if levels is None:
+            levels = dependency_levels(entries)
+            if len(self._levels_cache) >= 64:
+                self._levels_cache.clear()
+            self._levels_cache[key] = levels
+        return levels
+
+    def _prepared(self, holder, subscribers, instance, loop):
+        """Return the `~.utils.Executor`:class: prepared by
+        `prepare_notification`:meth: with the default options, cached on
+        `holder`, the signal itself or an `InstanceProxy`:class:, until
+        something that it depends on changes."""
+        external = self._external_signaller
+        if instance is not None and external is not None:
+            handles_locally = getattr(external, 'handles_locally', None)
+            local = (handles_locally is None or
+                     handles_locally(self, instance))
+        else:
+            local = True
+        key = (self.subscribers.version,
+               None if subscribers is None else subscribers.version,
+               loop or self.loop, local, external, self.flags, self._fnotify,
+               self._fvalidation, self.policy, self._freduce,
+               self._reduce_initial, self.chunk_size, self.chunk_time,
+               self.name)
+        if holder._executor_key != key:
+            holder._executor = self.prepare_notification(
+                subscribers=subscribers, instance=instance, loop=loop)
+            holder._executor_key = key
+        return holder._executor
+
+    def _emit_done(self, instance, task):
+        self._emit_tasks.discard(task)
+        if task.cancelled() or task.exception() is None:
+            return
+        error = task.exception()
+        if self._femit_error is None:
+            logger.error("Error while executing emitted handlers of %r",
+                         self, exc_info=error)
+        elif instance is None:
+            self._femit_error(error)
+        else:
+            self._femit_error(instance, error)
 
     def _find_indent(self, doct):
         lines = doct.splitlines()
@@ -218,8 +443,20 @@ class Signal:
             subscribers=(cback,), instance=instance,
             loop=loop).run(*args, **kwargs)
 
+    def _track(self, result, instance, loop):
+        """Schedule the completion of the awaitable `result` as a task and
+        keep a reference to it until it's done."""
+        if (not inspect.isawaitable(result) or
+            (isinstance(result, MultipleResults) and result.done)):
+            return None
+        task = asyncio.ensure_future(result, loop=loop)
+        self._emit_tasks.add(task)
+        task.add_done_callback(partial(self._emit_done, instance))
+        return task
+
     def _set_fvalidation(self, value):
         self._fvalidation = value
+        self._signatures = None
         if value is not None:
             if value.__doc__ is None:
                 doc = ''
@@ -230,19 +467,131 @@ class Signal:
             sig_doc = textwrap.indent(SIGN_DOC_TEMPLATE, ' ' * indent)
             value.__doc__ = self.__doc__ = doc + sig_doc
 
-    def connect(self, cback, subscribers=None, instance=None):
+    def _validation_signature(self, instance):
+        """Return the signature of the validation callable, without the
+        instance argument when the notification is made on an `instance`,
+        or ``None``. It's used to find the arguments of the notifications
+        needed by the keyed and filtered handlers."""
+        if self._fvalidation is None:
+            return None
+        signatures = self._signatures
+        if signatures is None:
+            signature = inspect.signature(self._fvalidation)
+            params = list(signature.parameters.values())
+            signatures = self._signatures = (
+                signature, signature.replace(parameters=params[1:]))
+        return signatures[instance is not None]
+
+    def connect(self, cback, subscribers=None, instance=None, *,
+                cache=None, after=None, before=None, key=None, key_arg=None,
+                where=None, times=None, weak=None):
         """Add  a function or a method as an handler of this signal.
         Any handler added can be a coroutine.
 
         :param cback: the callback (or *handler*) to be added to the set
+        :keyword cache: memoize the results of the handler, keyed by the
+          arguments it receives. It can be ``True``, the maximum number of
+          results, a mapping like ``{'maxsize': 100, 'ttl': 60}`` or a
+          `~.cache.ResultCache`:class:. See `~.cache.CachedHandler`:class:
+        :keyword after: the name, or a list of names, of the handlers that
+          must be completed before this one is executed. The name of a
+          handler is its ``__name__``, the name of the method for the class
+          handlers
+        :keyword before: the name, or a list of names, of the handlers that
+          must be executed after this one is completed
+        :keyword key: if given, the handler is executed only by the
+          notifications whose `key_arg` argument is equal to it. The
+          handlers are indexed by key, so the cost of a notification
+          doesn't depend on the number of those connected with other keys.
+          They're executed after the handlers connected without a key
+        :keyword key_arg: the name of the keyword argument, or the index of
+          the positional one, carrying the key. The signal's `key_arg` by
+          default
+        :keyword where: if given, the handler is executed only by the
+          notifications whose arguments satisfy all the predicates, like
+          ``{'amount': ('>', 1000)}``. See `~.filters.compile_where`:func:
+          for the allowed specifications. The predicates are evaluated once
+          per notification, also when shared by many handlers, see
+          `~.filters.FilterStage`:class:. These handlers are executed after
+          the handlers connected without a key
+        :keyword int times: if given, the handler is executed at most this
+          number of times and then it's disconnected, see
+          `~.weak.Subscription.remaining`:attr:
+        :keyword bool weak: if ``False`` the signal keeps a strong reference
+          to the handler, that stays connected until it's disconnected, and
+          notifying it is faster. It's the signal's `weak` by default
         :returns: ``None`` or the value returned by the corresponding wrapper
+
+        When some of the handlers have dependencies, they're executed in
+        levels computed by `~.utils.dependency_levels`:func:, the handlers
+        without dependencies being in the first one. The asynchronous
+        handlers of a level are executed concurrently and the next level
+        starts when they have completed, see
+        `~.utils.Executor.exec_levels`:meth:.
         """
         if subscribers is None:
             subscribers = self.subscribers
+        if weak is None:
+            weak = self.weak
+        handler = cback
+        if isinstance(cback, NextNotification):
+            if subscribers.waiting is None:
+                subscribers.waiting = MethodAwareWeakList()
+                # the executors prepared until now don't resolve it
+                subscribers.version += 1
+            subscribers = subscribers.waiting
+            cback.attach(subscribers)
+        if key is not None and where is not None:
+            raise SignalError("``key`` and ``where`` cannot be used together")
+        if key is not None:
+            if key_arg is None:
+                key_arg = self.key_arg
+            if key_arg is None:
+                raise SignalError("A keyed handler needs ``key_arg``")
+            if subscribers.routers is None:
+                subscribers.routers = {}
+            router = subscribers.routers.get(key_arg)
+            if router is None:
+                router = subscribers.routers[key_arg] = KeyRouter(key_arg)
+                # the executors prepared until now don't execute it
+                subscribers.version += 1
+            subscribers = router.subscribers(key)
+        elif where is not None:
+            predicates = compile_where(where)
+            if subscribers.filters is None:
+                subscribers.filters = FilterStage()
+                subscribers.version += 1
+            subscribers = subscribers.filters.subscribers(predicates)
+        if cache is not None and cache is not False:
+            cback = CachedHandler(cback, cache)
+            cback.attach(subscribers)
+        if after or before:
+            if not isinstance(cback, Subscription):
+                cback = Subscription(cback)
+                cback.attach(subscribers)
+            cback.after = handler_names(after)
+            cback.before = handler_names(before)
+            self._has_dependencies = True
+        if times is not None:
+            if times < 1:
+                raise SignalError("``times`` must be a positive number")
+            if not isinstance(cback, Subscription):
+                cback = Subscription(cback)
+                cback.attach(subscribers)
+            cback.remaining = times
+        if not weak:
+            if isinstance(cback, Subscription):
+                cback.ref = StrongRef(handler)
+            else:
+                try:
+                    hash(cback)
+                except TypeError:
+                    raise SignalError("A strongly referenced handler must "
+                                      "be hashable") from None
         # wrapper
         if self._fconnect is not None:
             def _connect(cback):
-                self._connect(subscribers, cback)
+                self._connect(subscribers, cback, weak)
 
             notify = partial(self._notify_one, instance)
             if instance is not None:
@@ -253,7 +602,7 @@ class Signal:
             if inspect.isawaitable(result):
                 result = pull_result(result)
         else:
-            self._connect(subscribers, cback)
+            self._connect(subscribers, cback, weak)
             result = None
         return result
 
@@ -261,11 +610,20 @@ class Signal:
         """Remove all the connected handlers"""
         self.subscribers.clear()
 
-    def disconnect(self, cback, subscribers=None, instance=None):
+    def connect_once(self, cback, subscribers=None, instance=None,
+                     **options):
+        """Like `connect`:meth:, but the handler is executed only by the
+        next notification."""
+        return self.connect(cback, subscribers, instance, times=1, **options)
+
+    def disconnect(self, cback, subscribers=None, instance=None, *,
+                   key=_MISSING):
         """Remove a previously added function or method from the set of the
         signal's handlers.
 
         :param cback: the callback (or *handler*) to be added to the set
+        :keyword key: the key the handler was connected with, if any. If
+          it's not given, the handler is searched among all the keys
         :returns: ``None`` or the value returned by the corresponding wrapper
         """
         if subscribers is None:
@@ -273,7 +631,7 @@ class Signal:
         # wrapper
         if self._fdisconnect is not None:
             def _disconnect(cback):
-                self._disconnect(subscribers, cback)
+                self._disconnect(subscribers, cback, key)
 
             notify = partial(self._notify_one, instance)
             if instance is not None:
@@ -285,10 +643,61 @@ class Signal:
             if inspect.isawaitable(result):
                 result = pull_result(result)
         else:
-            self._disconnect(subscribers, cback)
+            self._disconnect(subscribers, cback, key)
             result = None
         return result
 
+    async def drain(self, timeout=None):
+        """Wait for the completion of the tasks scheduled by
+        `emit`:meth:, also those scheduled in the meantime. Useful for a
+        graceful shutdown.
+
+        :param timeout: optional maximum number of seconds to wait, in
+          total
+        :returns: ``True`` if all the tasks completed, ``False`` if the
+          timeout expired
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self._emit_tasks:
+            if deadline is None:
+                remaining = None
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+            done, pending = await asyncio.wait(set(self._emit_tasks),
+                                               timeout=remaining)
+            if pending:
+                return False
+        return True
+
+    @staticmethod
+    def deferred(merge=MergePolicy.LAST):
+        """Return a `~.deferred.Deferral`:class: context manager, that
+        captures the notifications made inside its block, on any signal,
+        merges those made on the same signal and instance and dispatches
+        them on exit.
+
+        :param merge: a `~.deferred.MergePolicy`:class: or a callable, see
+          `~.deferred.Deferral`:class:
+        """
+        return Deferral(merge)
+
+    def emit(self, *args, **kwargs):
+        """Call all the registered handlers with the arguments passed,
+        without waiting for the asynchronous ones. The awaitables are
+        completed by a task on the signal's loop, that's referenced by the
+        signal until it's done and that can be waited using `drain`:meth:.
+        Errors raised by the asynchronous handlers are passed to the
+        `on_emit_error`:meth: wrapper, if any, or logged.
+
+        :returns: the task or ``None`` if there was nothing to wait for
+        """
+        result = self.prepare_notification(collect_results=False).run(
+            *args, **kwargs)
+        return self._track(result, None, self.loop)
+
     def ext_publish(self, instance, loop, *args, **kwargs):
         """If 'external_signaller' is defined, calls it's publish method to
         notify external event systems.
@@ -314,6 +723,39 @@ class Signal:
         if self._name and value:
             value.register_signal(self, self._name)
 
+    def get_cache(self, cback, subscribers=None, instance=None):
+        """Return the `~.cache.ResultCache`:class: of `cback`, if it has been
+        connected with the ``cache`` option or if it's a class handler
+        declared with it, or ``None``."""
+        if subscribers is None:
+            subscribers = self.subscribers
+        for sub in subscribers:
+            if isinstance(sub, CachedHandler) and sub == cback:
+                return sub.cache
+        if (instance is not None and
+            isinstance(instance.__class__, SignalAndHandlerInitMeta)):
+            return type(instance)._get_handler_cache(instance, cback)
+        return None
+
+    def next(self, subscribers=None, instance=None, loop=None):
+        """Return a future resolved with the
+        `~.subscribers.Notification`:class: of the next notification,
+        containing its arguments:
+
+        .. code:: python
+
+          args, kwargs = await response_received.next()
+
+        The subscription is passed to the `connect`:meth: wrapper, if any,
+        but it's kept apart from the handlers, so that the executor prepared
+        for the notifications stays valid. See
+        `~.subscribers.NextNotification`:class:.
+        """
+        future = (loop or self.loop).create_future()
+        self.connect(NextNotification(future), subscribers, instance,
+                     weak=True)
+        return future
+
     @property
     def name(self):
         """The *name* of the signal used in conjunction with external
@@ -332,41 +774,89 @@ class Signal:
         :returns: an instance of `~.utils.MultipleResults`:class: or the
           result of the execution of the corresponding wrapper function
         """
-        return self.prepare_notification().run(*args, **kwargs)
+        deferral = _DEFERRAL.get()
+        if deferral is not None:
+            return deferral.capture(self, None, self, args, kwargs)
+        return self._prepared(self, None, None, None).run(*args, **kwargs)
 
     __call__ = notify
 
+    def notify_prepared(self, args=None, kwargs=None, **opts):
+        """Like notify allows to pass more options to the underlying
+        `prepare_notification()`:meth: method. See
+        `InstanceProxy.notify_prepared()`:meth: for the allowed options.
+        """
+        if args is None:
+            args = ()
+        if kwargs is None:
+            kwargs = {}
+        return self.prepare_notification(**opts).run(*args, **kwargs)
+
     def prepare_notification(self, *, subscribers=None, instance=None,
-                             loop=None, notify_external=True):
+                             loop=None, notify_external=True,
+                             collect_results=None, policy=None):
         """Sets up a and configures an `~.utils.Executor`:class: instance."""
-        # merge callbacks added to the class level with those added to the
-        # instance, giving the formers precedence while preserving overall
-        # order
-        self_subscribers = self.subscribers.copy()
-        # add in callbacks declared in the main class body and marked with
-        # @handler
-        if (instance is not None and self.name and
-            isinstance(instance.__class__, SignalAndHandlerInitMeta)):
-            class_handlers = type(instance)._get_class_handlers(
-                self.name, instance)
-            for ch in class_handlers:
-                # eventual methods are ephemeral and normally the following
-                # condition would always be True for methods but the dict used
-                # has logic to take that into account
-                if ch not in self_subscribers:
-                    self_subscribers.append(ch)
-        # add in the other instance level callbacks added at runtime
-        if subscribers is not None:
-            for el in subscribers:
-                # eventual methods are ephemeral and normally the following
-                # condition would always be True for methods but the dict used
-                # has logic to take that into account
-                if el not in self_subscribers:
-                    self_subscribers.append(el)
+        external = self.external_signaller if notify_external else None
+        if instance is not None and external is not None:
+            # a signaller may partition the instances among many processes
+            handles_locally = getattr(external, 'handles_locally', None)
+            local = (handles_locally is None or
+                     handles_locally(self, instance))
+        else:
+            local = True
+        if local:
+            # merge callbacks added to the class level with those added to the
+            # instance, giving the formers precedence while preserving overall
+            # order
+            self_subscribers = self.subscribers.copy()
+            # add in callbacks declared in the main class body and marked with
+            # @handler
+            if (instance is not None and self.name and
+                isinstance(instance.__class__, SignalAndHandlerInitMeta)):
+                class_handlers = type(instance)._get_class_handlers(
+                    self.name, instance)
+                for ch in class_handlers:
+                    # eventual methods are ephemeral and normally the
+                    # following condition would always be True for methods
+                    # but the dict used has logic to take that into account
+                    if ch not in self_subscribers:
+                        self_subscribers.append(ch)
+            # add in the other instance level callbacks added at runtime
+            if subscribers is not None:
+                for el in subscribers:
+                    # eventual methods are ephemeral and normally the
+                    # following condition would always be True for methods
+                    # but the dict used has logic to take that into account
+                    if el not in self_subscribers:
+                        self_subscribers.append(el)
+            # add the handlers connected with the key carried by the
+            # notification or with predicates, selected when it's executed
+            selectors_start = len(self_subscribers)
+            for subs in (self.subscribers, subscribers):
+                if subs is None:
+                    continue
+                if subs.routers:
+                    self_subscribers.extend(subs.routers.values())
+                if subs.filters:
+                    self_subscribers.append(subs.filters)
+            selectors = self_subscribers[selectors_start:]
+            for subs in (self.subscribers, subscribers):
+                if subs is not None and subs.waiting is not None:
+                    self_subscribers.append(partial(self._notify_waiting,
+                                                    subs.waiting))
+            levels = self._dependency_levels(self_subscribers, instance)
+        else:
+            # the handlers will be executed by the owner of the instance
+            self_subscribers = []
+            selectors = ()
+            selectors_start = 0
+            levels = None
         loop = loop or self.loop
         # maybe do a round of external publishing
-        if notify_external and self.external_signaller is not None:
+        if external is not None:
             self_subscribers.append(partial(self.ext_publish, instance, loop))
+            if levels is not None:
+                levels = levels + [[len(self_subscribers) - 1]]
         if self._fnotify is None:
             fnotify = None
         else:
@@ -377,10 +867,49 @@ class Signal:
         validator = self._fvalidation
         if validator is not None and instance is not None:
             validator = types.MethodType(validator, instance)
-        return Executor(self_subscribers, owner=self,
-                        concurrent=SignalOptions.EXEC_CONCURRENT in self.flags,
-                        loop=loop, exec_wrapper=fnotify,
-                        fvalidation=validator)
+        if collect_results is None:
+            collect_results = SignalOptions.DISCARD_RESULTS not in self.flags
+        policy = policy or self.policy
+        self._check_execution(policy, levels)
+        executor = Executor(
+            self_subscribers, owner=self,
+            concurrent=SignalOptions.EXEC_CONCURRENT in self.flags,
+            loop=loop, exec_wrapper=fnotify, fvalidation=validator,
+            collect_results=collect_results, instance=instance,
+            policy=policy, freduce=self._freduce,
+            reduce_initial=self._reduce_initial, chunk_size=self.chunk_size,
+            chunk_time=self.chunk_time, levels=levels,
+            eager=SignalOptions.EAGER_TASKS in self.flags)
+        for ix, selector in enumerate(selectors, selectors_start):
+            executor.endpoints[ix] = partial(self._exec_selected, selector,
+                                             executor)
+        return executor
+
+    def subscribe_queue(self, maxsize, policy=QueuePolicy.BLOCK):
+        """Connect a new `~.subscribers.QueueSubscriber`:class: that collects
+        the notifications in a bounded queue, for consumers that cannot keep
+        up with the rate of the notifications.
+
+        :param int maxsize: the size of the queue
+        :param policy: what to do when the queue is full, see
+          `~.subscribers.QueuePolicy`:class:
+        :returns: the subscriber, that stays connected as long as it's
+          referenced
+        """
+        return QueueSubscriber(maxsize, policy).attach(self)
+
+    def stream(self, maxsize=STREAM_MAXSIZE, policy=QueuePolicy.BLOCK):
+        """Connect a new `~.subscribers.SignalStream`:class:, an asynchronous
+        iterator over the notifications that can be used in an ``async for``
+        loop. The stream is disconnected when it's closed or garbage
+        collected.
+
+        :param int maxsize: the size of the buffer
+        :param policy: what to do when the buffer is full, see
+          `~.subscribers.QueuePolicy`:class:
+        :returns: the stream
+        """
+        return SignalStream(maxsize, policy).attach(self)
 
     def on_connect(self, fconnect):
         """On connect optional wrapper decorator.
@@ -401,6 +930,17 @@ class Signal:
         self._fdisconnect = fdisconnect
         return self
 
+    def on_emit_error(self, femit_error):
+        """On emit error optional wrapper decorator. The wrapper is called
+        with the exception raised while completing the handlers scheduled by
+        `emit`:meth:.
+
+        :param femit_error: the callable to install as error handler
+        :returns: the signal
+        """
+        self._femit_error = femit_error
+        return self
+
     def on_notify(self, fnotify):
         """On notify optional wrapper decorator.
 
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- deferred notifications
+# :Created:   dom 18 ott 2026 23:24:10 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+from collections import OrderedDict
+import contextvars
+from enum import Enum
+
+from .subscribers import Notification
+from .utils import NO_RESULTS, SignalError, _is_pending
+
+
+_CURRENT = contextvars.ContextVar('deferral', default=None)
+
+
+class MergePolicy(Enum):
+    """How a `Deferral`:class: merges the notifications made on the same
+    signal and instance.
+    """
+
+    LAST = 1
+    """Keep only the last notification."""
+    FIRST = 2
+    """Keep only the first notification."""
+    ALL = 3
+    """Keep all the notifications, they're just delayed."""
+
+
+class Deferral:
+    """A context manager that captures the notifications made with
+    `~.core.Signal.notify`:meth: while it's active, in the same thread or
+    task, and dispatches them when it exits. Usually created by
+    `~.core.Signal.deferred`:meth:
+
+    .. code:: python
+
+      with Signal.deferred():
+          for item in items:
+              item.price = compute_price(item)
+              item.changed.notify('price')
+
+    The notifications made on the same signal and instance are merged as
+    specified by `merge`, that can be a `MergePolicy`:class: or a callable
+    that receives the previous and the current
+    `~.subscribers.Notification`:class: and returns the one to keep. Each
+    merged notification is dispatched at the position of the one whose
+    arguments are kept, the latest when `merge` is a callable, so that the
+    order among different signals is preserved.
+
+    The notifications return an already completed and empty
+    `~.utils.MultipleResults`:class:, the results of the dispatched ones are
+    collected into `results`. Used as an asynchronous context manager, it
+    also waits for the asynchronous handlers to complete. If the block
+    raises an exception, the captured notifications are discarded. A
+    deferral entered while another is active passes its notifications to
+    the outer one.
+
+    The handlers executed by the dispatch aren't deferred. The
+    notifications made with `~.core.Signal.notify_prepared`:meth: or
+    `~.core.Signal.emit`:meth: aren't deferred either.
+
+    :param merge: the merge policy, `MergePolicy.LAST` by default
+    """
+
+    def __init__(self, merge=MergePolicy.LAST):
+        self.merge = merge
+        self.captured = 0
+        """The number of notifications captured."""
+        self.results = []
+        """The results of the dispatched notifications."""
+        self._pending = None
+        self._outer = None
+        self._token = None
+
+    def __enter__(self):
+        if self._pending is not None:
+            raise SignalError("The deferral is already active")
+        self._pending = OrderedDict()
+        self._outer = _CURRENT.get()
+        self._token = _CURRENT.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pending, self._pending = self._pending, None
+        _CURRENT.reset(self._token)
+        outer, self._outer = self._outer, None
+        self._token = None
+        if exc_type is not None:
+            return
+        if outer is not None:
+            for key, (target, notification) in pending.items():
+                outer._add(key, target, notification)
+        else:
+            self._dispatch(pending.values())
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.__exit__(exc_type, exc, tb)
+        if exc_type is None:
+            for result in self.results:
+                if _is_pending(result):
+                    await result
+
+    def _add(self, key, target, notification):
+        self.captured += 1
+        merge = self.merge
+        pending = self._pending
+        if merge is MergePolicy.ALL:
+            key = (key, self.captured)
+        else:
+            previous = pending.get(key)
+            if previous is not None:
+                if merge is MergePolicy.FIRST:
+                    return
+                elif merge is not MergePolicy.LAST:
+                    notification = merge(previous[1], notification)
+                # move it to the position of the latest
+                del pending[key]
+        pending[key] = (target, notification)
+
+    def capture(self, signal, instance, target, args, kwargs):
+        """Capture a notification made on `signal`, possibly bound to
+        `instance`, that will be dispatched calling ``target.notify()``.
+
+        :returns: `~.utils.NO_RESULTS`
+        """
+        self._add((id(signal), id(instance)), target,
+                  Notification(args, kwargs))
+        return NO_RESULTS
+
+    def _dispatch(self, entries):
+        token = _CURRENT.set(None)
+        try:
+            results = self.results
+            for target, (args, kwargs) in entries:
+                results.append(target.notify(*args, **kwargs))
+        finally:
+            _CURRENT.reset(token)
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- durable offloading of handlers
+# :Created:   dom 18 ott 2026 19:12:44 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import sqlite3
+import time
+
+from .serialization import PickleCodec
+from .utils import Executor, NoResult, SignalError
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  handler TEXT NOT NULL,
+  payload BLOB NOT NULL,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  due REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS dead_notifications (
+  id INTEGER PRIMARY KEY,
+  handler TEXT NOT NULL,
+  payload BLOB NOT NULL,
+  attempts INTEGER NOT NULL
+);
+"""
+
+
+class DurableHandler:
+    """The subscriber returned by `DurableQueue.register`:meth:, that stores
+    the notifications it receives in the queue instead of executing the
+    handler."""
+
+    def __init__(self, queue, name, handler):
+        self.queue = queue
+        self.name = name
+        self.handler = handler
+
+    def __call__(self, *args, **kwargs):
+        return self.queue.append(self.name, args, kwargs)
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(self.__class__.__name__, self.name)
+
+
+class DurableQueue:
+    """A queue persisted in a SQLite database in *WAL* mode, that executes
+    the handlers registered with it in a background task, for the handlers
+    that are slow but whose notifications must not be lost, like those
+    sending emails or calling webhooks:
+
+    .. code:: python
+
+      queue = DurableQueue('outbox.db')
+      user_created.connect(queue.register('welcome_email', send_welcome))
+      await queue.start()
+
+    A notification received by a registered handler is buffered and written
+    to the database together with the others received in the following
+    `flush_interval` seconds (or when `batch_size` of them are buffered),
+    with a single transaction. The notifying side doesn't wait for the
+    handler, unless `acknowledge` is ``True``, in which case it can await on
+    the results to wait until the notification has been written.
+
+    The background task executes the handlers in the order the
+    notifications were written and removes them from the database only
+    when their handler has completed successfully, so every notification is
+    executed *at least once*, even if the process crashes. Failed
+    notifications are retried after `retry_delay` seconds, up to
+    `max_attempts` times: then they are logged and moved to the
+    ``dead_notifications`` table. The notifications left by a previous run
+    are executed once the queue is started, resolving their handler by the
+    name used to register it.
+
+    The database is written and read from a dedicated thread, so that the
+    loop isn't blocked while the transactions are synced to the disk.
+
+    :param str path: the path of the database
+    :keyword int batch_size: the maximum number of notifications written or
+      executed at once
+    :keyword float flush_interval: the maximum number of seconds a
+      notification is kept in memory before being written
+    :keyword float retry_delay: seconds to wait before executing again a
+      failed notification
+    :keyword int max_attempts: the number of times a notification is
+      executed before giving up on it, ``10`` by default. ``None`` means
+      retrying forever
+    :keyword bool acknowledge: if ``True`` the subscribers return a future
+      resolved when the notification has been written. ``False`` by default
+    :keyword codec: the `~.serialization.Codec`:class: used to store the
+      arguments, a `~.serialization.PickleCodec`:class: by default
+    """
+
+    def __init__(self, path, *, batch_size=100, flush_interval=0.05,
+                 retry_delay=1.0, max_attempts=10, acknowledge=False,
+                 codec=None):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_delay = retry_delay
+        self.max_attempts = max_attempts
+        self.acknowledge = acknowledge
+        self.codec = codec or PickleCodec()
+        self.handlers = {}
+        """A mapping of the `DurableHandler`:class: instances by name."""
+        self.db = sqlite3.connect(path, isolation_level=None,
+                                  check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=FULL')
+        self.db.executescript(SCHEMA)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._buffer = []
+        self._ack = None
+        self._completed = []
+        self._failed = []
+        self._dead = []
+        self._timer = None
+        self._wakeup = None
+        self._task = None
+
+    @property
+    def backlog(self):
+        """The number of notifications waiting to be executed."""
+        return self.db.execute(
+            'SELECT count(*) FROM notifications').fetchone()[0] + len(
+                self._buffer)
+
+    def append(self, name, args, kwargs):
+        """Buffer a notification for the handler registered with `name`.
+
+        :returns: a future resolved once the notification has been written
+          if `acknowledge` is ``True``, `~.utils.NoResult` otherwise
+        """
+        payload, buffers = self.codec.encode(name, None, args, kwargs)
+        self._buffer.append((name, payload))
+        loop = asyncio.get_running_loop()
+        if self.acknowledge:
+            if self._ack is None:
+                self._ack = loop.create_future()
+            ack = self._ack
+        else:
+            ack = NoResult
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_interval, self.flush)
+        return ack
+
+    async def close(self):
+        """Write what's buffered, stop executing the handlers and close the
+        database."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        self._executor.shutdown()
+        self.db.close()
+
+    async def _execute(self, row):
+        rowid, name, payload, attempts = row
+        handler = self.handlers[name].handler
+        try:
+            _, _, args, kwargs = self.codec.decode(payload)
+            result = Executor([handler], owner=self).run(*args, **kwargs)
+            if not result.done:
+                await result
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Error while executing the durable handler %r",
+                             name)
+            if (self.max_attempts is not None and
+                attempts + 1 >= self.max_attempts):
+                logger.error("Giving up on the notification %d for the "
+                             "durable handler %r after %d attempts", rowid,
+                             name, attempts + 1)
+                self._dead.append(rowid)
+            else:
+                self._failed.append(rowid)
+        else:
+            self._completed.append(rowid)
+
+    def _fetch(self):
+        names = list(self.handlers)
+        return self.db.execute(
+            'SELECT id, handler, payload, attempts FROM notifications '
+            'WHERE due <= ? AND handler IN ({}) ORDER BY id '
+            'LIMIT ?'.format(', '.join('?' * len(names))),
+            [time.time()] + names + [self.batch_size]).fetchall()
+
+    def flush(self):
+        """Write the buffered notifications and the outcome of the executed
+        ones in a single transaction.
+
+        :returns: a task resolved once the transaction has been committed,
+          with ``True`` or with ``False`` if it has failed, in which case
+          everything is kept for the next attempt
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        buffer, self._buffer = self._buffer, []
+        completed, self._completed = self._completed, []
+        failed, self._failed = self._failed, []
+        dead, self._dead = self._dead, []
+        ack, self._ack = self._ack, None
+        if buffer or completed or failed or dead:
+            # submitted right away, to be executed before any later fetch
+            write = asyncio.get_running_loop().run_in_executor(
+                self._executor, self._write, buffer, completed, failed, dead)
+        else:
+            write = None
+        return asyncio.ensure_future(
+            self._flush(write, buffer, completed, failed, dead, ack))
+
+    async def _flush(self, write, buffer, completed, failed, dead, ack):
+        try:
+            if write is not None:
+                await write
+        except Exception as e:
+            # keep everything for the next attempt
+            self._buffer[:0] = buffer
+            self._completed[:0] = completed
+            self._failed[:0] = failed
+            self._dead[:0] = dead
+            if ack is None:
+                logger.exception("Error while writing the durable queue")
+            else:
+                ack.set_exception(e)
+            return False
+        else:
+            if ack is not None:
+                ack.set_result(None)
+            if buffer and self._wakeup is not None:
+                self._wakeup.set()
+            return True
+        finally:
+            if self._timer is None and (self._buffer or self._completed or
+                                        self._failed or self._dead):
+                self._timer = asyncio.get_running_loop().call_later(
+                    self.flush_interval, self.flush)
+
+    def register(self, name, handler):
+        """Register a handler with a name that is stable across runs.
+
+        :param str name: the name used to find the handler when executing the
+          stored notifications
+        :param handler: the callable to execute, either a function or a
+          coroutine function
+        :returns: a `DurableHandler`:class:, to connect to the signals in
+          place of the handler. The queue keeps it alive
+        """
+        if name in self.handlers:
+            raise SignalError("A handler named {!r} is already "
+                              "registered".format(name))
+        subscriber = self.handlers[name] = DurableHandler(self, name, handler)
+        return subscriber
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        wakeup = self._wakeup
+        while True:
+            # the executor runs one job at a time, so this sees the outcome
+            # of the previous rows
+            rows = await loop.run_in_executor(self._executor, self._fetch)
+            for row in rows:
+                await self._execute(row)
+            if rows:
+                self.flush()
+            else:
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self.retry_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def start(self):
+        """Start executing the stored notifications."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+
+    def _write(self, buffer, completed, failed, dead):
+        db = self.db
+        try:
+            db.execute('BEGIN')
+            if buffer:
+                db.executemany('INSERT INTO notifications (handler, payload) '
+                               'VALUES (?, ?)', buffer)
+            if completed:
+                db.executemany('DELETE FROM notifications WHERE id = ?',
+                               [(rowid,) for rowid in completed])
+            if failed:
+                due = time.time() + self.retry_delay
+                db.executemany('UPDATE notifications SET '
+                               'attempts = attempts + 1, due = ? '
+                               'WHERE id = ?',
+                               [(due, rowid) for rowid in failed])
+            if dead:
+                rowids = [(rowid,) for rowid in dead]
+                db.executemany('INSERT INTO dead_notifications '
+                               '(id, handler, payload, attempts) '
+                               'SELECT id, handler, payload, attempts + 1 '
+                               'FROM notifications WHERE id = ?', rowids)
+                db.executemany('DELETE FROM notifications WHERE id = ?',
+                               rowids)
+            db.execute('COMMIT')
+        except Exception:
+            if db.in_transaction:
+                db.execute('ROLLBACK')
+            raise
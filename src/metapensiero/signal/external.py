@@ -7,6 +7,14 @@
 #
 
 from abc import ABCMeta, abstractmethod
+import asyncio
+import logging
+
+from .serialization import PickleCodec
+from .utils import MultipleResults, NoResult
+
+
+logger = logging.getLogger(__name__)
 
 
 class ExternalSignaller(metaclass=ABCMeta):
@@ -14,6 +22,14 @@ class ExternalSignaller(metaclass=ABCMeta):
     event systems.
     """
 
+    def handles_locally(self, signal, instance):
+        """Tell if a notification of `signal` made on `instance` has to be
+        executed by the handlers of this process too. Signallers that
+        partition the instances among many processes can return ``False``
+        for the instances owned by another process, so that the notification
+        is only published."""
+        return True
+
     @abstractmethod
     def publish_signal(self, signal, instance, loop, args, kwargs):
         """Publish a notification externally. This can be either a normal
@@ -36,3 +52,225 @@ class ExternalSignallerAndHandler(ExternalSignaller):
     def register_class(cls, bases, namespace, signals, handlers):
         """Register a new class"""
         pass
+
+
+class NamedExternalSignaller(ExternalSignaller):
+    """An `ExternalSignaller`:class: base that keeps track of the registered
+    signals by name."""
+
+    def __init__(self):
+        self.signals = {}
+        """A mapping of the registered signals by name."""
+        self.names = {}
+        """A mapping of the names by registered signal."""
+
+    def register_signal(self, signal, name):
+        """Register a signal with its name"""
+        self.signals[name] = signal
+        self.names[signal] = name
+
+
+class CompositeExternalSignaller(ExternalSignaller):
+    """An `ExternalSignaller`:class: that publishes the notifications to
+    many others, for example to deliver them using different transports.
+    When these share the same `~.serialization.Codec`:class:, each
+    notification is encoded only once.
+
+    :param \\*signallers: the `ExternalSignaller`:class: instances
+    """
+
+    def __init__(self, *signallers):
+        self.signallers = signallers
+
+    def publish_signal(self, signal, instance, loop, args, kwargs):
+        """Publish the notification with all the signallers."""
+        results = []
+        for signaller in self.signallers:
+            res = signaller.publish_signal(signal, instance, loop, args,
+                                           kwargs)
+            if res is not NoResult:
+                results.append(res)
+        return MultipleResults(results)
+
+    def register_signal(self, signal, name):
+        """Register the signal with all the signallers."""
+        for signaller in self.signallers:
+            signaller.register_signal(signal, name)
+
+
+class RelayingSignallerAndHandler(NamedExternalSignaller,
+                                  ExternalSignallerAndHandler):
+    """An `ExternalSignallerAndHandler`:class: base for the signallers that
+    relay the notifications to other processes, where they are delivered to
+    the local signal registered with the same name.
+
+    To deliver the notifications made on a signal member of a class, the
+    subclasses have to implement `instance_key`:meth:, that gives a key for
+    an instance that can be transmitted, and `resolve_instance`:meth:, that
+    finds the instance given that key in the receiving process. By default
+    they are delivered without an instance.
+
+    :keyword codec: the `~.serialization.Codec`:class: used to encode the
+      notifications, a `~.serialization.PickleCodec`:class: by default
+    """
+
+    def __init__(self, *, codec=None):
+        super().__init__()
+        self.classes = {}
+        """A mapping of the registered classes by qualified name."""
+        self.codec = codec or PickleCodec()
+
+    def deliver(self, name, key, args, kwargs):
+        """Notify a notification received from another process to the
+        local signal, without publishing it again.
+
+        :returns: the results of the notification or ``None`` if there's no
+          signal registered with `name`
+        """
+        signal = self.signals.get(name)
+        if signal is None:
+            return None
+        instance = None if key is None else self.resolve_instance(signal,
+                                                                  key)
+        if instance is None:
+            target = signal
+        else:
+            target = signal.__get__(instance, type(instance))
+        return target.notify_prepared(args, kwargs, notify_external=False)
+
+    def instance_key(self, instance):
+        """Return a key that identifies `instance` in the other processes or
+        ``None``."""
+        return None
+
+    def register_class(self, cls, bases, namespace, signals, handlers):
+        """Register a new class"""
+        self.classes['{}.{}'.format(cls.__module__, cls.__qualname__)] = cls
+
+    def register_signal(self, signal, name):
+        """Register a signal with its name"""
+        super().register_signal(signal, name)
+        self.codec.register_signal(signal, name)
+
+    def resolve_instance(self, signal, key):
+        """Return the instance identified by `key`, on which the notification
+        of `signal` will be made, or ``None``."""
+        return None
+
+
+class BatchingExternalSignaller(NamedExternalSignaller):
+    """An `ExternalSignaller`:class: base that collects the publications of
+    each signal in a buffer and hands them over to `send_batch`:meth: all at
+    once, so that a subclass can send them with a single I/O operation.
+
+    A buffer is flushed when it reaches `max_size` notifications, when its
+    oldest notification is `max_age` seconds old or, if `flush_on_idle` is
+    ``True``, as soon as the loop has finished running the current
+    callbacks, so that all the notifications made in the same loop iteration
+    are sent together. The batches are sent one at a time, in the order they
+    have been flushed.
+
+    :keyword int max_size: the maximum number of notifications in a batch
+    :keyword float max_age: optional maximum number of seconds a notification
+      can wait in the buffer
+    :keyword bool flush_on_idle: flush the buffers on the next loop
+      iteration. ``True`` by default
+    :keyword bool acknowledge: if ``True`` the publication returns a future
+      that is resolved when the batch containing the notification has been
+      sent, so that who awaits on the notification's results waits for it
+      too. ``False`` by default
+    :keyword loop: optional asyncio event loop to use instead of the signal's
+      one
+    """
+
+    def __init__(self, *, max_size=1000, max_age=0.01, flush_on_idle=True,
+                 acknowledge=False, loop=None, **kwargs):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.flush_on_idle = flush_on_idle
+        self.acknowledge = acknowledge
+        self.loop = loop
+        self._buffers = {}
+        self._batch_loops = {}
+        self._acks = {}
+        self._timers = {}
+        self._idle = None
+        self._sending = set()
+        self._lock = None
+        super().__init__(**kwargs)
+
+    def _flush_idle(self):
+        self._idle = None
+        for signal in list(self._buffers):
+            self._flush_signal(signal)
+
+    def _flush_signal(self, signal):
+        batch = self._buffers.pop(signal, None)
+        timer = self._timers.pop(signal, None)
+        ack = self._acks.pop(signal, None)
+        if timer is not None:
+            timer.cancel()
+        if batch:
+            task = asyncio.ensure_future(self._send(signal, batch, ack),
+                                         loop=self._batch_loops.pop(signal))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(self, signal, batch, ack):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            try:
+                await self.send_batch(self.names.get(signal), signal, batch)
+            except Exception as e:
+                if ack is None:
+                    logger.exception("Error while sending a batch of %r",
+                                     signal)
+                else:
+                    ack.set_exception(e)
+            else:
+                if ack is not None:
+                    ack.set_result(None)
+
+    async def flush(self):
+        """Flush all the buffers now and wait until all the batches have been
+        sent."""
+        if self._idle is not None:
+            self._idle.cancel()
+        self._flush_idle()
+        while self._sending:
+            await asyncio.wait(set(self._sending))
+
+    def publish_signal(self, signal, instance, loop, args, kwargs):
+        """Add a notification to the buffer of `signal`, flushing it if
+        needed."""
+        loop = self.loop or loop
+        batch = self._buffers.get(signal)
+        if batch is None:
+            batch = self._buffers[signal] = []
+            self._batch_loops[signal] = loop
+            if self.max_age is not None:
+                self._timers[signal] = loop.call_later(
+                    self.max_age, self._flush_signal, signal)
+        batch.append((instance, args, kwargs))
+        if self.acknowledge:
+            ack = self._acks.get(signal)
+            if ack is None:
+                ack = self._acks[signal] = loop.create_future()
+        else:
+            ack = NoResult
+        if len(batch) >= self.max_size:
+            self._flush_signal(signal)
+        elif self.flush_on_idle and self._idle is None:
+            self._idle = loop.call_soon(self._flush_idle)
+        return ack
+
+    @abstractmethod
+    async def send_batch(self, name, signal, batch):
+        """Send a batch of notifications of a signal. It's a coroutine.
+
+        :param str name: the name of the signal
+        :param signal: the `~.core.Signal`:class: instance
+        :param batch: a list of ``(instance, args, kwargs)`` tuples, one per
+          notification, in the order they were made
+        """
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- predicate filters of the notifications
+# :Created:   lun 19 ott 2026 01:02:48 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+from collections.abc import Mapping
+import operator
+
+from .utils import SignalError, find_argument
+from .weak import MethodAwareWeakList
+
+
+_MISSING = object()
+
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda value, container: value in container,
+    'not in': lambda value, container: value not in container,
+}
+"""The operators allowed in a `Predicate`:class:."""
+
+
+def _freeze(value):
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    elif isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+class Predicate:
+    """A test on an argument of the notifications, like ``amount > 1000``.
+    Two predicates with the same argument, operator and value are equal, so
+    that they're evaluated once by a `FilterStage`:class:.
+
+    :param arg: the name of the keyword argument or the index of the
+      positional one, see `~.utils.find_argument`:func:
+    :param str op: one of the `OPERATORS`
+    :param value: the value to compare the argument with. Sets and lists
+      are frozen
+    """
+
+    __slots__ = ('arg', 'op', 'value', 'test', '_hash')
+
+    def __init__(self, arg, op, value):
+        if not isinstance(arg, (str, int)):
+            raise SignalError("The argument of a predicate must be a name "
+                              "or a position")
+        test = OPERATORS.get(op)
+        if test is None:
+            raise SignalError("Unknown operator {!r}".format(op))
+        value = _freeze(value)
+        try:
+            self._hash = hash((arg, op, value))
+        except TypeError:
+            raise SignalError("The value of a predicate must be "
+                              "hashable") from None
+        self.arg = arg
+        self.op = op
+        self.value = value
+        self.test = test
+
+    def __eq__(self, other):
+        if not isinstance(other, Predicate):
+            return NotImplemented
+        return (self.arg, self.op, self.value) == (other.arg, other.op,
+                                                   other.value)
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return '<{} {!r} {} {!r}>'.format(self.__class__.__name__, self.arg,
+                                          self.op, self.value)
+
+    def __call__(self, args, kwargs, signature=None):
+        """Evaluate the predicate on the arguments of a notification. It's
+        false if the argument is missing or the comparison fails."""
+        value = find_argument(self.arg, args, kwargs, signature, _MISSING)
+        if value is _MISSING:
+            return False
+        try:
+            return bool(self.test(value, self.value))
+        except Exception:
+            return False
+
+
+def compile_where(where):
+    """Convert the value of the ``where`` option into a frozenset of
+    `Predicate`:class: instances. It can be a mapping of argument to value,
+    meaning equality, or to an ``(op, value)`` tuple, or a sequence of
+    ``(arg, op, value)`` tuples:
+
+    .. code:: python
+
+      {'status': ('in', {'paid', 'shipped'}), 'amount': ('>', 1000)}
+      [('amount', '>', 1000), ('amount', '<=', 5000)]
+    """
+    try:
+        if isinstance(where, Mapping):
+            items = []
+            for arg, cond in where.items():
+                if (isinstance(cond, tuple) and len(cond) == 2 and
+                    cond[0] in OPERATORS):
+                    items.append((arg,) + cond)
+                else:
+                    items.append((arg, '==', cond))
+        else:
+            items = where
+        predicates = frozenset(Predicate(*item) for item in items)
+    except TypeError:
+        raise SignalError("Invalid ``where`` specification "
+                          "{!r}".format(where)) from None
+    if not predicates:
+        raise SignalError("Empty ``where`` specification")
+    return predicates
+
+
+class FilterStage:
+    """Selects the handlers connected to a signal with a ``where`` option
+    whose predicates are all true for a notification. The handlers with the
+    same predicates are grouped together and each distinct predicate is
+    evaluated only once per notification, even if it's shared by many
+    groups. Created by `~.core.Signal.connect`:meth:.
+    """
+
+    def __init__(self):
+        self.groups = {}
+        """A mapping of the `~.weak.MethodAwareWeakList`:class: of the
+        handlers by their frozenset of predicates."""
+
+    def __len__(self):
+        return len(self.groups)
+
+    def remove(self, cback):
+        """Remove `cback` from all the groups."""
+        for predicates, subscribers in list(self.groups.items()):
+            subscribers.remove_all(cback)
+            if not len(subscribers):
+                del self.groups[predicates]
+
+    def select(self, args, kwargs, signature=None):
+        """Return the entries of the handlers matching a notification, as
+        stored by the `~.weak.MethodAwareWeakList`:class:, or ``None``."""
+        outcomes = {}
+        selected = None
+        for predicates, subscribers in self.groups.items():
+            for predicate in predicates:
+                outcome = outcomes.get(predicate)
+                if outcome is None:
+                    outcome = outcomes[predicate] = predicate(args, kwargs,
+                                                              signature)
+                if not outcome:
+                    break
+            else:
+                if selected is None:
+                    selected = subscribers.copy()
+                else:
+                    selected += subscribers.copy()
+        return selected
+
+    def subscribers(self, predicates):
+        """Return the `~.weak.MethodAwareWeakList`:class: where the handlers
+        with `predicates` are stored, creating it if needed."""
+        subscribers = self.groups.get(predicates)
+        if subscribers is None:
+            subscribers = self.groups[predicates] = MethodAwareWeakList()
+        return subscribers
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- signalling between processes over sockets
+# :Created:   dom 18 ott 2026 14:05:22 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+import asyncio
+from collections import deque
+import logging
+import struct
+
+from .external import BatchingExternalSignaller, RelayingSignallerAndHandler
+
+
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct('!I')
+"The header of a frame, containing the length of its payload."
+
+
+def pack_frame(payload):
+    """Prefix `payload` with its length."""
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader):
+    """Read a frame from the `asyncio.StreamReader` `reader`.
+
+    :returns: the payload or ``None`` if the stream ended
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+        size, = FRAME_HEADER.unpack(header)
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError:
+        return None
+
+
+class UnixSocketHub:
+    """A server listening on a Unix domain socket that relays every frame
+    received from a client to all the other connected clients. It's the
+    meeting point of the `UnixSocketSignaller`:class: instances of the
+    processes running on the same host, one of which (or a separate one)
+    has to run it.
+
+    The frames are relayed without waiting for the clients to receive
+    them, so that a slow client doesn't delay the others. A client that
+    falls behind, and has more than `max_buffer` bytes waiting to be sent,
+    is disconnected, so that the memory used by the hub is bounded. Its
+    signaller will connect again.
+
+    :param str path: the path of the socket
+    :keyword int max_buffer: the maximum number of bytes buffered for a
+      client
+    """
+
+    def __init__(self, path, *, max_buffer=1 << 22):
+        self.path = path
+        self.max_buffer = max_buffer
+        self.clients = set()
+        """The writers of the connected clients."""
+        self.disconnected = 0
+        """The number of clients disconnected because they fell behind."""
+        self._server = None
+
+    async def _serve_client(self, reader, writer):
+        self.clients.add(writer)
+        try:
+            while True:
+                payload = await read_frame(reader)
+                if payload is None:
+                    break
+                frame = pack_frame(payload)
+                for client in list(self.clients):
+                    if client is not writer:
+                        client.write(frame)
+                        if (client.transport.get_write_buffer_size() >
+                            self.max_buffer):
+                            self._drop(client)
+        except OSError:
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    def _drop(self, client):
+        logger.warning("Disconnecting a client of the hub that fell behind")
+        self.clients.discard(client)
+        self.disconnected += 1
+        # discard what's buffered too
+        client.transport.abort()
+
+    async def close(self):
+        """Stop serving and disconnect all the clients."""
+        if self._server is not None:
+            self._server.close()
+            for client in list(self.clients):
+                client.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def start(self):
+        """Start listening."""
+        self._server = await asyncio.start_unix_server(self._serve_client,
+                                                       self.path)
+
+
+class UnixSocketSignaller(BatchingExternalSignaller,
+                          RelayingSignallerAndHandler):
+    """An `~.external.RelayingSignallerAndHandler`:class: that delivers the
+    notifications of the registered signals to the processes connected to
+    the same `UnixSocketHub`:class:, where they are notified to the local
+    signal registered with the same name. The notifications are sent as
+    length-prefixed frames, batched as explained in
+    `~.external.BatchingExternalSignaller`:class:, without waiting for any
+    reply from the other end.
+
+    The connection is re-established automatically if it's lost; meanwhile
+    up to `max_pending` batches are kept to be sent once connected again.
+    Notifications received from the hub are executed in order, one at a
+    time, and aren't published again.
+
+    :param str path: the path of the hub's socket
+    :keyword float reconnect_delay: seconds to wait before reconnecting
+    :keyword int max_pending: the maximum number of batches kept while
+      disconnected, the older ones are discarded
+    :keyword codec: see `~.external.RelayingSignallerAndHandler`:class:
+    :param \\*\\*options: see `~.external.BatchingExternalSignaller`:class:
+    """
+
+    def __init__(self, path, *, reconnect_delay=0.1, max_pending=1000,
+                 codec=None, **options):
+        super().__init__(codec=codec, **options)
+        self.path = path
+        self.reconnect_delay = reconnect_delay
+        self.connected = None
+        """An `asyncio.Event` that is set while connected to the hub."""
+        self._pending = deque(maxlen=max_pending)
+        self._writer = None
+        self._task = None
+
+    async def _deliver(self, payload):
+        try:
+            name, key, args, kwargs = self.codec.decode(payload)
+            result = self.deliver(name, key, args, kwargs)
+            if result is not None:
+                await result
+        except Exception:
+            logger.exception("Error while delivering a notification")
+
+    async def _run(self):
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    self.path)
+            except OSError:
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+            self._writer = writer
+            while self._pending:
+                writer.write(self._pending.popleft())
+            self.connected.set()
+            try:
+                while True:
+                    payload = await read_frame(reader)
+                    if payload is None:
+                        break
+                    await self._deliver(payload)
+            except OSError:
+                pass
+            finally:
+                self.connected.clear()
+                self._writer = None
+                writer.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def close(self):
+        """Send what's buffered and disconnect from the hub."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def send_batch(self, name, signal, batch):
+        """Send the frames of a batch in a single write."""
+        frames = []
+        for instance, args, kwargs in batch:
+            key = None if instance is None else self.instance_key(instance)
+            payload, buffers = self.codec.encode(name, key, args, kwargs)
+            frames.append(pack_frame(payload))
+        data = b''.join(frames)
+        writer = self._writer
+        if writer is None:
+            self._pending.append(data)
+        else:
+            writer.write(data)
+            await writer.drain()
+
+    async def start(self, timeout=None):
+        """Connect to the hub and start receiving the notifications.
+
+        :param timeout: optional number of seconds to wait for the connection
+        """
+        if self._task is None:
+            self.connected = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+        await asyncio.wait_for(self.connected.wait(), timeout)
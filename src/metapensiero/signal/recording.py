@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- recording of the notifications
+# :Created:   dom 18 ott 2026 20:10:27 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+from collections import namedtuple
+import contextvars
+import glob
+import inspect
+import mmap
+import os
+import struct
+import time
+
+from .serialization import PickleCodec
+from .utils import Executor, MultipleResults, SignalError
+
+
+MAGIC = b'MPSIGREC'
+VERSION = 1
+HEADER = struct.Struct('<8sI4x')
+"""The header of a segment: magic and version."""
+RECORD = struct.Struct('<IddII')
+"""The header of a record: the size of the payload, the time of the
+notification, the seconds spent executing it, its nesting depth and the
+size of the timings of the handlers, that follow the payload. A size of
+zero marks the end of the segment."""
+HANDLER = struct.Struct('<ddBH')
+"""The header of the timing of a handler: the seconds from the start of
+the notification to the start and to the end of its execution, whether it
+returned an awaitable and the size of its name, that follows."""
+SEGMENT_SUFFIX = '.sigrec'
+
+_STATE = contextvars.ContextVar('recording', default=(0, 0.0, None))
+"""The nesting depth of the notifications, the start of the current one and
+the list where the timings of its handlers are collected, if any."""
+
+Record = namedtuple('Record',
+                    'timestamp duration depth name key args kwargs handlers')
+"""A recorded notification. `name` is the name of the signal, prefixed by
+``module:qualname.`` of the class of the instance, if any. `depth` is zero
+for the notifications made outside of any handler, one for those made by
+their handlers and so on. `handlers` is a tuple of `HandlerTiming`:class:,
+one for each handler executed."""
+
+HandlerTiming = namedtuple('HandlerTiming', 'name start end pending')
+"""The timing of a handler executed by a notification. `start` and `end`
+are the seconds from the start of the notification to the start and the
+end of its execution. When `pending` is ``True`` the handler returned an
+awaitable, whose completion isn't included."""
+
+
+def notification_name(executor):
+    """Return the name used to record a notification made by `executor`."""
+    name = getattr(executor.owner, 'name', None)
+    instance = executor.instance
+    if instance is None or name is None:
+        return name
+    cls = type(instance)
+    return '{}:{}.{}'.format(cls.__module__, cls.__qualname__, name)
+
+
+class Recorder:
+    """Records every notification into a sequence of memory-mapped segment
+    files in `directory`. Once installed, it's called by every
+    `~.utils.Executor`:class: in place of the execution, so that it
+    records the name of the signal, the key of the instance, the arguments,
+    the time of the notification, the seconds spent executing its
+    handlers (only the synchronous part) and whether it was made by the
+    handlers of another notification.
+
+    Each segment is preallocated to `segment_size` bytes and the records are
+    appended by copying them into the mapped memory, without any system call
+    or lock. The recorder must be used from a single thread, usually the one
+    running the loop. When a segment is full a new one is started, and the
+    oldest are removed to keep at most `max_segments` of them.
+
+    To keep the cost of a notification low, the notifications are buffered
+    and encoded `buffer_size` at a time, or when `flush`:meth: or
+    `close`:meth: are called, so the arguments must not be changed after
+    being notified. A `buffer_size` of ``1`` encodes them immediately.
+
+    The start and end of the execution of each handler are recorded too, as
+    `HandlerTiming`:class: tuples, so that the time spent can be attributed
+    to them. Only the handlers executed before the notification returns
+    are included: those executed later by the chunked or leveled
+    executions, or after an asynchronous one by a sequential result
+    policy, aren't.
+
+    A notification whose arguments cannot be encoded isn't recorded, and is
+    counted in `errors`.
+
+    :param str directory: where the segments are written
+    :keyword int segment_size: the size of each segment, in bytes
+    :keyword int max_segments: the maximum number of segments to keep or
+      ``None`` to keep them all
+    :keyword instance_key: an optional callable that returns a key for an
+      instance, to be recorded with its notifications
+    :keyword codec: the `~.serialization.Codec`:class: used to encode the
+      notifications, a `~.serialization.PickleCodec`:class: by default
+    :keyword int buffer_size: the number of notifications buffered before
+      encoding them
+    """
+
+    def __init__(self, directory, *, segment_size=1 << 24, max_segments=None,
+                 instance_key=None, codec=None, buffer_size=256):
+        if segment_size <= HEADER.size + RECORD.size:
+            raise SignalError("The segment size is too small")
+        if buffer_size < 1:
+            raise SignalError("The buffer size must be positive")
+        self.directory = directory
+        self.buffer_size = buffer_size
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.instance_key = instance_key
+        self.codec = codec or PickleCodec()
+        self.recorded = 0
+        """The number of notifications recorded."""
+        self.errors = 0
+        """The number of notifications that couldn't be recorded."""
+        self._buffer = []
+        self._file = None
+        self._map = None
+        self._pos = 0
+        self._segment = 0
+        os.makedirs(directory, exist_ok=True)
+        existing = segments(directory)
+        if existing:
+            self._segment = int(os.path.basename(existing[-1])[
+                :-len(SEGMENT_SUFFIX)])
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.uninstall()
+        self.close()
+
+    def append(self, timestamp, duration, depth, name, key, args, kwargs,
+               handlers=()):
+        """Encode and append a record. The `handlers` are
+        `HandlerTiming`:class: or equivalent tuples."""
+        try:
+            payload, buffers = self.codec.encode(name, key, args, kwargs)
+        except Exception:
+            self.errors += 1
+            return
+        timings = _encode_timings(handlers)
+        size = len(payload)
+        total = RECORD.size + size + len(timings)
+        end = self._pos + total
+        if self._map is None or end + RECORD.size > self.segment_size:
+            if HEADER.size + RECORD.size + total > self.segment_size:
+                self.errors += 1
+                return
+            self._rotate()
+            end = self._pos + total
+        mm = self._map
+        RECORD.pack_into(mm, self._pos, size, timestamp, duration, depth,
+                         len(timings))
+        start = self._pos + RECORD.size
+        mm[start:start + size] = payload
+        mm[start + size:end] = timings
+        self._pos = end
+        self.recorded += 1
+
+    def close(self):
+        """Write the buffered notifications and close the current
+        segment."""
+        self.flush()
+        self._close_segment()
+
+    def _close_segment(self):
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+    def flush(self):
+        """Encode and write the buffered notifications."""
+        buffer = self._buffer
+        self._buffer = []
+        for record in buffer:
+            self.append(*record)
+
+    def install(self):
+        """Start recording the notifications."""
+        Executor.add_recorder(self)
+
+    def record_call(self, name, call, args, kwargs):
+        """Execute a handler, timing it, see
+        `~.utils.Executor.add_recorder`:meth:."""
+        depth, origin, handlers = _STATE.get()
+        start = time.perf_counter()
+        pending = False
+        try:
+            result = call(*args, **kwargs)
+            pending = result is not None and inspect.isawaitable(result) and (
+                not (isinstance(result, MultipleResults) and result.done))
+        finally:
+            if handlers is not None:
+                handlers.append((name, start - origin,
+                                 time.perf_counter() - origin, pending))
+        if pending and not isinstance(result, MultipleResults):
+            # the notifications made by the asynchronous handlers are
+            # nested too
+            return _nested(result, depth)
+        return result
+
+    def record_run(self, executor, args, kwargs, run):
+        """Execute the handlers of `executor` calling `run` and record the
+        notification."""
+        timestamp = time.time()
+        start = time.perf_counter()
+        depth = _STATE.get()[0]
+        handlers = []
+        token = _STATE.set((depth + 1, start, handlers))
+        try:
+            return run()
+        finally:
+            duration = time.perf_counter() - start
+            _STATE.reset(token)
+            instance = executor.instance
+            if instance is None or self.instance_key is None:
+                key = None
+            else:
+                key = self.instance_key(instance)
+            buffer = self._buffer
+            # the handlers executed later by a task aren't included
+            buffer.append((timestamp, duration, depth,
+                           notification_name(executor), key, args, kwargs,
+                           tuple(handlers)))
+            if len(buffer) >= self.buffer_size:
+                self.flush()
+
+    def _rotate(self):
+        self._close_segment()
+        self._segment += 1
+        path = os.path.join(self.directory, '{:08d}{}'.format(
+            self._segment, SEGMENT_SUFFIX))
+        self._file = open(path, 'w+b')
+        self._file.truncate(self.segment_size)
+        self._map = mmap.mmap(self._file.fileno(), self.segment_size)
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION)
+        self._pos = HEADER.size
+        if self.max_segments is not None:
+            for old in segments(self.directory)[:-self.max_segments]:
+                os.remove(old)
+
+    def uninstall(self):
+        """Stop recording."""
+        Executor.remove_recorder(self)
+
+
+async def _nested(awaitable, depth):
+    token = _STATE.set((depth, 0.0, None))
+    try:
+        return await awaitable
+    finally:
+        _STATE.reset(token)
+
+
+def segments(directory):
+    """Return the paths of the segments in `directory`, oldest first."""
+    return sorted(glob.glob(os.path.join(directory, '*' + SEGMENT_SUFFIX)))
+
+
+def _encode_timings(handlers):
+    parts = []
+    for name, start, end, pending in handlers:
+        name = name.encode('utf-8')[:0xffff]
+        parts.append(HANDLER.pack(start, end, pending, len(name)))
+        parts.append(name)
+    return b''.join(parts)
+
+
+def _decode_timings(data):
+    handlers = []
+    pos = 0
+    while pos < len(data):
+        start, end, pending, size = HANDLER.unpack_from(data, pos)
+        pos += HANDLER.size
+        name = bytes(data[pos:pos + size]).decode('utf-8', 'replace')
+        pos += size
+        handlers.append(HandlerTiming(name, start, end, bool(pending)))
+    return tuple(handlers)
+
+
+def read_segment(path, codec=None):
+    """Iterate over the `Record`:class: instances of a segment."""
+    codec = codec or PickleCodec()
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version = HEADER.unpack_from(mm)
+            if magic != MAGIC or version != VERSION:
+                raise SignalError("{!r} isn't a recording "
+                                  "segment".format(path))
+            pos = HEADER.size
+            while pos + RECORD.size <= len(mm):
+                size, timestamp, duration, depth, timings = (
+                    RECORD.unpack_from(mm, pos))
+                if size == 0:
+                    break
+                pos += RECORD.size
+                name, key, args, kwargs = codec.decode(mm[pos:pos + size])
+                pos += size
+                handlers = _decode_timings(mm[pos:pos + timings])
+                pos += timings
+                yield Record(timestamp, duration, depth, name, key, args,
+                             kwargs, handlers)
+
+
+def read_recording(directory, codec=None):
+    """Iterate over all the `Record`:class: instances recorded in
+    `directory`, oldest first."""
+    for path in segments(directory):
+        yield from read_segment(path, codec)
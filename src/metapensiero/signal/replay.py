@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- replay of recorded notifications
+# :Created:   dom 18 ott 2026 21:07:36 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+"""Replay the notifications recorded by a `~.recording.Recorder`:class:
+against the signals defined in some modules, and report the throughput and
+the latency of each handler. It can be run as:
+
+.. code:: shell
+
+  python -m metapensiero.signal.replay --module myapp.models \\
+    --speed 10 /var/lib/myapp/recording
+
+The notifications made on an instance are replayed on an instance of the
+same class, created calling ``cls(key)``, or ``cls()`` if no key was
+recorded, or by the factory given with ``--factory module:callable``, that
+receives the class and the key. The notifications made on a signal that
+isn't a class member are replayed on the signal with the same name found
+in the modules. Only the notifications made outside of any handler are
+replayed, because the others are made again by the handlers themselves.
+
+With ``--recorded`` the latency of each handler is reported from the
+timings recorded with the notifications instead, without replaying them.
+"""
+
+import argparse
+import asyncio
+from collections import defaultdict, namedtuple
+import importlib
+import inspect
+import math
+import sys
+import time
+
+from .core import Signal
+from .recording import read_recording
+from .utils import Executor, MultipleResults
+
+
+Latency = namedtuple('Latency', 'count p50 p90 p99 max')
+"""The latency figures of a handler, in seconds."""
+
+
+def percentile(values, q):
+    """Return the `q` percentile of the sorted `values`, using the nearest
+    rank method."""
+    if not values:
+        return None
+    ix = max(0, min(len(values) - 1, math.ceil(q / 100 * len(values)) - 1))
+    return values[ix]
+
+
+def latency_report(latencies):
+    """Return a mapping of `Latency`:class: tuples by handler name, given a
+    mapping of the lists of the latencies by handler name."""
+    result = {}
+    for name, values in latencies.items():
+        if values:
+            values = sorted(values)
+            result[name] = Latency(len(values), percentile(values, 50),
+                                   percentile(values, 90),
+                                   percentile(values, 99), values[-1])
+    return result
+
+
+def recorded_latencies(records):
+    """Return a mapping of `Latency`:class: tuples by handler name, computed
+    from the `~.recording.HandlerTiming`:class: of the `records`. Only the
+    synchronous part of the execution of the handlers is recorded."""
+    latencies = defaultdict(list)
+    for record in records:
+        for timing in record.handlers:
+            latencies[timing.name].append(timing.end - timing.start)
+    return latency_report(latencies)
+
+
+def write_latencies(report, out=None):
+    """Write a table of a mapping of `Latency`:class: tuples to `out`, the
+    standard output by default."""
+    if out is None:
+        out = sys.stdout
+    out.write('{:<50} {:>8} {:>10} {:>10} {:>10} {:>10}\n'.format(
+        'handler', 'count', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms'))
+    for name, lat in sorted(report.items()):
+        out.write('{:<50} {:>8} {:>10.3f} {:>10.3f} {:>10.3f} '
+                  '{:>10.3f}\n'.format(name[-50:], lat.count,
+                                       lat.p50 * 1000, lat.p90 * 1000,
+                                       lat.p99 * 1000, lat.max * 1000))
+
+
+def _resolve_object(spec):
+    module, _, qualname = spec.partition(':')
+    obj = importlib.import_module(module)
+    for part in qualname.split('.') if qualname else ():
+        obj = getattr(obj, part)
+    return obj
+
+
+class HandlerTimer:
+    """Measures the latency of every handler executed while installed as
+    a recorder, see `~.utils.Executor.add_recorder`:meth:. The latency of an
+    asynchronous handler includes the time needed to complete its
+    result."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        """A mapping of the latencies by handler name."""
+
+    def __enter__(self):
+        Executor.add_recorder(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        Executor.remove_recorder(self)
+
+    def record_call(self, name, call, args, kwargs):
+        """Execute a handler, timing it."""
+        start = time.perf_counter()
+        result = call(*args, **kwargs)
+        if inspect.isawaitable(result) and not (
+                isinstance(result, MultipleResults) and result.done):
+            return self._complete(result, start, self.latencies[name])
+        self.latencies[name].append(time.perf_counter() - start)
+        return result
+
+    async def _complete(self, result, start, latencies):
+        try:
+            return await result
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    def record_run(self, executor, args, kwargs, run):
+        """Execute the handlers of `executor` calling `run`."""
+        return run()
+
+    def report(self):
+        """Return a mapping of `Latency`:class: tuples by handler name."""
+        return latency_report(self.latencies)
+
+
+class Replayer:
+    """Replays recorded notifications on the signals found in `modules`.
+
+    :param modules: the names of the modules to import
+    :keyword float speed: the positive speedup over the recorded timing or
+      ``None`` to replay the notifications as fast as possible
+    :keyword int concurrency: the maximum number of notifications whose
+      asynchronous handlers are run at the same time
+    :keyword factory: an optional callable that receives a class and a key
+      and returns the instance to notify
+    """
+
+    def __init__(self, modules, *, speed=1.0, concurrency=100, factory=None):
+        if speed is not None and not speed > 0:
+            raise ValueError("``speed`` must be positive")
+        self.modules = [importlib.import_module(m) for m in modules]
+        self.speed = speed
+        self.concurrency = concurrency
+        self.factory = factory or self._create
+        self.replayed = 0
+        """The number of notifications replayed."""
+        self.skipped = 0
+        """The number of notifications whose signal wasn't found."""
+        self.errors = 0
+        """The number of notifications whose handlers raised an error."""
+        self.elapsed = 0.0
+        """The seconds taken by the last replay."""
+        self.timer = HandlerTimer()
+        """The `HandlerTimer`:class: used to measure the handlers."""
+        self._instances = {}
+        self._signals = {}
+        for module in self.modules:
+            for value in vars(module).values():
+                if isinstance(value, Signal) and value.name:
+                    self._signals.setdefault(value.name, value)
+
+    @staticmethod
+    def _create(cls, key):
+        return cls() if key is None else cls(key)
+
+    def _target(self, name, key):
+        if name is None:
+            return None
+        if ':' not in name:
+            return self._signals.get(name)
+        clsname, _, signame = name.rpartition('.')
+        try:
+            cls = _resolve_object(clsname)
+        except (ImportError, AttributeError):
+            return None
+        instance = self._instances.get((cls, key))
+        if instance is None:
+            instance = self._instances[(cls, key)] = self.factory(cls, key)
+        return getattr(instance, signame, None)
+
+    async def replay(self, records):
+        """Replay the `~.recording.Record`:class: instances in `records`.
+        It's a coroutine."""
+        pending = set()
+        start = time.perf_counter()
+        origin = None
+        with self.timer:
+            for record in records:
+                if record.depth:
+                    continue
+                target = self._target(record.name, record.key)
+                if target is None:
+                    self.skipped += 1
+                    continue
+                if self.speed is not None:
+                    if origin is None:
+                        origin = record.timestamp
+                    delay = ((record.timestamp - origin) / self.speed -
+                             (time.perf_counter() - start))
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                self.replayed += 1
+                try:
+                    result = target.notify(*record.args, **record.kwargs)
+                    # a notify wrapper may return anything
+                    if (not inspect.isawaitable(result) or
+                        getattr(result, 'done', False)):
+                        continue
+                    task = asyncio.ensure_future(result)
+                except Exception:
+                    self.errors += 1
+                    continue
+                task.add_done_callback(self._completed)
+                pending.add(task)
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED)
+            if pending:
+                await asyncio.wait(pending)
+        self.elapsed = time.perf_counter() - start
+
+    def _completed(self, task):
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+
+    def report(self, out=sys.stdout):
+        """Write a report of the last replay to `out`."""
+        throughput = self.replayed / self.elapsed if self.elapsed else 0.0
+        out.write('replayed {} notifications in {:.3f}s ({:.1f}/s), '
+                  'skipped {}, errors {}\n'.format(
+                      self.replayed, self.elapsed, throughput, self.skipped,
+                      self.errors))
+        write_latencies(self.timer.report(), out)
+
+
+def _speed(value):
+    speed = float(value)
+    if not speed > 0:
+        raise argparse.ArgumentTypeError("the speed must be positive")
+    return speed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m metapensiero.signal.replay',
+        description="Replay recorded signal notifications.")
+    parser.add_argument('recording',
+                        help="the directory containing the recording")
+    parser.add_argument('-m', '--module', action='append', default=[],
+                        help="a module defining the signals or their "
+                        "classes, can be repeated")
+    parser.add_argument('-r', '--recorded', action='store_true',
+                        help="report the recorded latency of the handlers "
+                        "without replaying")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-s', '--speed', type=_speed, default=1.0,
+                       help="the speedup over the recorded timing")
+    group.add_argument('-f', '--fast', action='store_true',
+                       help="replay as fast as possible")
+    parser.add_argument('-c', '--concurrency', type=int, default=100,
+                        help="maximum number of notifications whose "
+                        "asynchronous handlers run at the same time")
+    parser.add_argument('--factory', help="a module:callable that receives "
+                        "the class and the key and returns an instance")
+    args = parser.parse_args(argv)
+    if args.recorded:
+        write_latencies(recorded_latencies(read_recording(args.recording)))
+        return
+    if not args.module:
+        parser.error("at least a --module is needed to replay")
+    factory = _resolve_object(args.factory) if args.factory else None
+    # the signals defined by the modules take the current loop
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        replayer = Replayer(args.module,
+                            speed=None if args.fast else args.speed,
+                            concurrency=args.concurrency, factory=factory)
+        loop.run_until_complete(
+            replayer.replay(read_recording(args.recording)))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+    replayer.report()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- keyed routing of the notifications
+# :Created:   lun 19 ott 2026 00:12:37 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+from .utils import SignalError, find_argument
+from .weak import MethodAwareWeakList
+
+
+_MISSING = object()
+
+
+class KeyRouter:
+    """An index of the handlers connected to a signal with a ``key``, by
+    the value of the argument named `key_arg`, so that a notification
+    executes only the handlers connected with the value it carries, without
+    calling all the others. Created by `~.core.Signal.connect`:meth:.
+
+    :param key_arg: the name of the keyword argument carrying the key or
+      the index of the positional one. When it's passed the other way
+      around, it's found using the signature of the validation callable of
+      the signal, see `~.utils.find_argument`:func:
+    """
+
+    def __init__(self, key_arg):
+        if not isinstance(key_arg, (str, int)):
+            raise SignalError("``key_arg`` must be a name or a position")
+        self.key_arg = key_arg
+        self.routes = {}
+        """A mapping of the `~.weak.MethodAwareWeakList`:class: of the
+        handlers by key."""
+
+    def __len__(self):
+        return len(self.routes)
+
+    def clear(self):
+        """Remove all the handlers."""
+        self.routes.clear()
+
+    def extract(self, args, kwargs, signature=None):
+        """Return the key carried by a notification or ``_MISSING``."""
+        return find_argument(self.key_arg, args, kwargs, signature, _MISSING)
+
+    def remove(self, cback, key=_MISSING):
+        """Remove `cback` from the handlers connected with `key` or, if it's
+        not given, from all of them."""
+        if key is _MISSING:
+            keys = list(self.routes)
+        else:
+            keys = [key]
+        for key in keys:
+            subscribers = self.routes.get(key)
+            if subscribers is not None:
+                subscribers.remove_all(cback)
+                if not len(subscribers):
+                    del self.routes[key]
+
+    def select(self, args, kwargs, signature=None):
+        """Return the entries of the handlers matching a notification, as
+        stored by the `~.weak.MethodAwareWeakList`:class:, or ``None``."""
+        key = self.extract(args, kwargs, signature)
+        if key is _MISSING:
+            return None
+        try:
+            subscribers = self.routes.get(key)
+        except TypeError:
+            # an unhashable value can't match any key
+            return None
+        if subscribers is not None and not len(subscribers):
+            # all the handlers have been garbage collected
+            del self.routes[key]
+            return None
+        return None if subscribers is None else subscribers.copy()
+
+    def subscribers(self, key):
+        """Return the `~.weak.MethodAwareWeakList`:class: where the handlers
+        for `key` are stored, creating it if needed."""
+        subscribers = self.routes.get(key)
+        if subscribers is None:
+            subscribers = self.routes[key] = MethodAwareWeakList()
+        return subscribers
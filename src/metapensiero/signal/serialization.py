@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- codecs for the external signallers
+# :Created:   dom 18 ott 2026 17:02:38 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+from abc import ABCMeta, abstractmethod
+import inspect
+import json
+from operator import itemgetter
+import pickle
+import struct
+
+from .utils import SignalError
+
+
+class Codec(metaclass=ABCMeta):
+    """The base of the codecs used by the external signallers to transform a
+    notification, made of the signal's name, the optional key of the
+    instance, the positional and keyword arguments, into bytes and back.
+
+    The codec remembers the last `reuse_size` notifications encoded: if the
+    very same arguments are encoded again, for example because the
+    notification goes to more than one transport using the same codec, the
+    same payload is returned without encoding it again. As the batching
+    signallers encode the notifications only when their batch is sent,
+    `reuse_size` should be at least as big as their batches. ``0`` disables
+    the reuse.
+    """
+
+    reuse_size = 1024
+    _encoded = None
+
+    @abstractmethod
+    def _encode(self, name, key, args, kwargs, out_of_band):
+        """Do the actual encoding, see `encode`:meth:."""
+
+    @abstractmethod
+    def decode(self, payload, buffers=()):
+        """Decode a notification.
+
+        :param payload: a bytes-like object
+        :param buffers: the out-of-band buffers, if any
+        :returns: a ``(name, key, args, kwargs)`` tuple
+        """
+
+    def encode(self, name, key, args, kwargs, out_of_band=False):
+        """Encode a notification.
+
+        :param str name: the name of the signal
+        :param key: the key of the instance or ``None``
+        :param tuple args: the positional arguments
+        :param dict kwargs: the keyword arguments
+        :param bool out_of_band: if ``True`` big binary arguments can be
+          returned as separate buffers, when supported by the codec, to
+          avoid copying them
+        :returns: a ``(payload, buffers)`` tuple, where `buffers` is a list
+          of bytes-like objects, empty unless `out_of_band` is ``True``
+        """
+        encoded = self._encoded
+        if encoded is None:
+            encoded = self._encoded = {}
+        # the entries keep the arguments alive, so their ids aren't reused
+        ids = (id(args), id(kwargs))
+        entry = encoded.get(ids)
+        if entry is not None and entry[0] == (name, key, out_of_band):
+            return entry[1]
+        result = self._encode(name, key, args, kwargs, out_of_band)
+        if self.reuse_size:
+            if entry is None:
+                while len(encoded) >= self.reuse_size:
+                    del encoded[next(iter(encoded))]
+            encoded[ids] = ((name, key, out_of_band), result, args, kwargs)
+        return result
+
+    def register_signal(self, signal, name):
+        """Called by the signallers when a signal is registered, for the
+        codecs that need to know about them."""
+
+
+class PickleCodec(Codec):
+    """A codec that uses `pickle`. With protocol 5 and above, the arguments
+    that are *bytes-like* objects bigger than `out_of_band_threshold` can be
+    returned as out-of-band buffers, that the decoding side receives as
+    `memoryview` objects over the passed buffers.
+
+    :keyword int protocol: the pickle protocol, the highest by default
+    :keyword int out_of_band_threshold: the minimum size of the arguments
+      that are encoded out-of-band
+    """
+
+    def __init__(self, *, protocol=pickle.HIGHEST_PROTOCOL,
+                 out_of_band_threshold=1024):
+        self.protocol = protocol
+        self.out_of_band_threshold = out_of_band_threshold
+
+    def _encode(self, name, key, args, kwargs, out_of_band):
+        if not out_of_band or self.protocol < 5:
+            return pickle.dumps((name, key, args, kwargs), self.protocol), []
+        buffers = []
+        args = tuple(self._out_of_band(a) for a in args)
+        kwargs = {k: self._out_of_band(v) for k, v in kwargs.items()}
+        payload = pickle.dumps((name, key, args, kwargs), self.protocol,
+                               buffer_callback=buffers.append)
+        return payload, [b.raw() for b in buffers]
+
+    def _out_of_band(self, value):
+        if (isinstance(value, (bytes, bytearray, memoryview)) and
+            memoryview(value).nbytes >= self.out_of_band_threshold):
+            return pickle.PickleBuffer(value)
+        return value
+
+    def decode(self, payload, buffers=()):
+        if buffers:
+            return pickle.loads(payload, buffers=buffers)
+        return pickle.loads(payload)
+
+
+class JSONCodec(Codec):
+    """A codec that uses `json`, for arguments made only of the types it
+    supports. The positional arguments are decoded as a tuple, but any
+    nested tuple becomes a list."""
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(separators=(',', ':'))
+
+    def _encode(self, name, key, args, kwargs, out_of_band):
+        return self._encoder.encode((name, key, args, kwargs)).encode(), []
+
+    def decode(self, payload, buffers=()):
+        name, key, args, kwargs = json.loads(bytes(payload).decode())
+        return name, key, tuple(args), kwargs
+
+
+_FIXED = {
+    bool: '?',
+    float: 'd',
+    int: 'q',
+}
+_VARIABLE = (bytes, str)
+_NAME = struct.Struct('<H')
+_KEY_NONE, _KEY_INT, _KEY_STR = range(3)
+
+
+def _getter(indexes):
+    """Return a function that picks the items at `indexes` of a sequence,
+    as a tuple."""
+    if len(indexes) == 1:
+        index, = indexes
+        return lambda values: (values[index],)
+    if indexes:
+        return itemgetter(*indexes)
+    return lambda values: ()
+
+
+class _Schema:
+    """The layout of the arguments of a signal, derived from the annotations
+    of its validation function.
+
+    A notification is packed as the name of the signal, followed by a
+    header containing the kind of the key, the integer key or the length
+    of the string key, the fixed size arguments and the lengths of the
+    variable size ones, and then by the string key and the variable size
+    arguments. The header is packed with one of three `struct.Struct`, one
+    per kind of key, compiled when the schema is created.
+    """
+
+    def __init__(self, name, fvalidation):
+        params = list(inspect.signature(fvalidation).parameters.values())
+        if params and params[0].name == 'self':
+            params = params[1:]
+        fixed = []
+        fixed_indexes = []
+        self.variable = []
+        """A list of ``(index, is_str)`` tuples, one per variable size
+        argument."""
+        keyword = []
+        for ix, p in enumerate(params):
+            if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+                raise SignalError("Variable arguments aren't supported")
+            if p.annotation in _FIXED:
+                fixed.append(_FIXED[p.annotation])
+                fixed_indexes.append(ix)
+            elif p.annotation in _VARIABLE:
+                self.variable.append((ix, p.annotation is str))
+            else:
+                raise SignalError("Unsupported annotation for argument "
+                                  "{!r}".format(p.name))
+            if p.kind is p.KEYWORD_ONLY:
+                keyword.append(p.name)
+        self.name = name
+        bname = name.encode()
+        self.prefix = b'\x01' + _NAME.pack(len(bname)) + bname
+        layout = ''.join(fixed) + 'I' * len(self.variable)
+        self.headers = (struct.Struct('<B' + layout),
+                        struct.Struct('<Bq' + layout),
+                        struct.Struct('<BI' + layout))
+        self.fixed = _getter(fixed_indexes)
+        self.fixed_count = len(fixed)
+        # the fields are unpacked in the order of the layout, rearrange them
+        # in the order of the parameters
+        layout_order = fixed_indexes + [ix for ix, _ in self.variable]
+        self.reorder = _getter([layout_order.index(ix)
+                                for ix in range(len(params))])
+        self.keyword = tuple(keyword)
+        self.positional_count = len(params) - len(keyword)
+        self.order = [p.name for p in params]
+        self.signature = inspect.Signature(params)
+
+    def pack(self, key, args, kwargs):
+        if kwargs or len(args) != len(self.order):
+            bound = self.signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            values = bound.arguments
+            args = [values[n] for n in self.order]
+        data = [args[ix].encode() if is_str else args[ix]
+                for ix, is_str in self.variable]
+        sizes = [len(d) for d in data]
+        if key is None:
+            header = self.headers[_KEY_NONE].pack(
+                _KEY_NONE, *self.fixed(args), *sizes)
+        elif isinstance(key, int):
+            header = self.headers[_KEY_INT].pack(
+                _KEY_INT, key, *self.fixed(args), *sizes)
+        else:
+            bkey = key.encode()
+            header = self.headers[_KEY_STR].pack(
+                _KEY_STR, len(bkey), *self.fixed(args), *sizes)
+            data.insert(0, bkey)
+        return b''.join([self.prefix, header] + data)
+
+    def unpack(self, payload, offset):
+        tag = payload[offset]
+        header = self.headers[tag]
+        values = header.unpack_from(payload, offset)
+        offset += header.size
+        if tag == _KEY_NONE:
+            key = None
+            start = 1
+        elif tag == _KEY_INT:
+            key = values[1]
+            start = 2
+        else:
+            end = offset + values[1]
+            key = str(payload[offset:end], 'utf-8')
+            offset = end
+            start = 2
+        start_variable = start + self.fixed_count
+        fields = list(values[start:start_variable])
+        for (_, is_str), size in zip(self.variable, values[start_variable:]):
+            end = offset + size
+            fields.append(str(payload[offset:end], 'utf-8') if is_str
+                          else bytes(payload[offset:end]))
+            offset = end
+        args = self.reorder(fields)
+        if not self.keyword:
+            return key, args, {}
+        count = self.positional_count
+        return key, args[:count], dict(zip(self.keyword, args[count:]))
+
+
+class StructCodec(Codec):
+    """A compact binary codec for the signals whose validation function
+    declares the type of every argument, using only `int`, `float`, `bool`,
+    `str` and `bytes` annotations, like:
+
+    .. code:: python
+
+      @signal
+      def price_changed(symbol: str, price: float, volume: int):
+          ...
+
+    The numeric arguments and the lengths of the others are packed with a
+    single `struct.Struct` compiled for each signal. The instance keys can
+    only be ``None``, integers or strings. The notifications of the signals
+    without a usable schema are encoded with the `fallback` codec.
+
+    The payloads are smaller than pickle's ones and, unlike them, can be
+    decoded without trusting the sender, but decoding them is slower, see
+    ``bench/bench_codecs.py``.
+
+    :param fallback: the codec to use for the other signals, a
+      `PickleCodec`:class: by default
+    """
+
+    def __init__(self, fallback=None):
+        self.fallback = fallback or PickleCodec()
+        self.schemas = {}
+        """A mapping of the argument schemas by signal name."""
+        self._decoders = {}
+
+    def _encode(self, name, key, args, kwargs, out_of_band):
+        schema = self.schemas.get(name)
+        if schema is None:
+            payload, buffers = self.fallback.encode(name, key, args, kwargs,
+                                                    out_of_band)
+            return b'\x00' + payload, buffers
+        return schema.pack(key, args, kwargs), []
+
+    def decode(self, payload, buffers=()):
+        if payload[0] == 0:
+            return self.fallback.decode(memoryview(payload)[1:], buffers)
+        end = 3 + (payload[1] | payload[2] << 8)
+        schema = self._decoders.get(bytes(payload[3:end]))
+        if schema is None:
+            raise SignalError("Unknown signal {!r}".format(
+                bytes(payload[3:end]).decode()))
+        key, args, kwargs = schema.unpack(payload, end)
+        return schema.name, key, args, kwargs
+
+    def register_signal(self, signal, name):
+        """Derive the schema of the signal from its validation function, if
+        possible."""
+        fvalidation = getattr(signal, '_fvalidation', None)
+        if fvalidation is None:
+            return
+        try:
+            schema = _Schema(name, fvalidation)
+        except SignalError:
+            schema = self.schemas.pop(name, None)
+            if schema is not None:
+                del self._decoders[schema.prefix[3:]]
+        else:
+            self.schemas[name] = schema
+            self._decoders[schema.prefix[3:]] = schema
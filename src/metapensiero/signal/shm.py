@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- signalling between processes over shared
+#             memory
+# :Created:   dom 18 ott 2026 15:40:51 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+import asyncio
+import contextvars
+import logging
+import struct
+import sys
+
+from multiprocessing import resource_tracker, shared_memory
+
+from .external import RelayingSignallerAndHandler
+from .utils import NoResult, SignalError
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'MPSIGRB1'
+HEADER = struct.Struct('<8sQQQ')
+"""The header of the shared block: magic, capacity, head and reserve."""
+HEADER_SIZE = 64
+HEAD = struct.Struct('<Q')
+HEAD_OFFSET = 16
+RESERVE_OFFSET = 24
+RECORD = struct.Struct('<II')
+"""The header of a record: its total size and the number of out-of-band
+buffers."""
+LENGTH = struct.Struct('<Q')
+WRAP = 0
+"""The size written in place of a record to signal that the next one is at
+the start of the ring."""
+ALIGN = 8
+
+_CREATED = set()
+"""The names of the blocks created by this process."""
+
+_DELIVERY = contextvars.ContextVar('delivery', default=None)
+"""The reader and the position of the record being delivered."""
+
+
+def _align(size):
+    return (size + ALIGN - 1) & ~(ALIGN - 1)
+
+
+def _attach(name):
+    """Attach to an existing block without letting the resource tracker
+    of this process destroy it at exit, as only its creator has to."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    shm = shared_memory.SharedMemory(name)
+    if shared_memory._USE_POSIX and shm._name not in _CREATED:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+def views_valid():
+    """Tell if the record whose notification is being delivered to the
+    calling handler by a `SharedMemorySignaller`:class: hasn't been
+    overwritten by the producer yet, so that the content of the
+    `memoryview` arguments it received is still the original one. It's
+    always ``True`` outside of such a delivery."""
+    delivery = _DELIVERY.get()
+    return delivery is None or delivery[0].valid(delivery[1])
+
+
+def _release(views):
+    """Release the `views`, ignoring those still exported."""
+    for view in views:
+        try:
+            view.release()
+        except BufferError:
+            pass
+
+
+class RingBuffer:
+    """A ring buffer over a `multiprocessing.shared_memory.SharedMemory`
+    block, with a single producer and any number of consumers, each one
+    using its own `RingReader`:class:. The producer never waits for the
+    consumers: a consumer that falls behind more than the capacity of the
+    ring loses the overwritten records.
+
+    Each record is made of a main payload and any number of additional
+    buffers, that the consumers can access without copying them.
+
+    :param str name: the name of the shared block, a random one is chosen if
+      it's ``None`` and `create` is ``True``
+    :param int capacity: the size of the ring in bytes, needed only when
+      creating it
+    :param bool create: ``True`` for the producer, that creates the block
+    """
+
+    def __init__(self, name=None, capacity=None, create=False):
+        if create:
+            capacity = _align(capacity)
+            self.shm = shared_memory.SharedMemory(
+                name, create=True, size=HEADER_SIZE + capacity)
+            HEADER.pack_into(self.shm.buf, 0, MAGIC, capacity, 0, 0)
+            _CREATED.add(self.shm._name)
+        else:
+            self.shm = _attach(name)
+            magic, capacity, head, reserve = HEADER.unpack_from(self.shm.buf)
+            if magic != MAGIC:
+                self.shm.close()
+                raise SignalError("The shared block {!r} isn't a ring "
+                                  "buffer".format(name))
+        self.capacity = capacity
+        self.create = create
+        self.name = self.shm.name
+        self.data = self.shm.buf[HEADER_SIZE:HEADER_SIZE + capacity]
+
+    @property
+    def head(self):
+        """The position where the next record will be written. It only
+        grows, the offset in the ring is its modulo of the capacity."""
+        return HEAD.unpack_from(self.shm.buf, HEAD_OFFSET)[0]
+
+    @property
+    def reserve(self):
+        """The end of the record being written."""
+        return HEAD.unpack_from(self.shm.buf, RESERVE_OFFSET)[0]
+
+    def close(self):
+        """Detach from the shared block, destroying it if this is the
+        producer. The views returned by the readers must have been released
+        already."""
+        self.data.release()
+        self.shm.close()
+        if self.create:
+            _CREATED.discard(self.shm._name)
+            self.shm.unlink()
+
+    def write(self, payload, buffers=()):
+        """Append a record.
+
+        :param payload: a bytes-like object
+        :param buffers: a sequence of contiguous bytes-like objects
+        """
+        capacity = self.capacity
+        chunks = [memoryview(payload).cast('B')]
+        chunks.extend(memoryview(b).cast('B') for b in buffers)
+        size = (RECORD.size + LENGTH.size * len(chunks) +
+                sum(_align(c.nbytes) for c in chunks))
+        if size > capacity:
+            raise SignalError("A record of {} bytes doesn't fit in the "
+                              "ring".format(size))
+        buf = self.shm.buf
+        data = self.data
+        head = self.head
+        pos = head % capacity
+        wrap = capacity - pos < size
+        HEAD.pack_into(buf, RESERVE_OFFSET,
+                       head + size + (capacity - pos if wrap else 0))
+        if wrap:
+            RECORD.pack_into(data, pos, WRAP, 0)
+            head += capacity - pos
+            pos = 0
+        RECORD.pack_into(data, pos, size, len(chunks) - 1)
+        offset = pos + RECORD.size
+        for chunk in chunks:
+            LENGTH.pack_into(data, offset, chunk.nbytes)
+            offset += LENGTH.size
+        for chunk in chunks:
+            data[offset:offset + chunk.nbytes] = chunk
+            offset += _align(chunk.nbytes)
+        HEAD.pack_into(buf, HEAD_OFFSET, head + size)
+
+
+class RingReader:
+    """A consumer of a `RingBuffer`:class:, starting from the records
+    written after its creation.
+
+    :param ring: the `RingBuffer`:class: to read
+    """
+
+    def __init__(self, ring):
+        self.ring = ring
+        self.tail = ring.head
+        """The position of the next record to read."""
+        self.lost = 0
+        """The number of times this reader was overrun by the producer."""
+
+    def read(self):
+        """Return the records written since the last call, as a list of
+        ``(position, views)`` tuples where `views` contains a
+        read-only `memoryview` for the payload and one for each additional
+        buffer. The views point directly into the shared block, so their
+        content stays valid until `valid`:meth: returns ``False`` for the
+        position of the record.
+        """
+        ring = self.ring
+        capacity = ring.capacity
+        data = ring.data
+        head = ring.head
+        if head - self.tail > capacity:
+            self.lost += 1
+            self.tail = head
+        records = []
+        while self.tail < head:
+            tail = self.tail
+            pos = tail % capacity
+            size, nbuffers = RECORD.unpack_from(data, pos)
+            if size == WRAP:
+                self.tail += capacity - pos
+                continue
+            offset = pos + RECORD.size
+            try:
+                lengths = struct.unpack_from('<{}Q'.format(nbuffers + 1),
+                                             data, offset)
+            except struct.error:
+                lengths = ()
+            if not lengths or not self.valid(tail):
+                # overrun while reading the header, restart from the head
+                self.lost += 1
+                self.tail = ring.head
+                break
+            offset += LENGTH.size * len(lengths)
+            views = []
+            for length in lengths:
+                views.append(data[offset:offset + length].toreadonly())
+                offset += _align(length)
+            self.tail += size
+            records.append((tail, views))
+        return records
+
+    def valid(self, position):
+        """Tell if the record at `position` hasn't been overwritten."""
+        return self.ring.reserve - position <= self.ring.capacity
+
+
+class SharedMemorySignaller(RelayingSignallerAndHandler):
+    """An `~.external.RelayingSignallerAndHandler`:class: that delivers the
+    notifications of the registered signals to the processes on the same
+    host using a `RingBuffer`:class: in shared memory.
+
+    There can be a single producer, the one creating the ring, that writes
+    every notification synchronously during the ``notify()`` call. The
+    other processes attach to the same ring by name and, once started,
+    deliver to the local signals the notifications written by the producer,
+    polling the ring every `poll_interval` seconds.
+
+    The notifications are encoded asking the codec for out-of-band buffers,
+    that are written once in the ring: with the default
+    `~.serialization.PickleCodec`:class: the arguments that are big
+    *bytes-like* objects are received by the handlers of the consumers as
+    read-only `memoryview` objects pointing directly into the shared block.
+
+    The producer never waits for the consumers, so it may overwrite the
+    record while a handler is still reading it, above all when the handler
+    suspends: the content of the views is checked only before the delivery
+    starts. A handler has to copy what it needs, and then make sure that
+    the copy is consistent calling `views_valid`:func:, discarding it
+    otherwise:
+
+    .. code:: python
+
+      def on_frame(frame):
+          data = bytes(frame)
+          if not shm.views_valid():
+              return  # overwritten meanwhile
+          ...
+
+    The views are released once the delivery is complete, so they cannot
+    be kept.
+
+    :param str name: the name of the ring, a random one is chosen when
+      creating it without one
+    :keyword bool create: ``True`` for the producer
+    :keyword int capacity: the size of the ring in bytes
+    :keyword float poll_interval: seconds to wait when there is nothing to
+      read
+    :keyword codec: see `~.external.RelayingSignallerAndHandler`:class:
+    """
+
+    def __init__(self, name=None, *, create=False, capacity=1 << 22,
+                 poll_interval=0.0005, codec=None):
+        super().__init__(codec=codec)
+        self.ring = RingBuffer(name, capacity, create)
+        self.producer = create
+        self.poll_interval = poll_interval
+        self.reader = None
+        """The `RingReader`:class: used once started."""
+        self._task = None
+
+    async def _run(self):
+        reader = self.reader
+        while True:
+            records = reader.read()
+            for position, views in records:
+                try:
+                    notification = self.codec.decode(views[0], views[1:])
+                except Exception:
+                    notification = None
+                token = _DELIVERY.set((reader, position))
+                try:
+                    # the producer may have overwritten the record meanwhile
+                    if not reader.valid(position):
+                        reader.lost += 1
+                        continue
+                    if notification is None:
+                        raise SignalError("Cannot decode a notification")
+                    result = self.deliver(*notification)
+                    if result is not None:
+                        await result
+                except Exception:
+                    logger.exception("Error while delivering a notification")
+                finally:
+                    _DELIVERY.reset(token)
+                    # the views cannot be used after the delivery, releasing
+                    # them lets the ring be closed
+                    del notification
+                    _release(views)
+            if not records:
+                await asyncio.sleep(self.poll_interval)
+
+    async def close(self):
+        """Stop delivering and detach from the ring."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.ring.close()
+
+    def publish_signal(self, signal, instance, loop, args, kwargs):
+        """Write the notification in the ring, if this is the producer."""
+        if self.producer:
+            key = None if instance is None else self.instance_key(instance)
+            payload, buffers = self.codec.encode(
+                self.names.get(signal), key, args, kwargs, out_of_band=True)
+            self.ring.write(payload, buffers)
+        return NoResult
+
+    async def start(self):
+        """Start delivering the notifications written from now on."""
+        if self._task is None:
+            self.reader = RingReader(self.ring)
+            self._task = asyncio.ensure_future(self._run())
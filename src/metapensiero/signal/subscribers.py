@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- special kinds of subscribers
+# :Created:   dom 18 ott 2026 11:20:47 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+import asyncio
+from collections import namedtuple
+from enum import Enum
+
+from .utils import NoResult
+from .weak import Subscription
+
+
+Notification = namedtuple('Notification', 'args kwargs')
+"""The item enqueued by a `QueueSubscriber`:class: for every notification,
+containing the positional and keyword arguments passed to ``notify()``."""
+
+
+class QueuePolicy(Enum):
+    """What a `QueueSubscriber`:class: does when a notification arrives and
+    its queue is full.
+    """
+
+    BLOCK = 1
+    """Return an awaitable that puts the notification in the queue as soon as
+    there is room. A notifier that awaits on the results will wait for the
+    consumer (backpressure)."""
+    DROP_OLDEST = 2
+    """Discard the oldest queued notification to make room for the new
+    one."""
+    DROP_NEWEST = 3
+    """Discard the incoming notification."""
+    COALESCE = 4
+    """Replace the most recently queued notification with the incoming one,
+    so that a slow consumer always gets the latest state."""
+
+
+_CLOSED = object()
+"Marker put in the queue to wake up the consumers of a closed stream."
+
+
+class _Queue(asyncio.Queue):
+
+    def replace_last(self, item):
+        self._queue[-1] = item
+
+
+class NextNotification(Subscription):
+    """A one-shot subscription that resolves a future with the
+    `Notification`:class: of the next notification. Usually created by
+    `~.core.Signal.next`:meth:. The future is referenced weakly, so the
+    subscription goes away if nobody is waiting for it anymore.
+
+    :param future: the `asyncio.Future` to resolve
+    """
+
+    remaining = 1
+
+    def call(self, target, args, kwargs):
+        if not target.done():
+            target.set_result(Notification(args, kwargs))
+        return NoResult
+
+
+class QueueSubscriber:
+    """A subscriber that collects the notifications into a bounded
+    `asyncio.Queue` to be consumed at its own pace by another task. Usually
+    created by `~.core.Signal.subscribe_queue`:meth:.
+
+    Like every other subscriber it's referenced weakly by the signal, so it
+    stays connected as long as a reference to it is kept.
+
+    :param int maxsize: the size of the queue
+    :param policy: what to do when the queue is full
+    :type policy: `QueuePolicy`:class:
+    """
+
+    source = None
+    """The signal (or its per-instance proxy) this is connected to."""
+
+    def __init__(self, maxsize, policy=QueuePolicy.BLOCK):
+        if not isinstance(policy, QueuePolicy):
+            raise ValueError("``policy`` must be an instance of "
+                             "`QueuePolicy`")
+        self.queue = _Queue(maxsize)
+        self.policy = policy
+        self.enqueued = 0
+        """The number of notifications put in the queue."""
+        self.dropped = 0
+        """The number of notifications discarded because the queue was
+        full."""
+        self.coalesced = 0
+        """The number of notifications that replaced a queued one."""
+        self.high_watermark = 0
+        """The maximum depth reached by the queue."""
+
+    def __call__(self, *args, **kwargs):
+        item = Notification(args, kwargs)
+        queue = self.queue
+        if queue.full():
+            policy = self.policy
+            if policy is QueuePolicy.BLOCK:
+                return self._put(item)
+            elif policy is QueuePolicy.DROP_NEWEST:
+                self.dropped += 1
+                return NoResult
+            elif policy is QueuePolicy.COALESCE:
+                queue.replace_last(item)
+                self.coalesced += 1
+                return NoResult
+            else:
+                queue.get_nowait()
+                queue.task_done()
+                self.dropped += 1
+        self._put_nowait(item)
+        return NoResult
+
+    def _put_nowait(self, item):
+        self.queue.put_nowait(item)
+        self._account()
+
+    async def _put(self, item):
+        await self.queue.put(item)
+        self._account()
+
+    def _account(self):
+        self.enqueued += 1
+        depth = self.queue.qsize()
+        if depth > self.high_watermark:
+            self.high_watermark = depth
+
+    @property
+    def depth(self):
+        """The number of notifications waiting in the queue."""
+        return self.queue.qsize()
+
+    @property
+    def metrics(self):
+        """A dictionary with the current figures about the queue."""
+        return {
+            'depth': self.queue.qsize(),
+            'maxsize': self.queue.maxsize,
+            'high_watermark': self.high_watermark,
+            'enqueued': self.enqueued,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+        }
+
+    def attach(self, source):
+        """Connect to `source`, either a signal or its per-instance proxy.
+
+        :returns: this subscriber
+        """
+        self.source = source
+        source.connect(self)
+        return self
+
+    def close(self):
+        """Disconnect from the signal. Notifications already in the queue
+        can still be consumed."""
+        if self.source is not None:
+            self.source.disconnect(self)
+            self.source = None
+
+    def get(self):
+        """Remove and return a `Notification`:class: from the queue, waiting
+        for one if it's empty. It's a coroutine."""
+        return self.queue.get()
+
+    def get_nowait(self):
+        """Remove and return a `Notification`:class: from the queue, raising
+        `asyncio.QueueEmpty` if it's empty."""
+        return self.queue.get_nowait()
+
+    def task_done(self):
+        """See `asyncio.Queue.task_done`."""
+        self.queue.task_done()
+
+
+class SignalStream(QueueSubscriber):
+    """A `QueueSubscriber`:class: that is also an *asynchronous iterator*
+    over the `Notification`:class: instances it receives. Usually created
+    by `~.core.Signal.stream`:meth:, it can be used like:
+
+    .. code:: python
+
+      async for args, kwargs in asignal.stream():
+          ...
+
+    The iteration ends when the stream is closed, after the notifications
+    already received have been consumed. As every subscriber, the stream is
+    referenced weakly by the signal, so it's disconnected also when it's
+    garbage collected.
+    """
+
+    closed = False
+    """``True`` if the stream has been closed."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        queue = self.queue
+        if self.closed and queue.empty():
+            raise StopAsyncIteration
+        item = await queue.get()
+        queue.task_done()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self):
+        """Close the stream, as the ``aclose()`` method of the asynchronous
+        generators."""
+        self.close()
+
+    def close(self):
+        """Disconnect from the signal and end the iteration once the queue
+        is empty."""
+        if not self.closed:
+            self.closed = True
+            super().close()
+            if self.queue.empty():
+                self.queue.put_nowait(_CLOSED)
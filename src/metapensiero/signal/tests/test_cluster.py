@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- partitioned signaller tests
+# :Created: dom 18 ott 2026 18:41:09 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from metapensiero.signal import handler, Signal, SignalAndHandlerInitMeta
+from metapensiero.signal.cluster import HashRing, PartitionedSignaller
+
+
+# All test coroutines will be treated as marked
+pytestmark = pytest.mark.asyncio()
+
+
+class KeyedSignaller(PartitionedSignaller):
+
+    def __init__(self, address, instances, **options):
+        super().__init__(address, **options)
+        self.instances = instances
+
+    def instance_key(self, instance):
+        return instance.key
+
+    def resolve_instance(self, signal, key):
+        return self.instances.get(key)
+
+
+def test_hash_ring():
+
+    nodes = [('127.0.0.1', port) for port in range(9000, 9004)]
+    ring = HashRing(nodes)
+    owners = {key: ring.get(key) for key in range(1000)}
+    # keys are spread among all the nodes
+    counts = Counter(owners.values())
+    assert set(counts) == set(nodes)
+    assert min(counts.values()) > 150
+    # the assignment doesn't depend on the order of the nodes
+    other = HashRing(reversed(nodes))
+    assert {key: other.get(key) for key in range(1000)} == owners
+    # removing a node moves only its keys
+    ring.remove(nodes[0])
+    assert nodes[0] not in ring
+    for key, owner in owners.items():
+        if owner != nodes[0]:
+            assert ring.get(key) == owner
+
+
+async def test_partitioned_signaller():
+
+    received = {}
+    signallers = []
+    instances = {}
+    nodes = 3
+    for node in range(nodes):
+        instances[node] = {}
+        received[node] = []
+        signaller = KeyedSignaller(('127.0.0.1', 0), instances[node],
+                                   pool_size=2)
+        meta = SignalAndHandlerInitMeta.with_external(signaller)
+
+        class Item(metaclass=meta):
+
+            changed = Signal()
+
+            def __init__(self, key, node=node):
+                self.key = key
+                self.node = node
+
+            @handler('changed')
+            def on_changed(self, value):
+                received[self.node].append((self.key, value))
+
+        await signaller.start()
+        signallers.append(signaller)
+        for key in range(30):
+            instances[node][key] = Item(key)
+
+    for signaller in signallers:
+        for other in signallers:
+            signaller.add_peer(other.address)
+    assert all(len(s.ring) == nodes for s in signallers)
+
+    # every node notifies every instance
+    for node in range(nodes):
+        for key in range(30):
+            instances[node][key].changed.notify(node)
+    for signaller in signallers:
+        await signaller.flush()
+    await asyncio.sleep(0.05)
+
+    for node, signaller in enumerate(signallers):
+        owned = [key for key in range(30)
+                 if signaller.ring.get(key) == signaller.address]
+        assert owned
+        # only the notifications of the instances owned by the node are
+        # executed, the local ones without delay
+        assert sorted(received[node]) == sorted(
+            (key, value) for key in owned for value in range(nodes))
+        for key in owned:
+            values = [v for k, v in received[node] if k == key]
+            assert values[0] == node
+
+    for signaller in signallers:
+        await signaller.close()
+
+
+async def test_send_batch_peer_removed():
+
+    local_address = ('127.0.0.1', 1)
+    peer = ('127.0.0.1', 2)
+    signaller = KeyedSignaller(local_address, {}, peers=[peer])
+    keys = {signaller.ring.get(key): key for key in range(100)}
+    delivered = []
+
+    def deliver(name, key, args, kwargs):
+        delivered.append(key)
+        # the peer leaves while the batch is being sent
+        signaller.remove_peer(peer)
+        return asyncio.sleep(0)
+
+    class Item:
+
+        def __init__(self, key):
+            self.key = key
+
+    signaller.deliver = deliver
+    await signaller.send_batch('changed', None, [
+        (Item(keys[peer]), (), {}), (Item(keys[local_address]), (), {})])
+    # the notification of the removed peer is now owned locally
+    assert delivered == [keys[local_address], keys[peer]]
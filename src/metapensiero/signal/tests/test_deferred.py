@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- deferred notifications tests
+# :Created: dom 18 ott 2026 23:45:19 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+
+import pytest
+
+from metapensiero.signal import (MergePolicy, Notification, Signal,
+                                 SignalAndHandlerInitMeta, handler)
+
+
+# All test coroutines will be treated as marked
+pytestmark = pytest.mark.asyncio()
+
+
+class Item(metaclass=SignalAndHandlerInitMeta):
+
+    changed = Signal()
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    @handler('changed')
+    def on_changed(self, field):
+        self.log.append((self.name, field))
+
+
+async def test_deferred_coalesce():
+
+    log = []
+    saved = Signal()
+
+    def on_saved():
+        log.append('saved')
+
+    saved.connect(on_saved)
+    a = Item('a', log)
+    b = Item('b', log)
+
+    with Signal.deferred() as deferral:
+        a.changed.notify('price')
+        b.changed.notify('price')
+        res = a.changed.notify('stock')
+        assert res.done and res.results == ()
+        saved.notify()
+        assert log == []
+    # one notification per instance, in causal order, with the last values
+    assert log == [('b', 'price'), ('a', 'stock'), 'saved']
+    assert deferral.captured == 4
+    assert len(deferral.results) == 3
+
+    del log[:]
+    with Signal.deferred(MergePolicy.FIRST):
+        a.changed.notify('price')
+        b.changed.notify('price')
+        a.changed.notify('stock')
+    assert log == [('a', 'price'), ('b', 'price')]
+
+    def merge(previous, current):
+        fields = previous.args[0]
+        if not isinstance(fields, tuple):
+            fields = (fields,)
+        return Notification((fields + current.args,), {})
+
+    del log[:]
+    with Signal.deferred(merge):
+        a.changed.notify('price')
+        a.changed.notify('stock')
+    assert log == [('a', ('price', 'stock'))]
+
+    # nothing is dispatched when the block fails
+    del log[:]
+    with pytest.raises(RuntimeError):
+        with Signal.deferred():
+            a.changed.notify('price')
+            raise RuntimeError()
+    assert log == []
+    # and nothing is deferred anymore
+    a.changed.notify('price')
+    assert log == [('a', 'price')]
+
+
+async def test_deferred_async_nested():
+
+    log = []
+    asignal = Signal()
+
+    async def ahandler(value):
+        await asyncio.sleep(0.001)
+        log.append(value)
+
+    asignal.connect(ahandler)
+
+    async with Signal.deferred(MergePolicy.ALL):
+        asignal.notify(1)
+        with Signal.deferred():
+            asignal.notify(2)
+            asignal.notify(3)
+        # the inner one passed its notification to the outer
+        assert log == []
+    assert log == [1, 3]
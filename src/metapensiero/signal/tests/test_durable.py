@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- durable queue tests
+# :Created: dom 18 ott 2026 19:46:03 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from metapensiero.signal import Signal
+from metapensiero.signal.durable import DurableQueue
+
+
+# All test coroutines will be treated as marked
+pytestmark = pytest.mark.asyncio()
+
+
+async def test_durable_queue():
+
+    path = os.path.join(tempfile.mkdtemp(), 'queue.db')
+    asignal = Signal()
+    executed = []
+    failures = [1]
+
+    async def send(value, *, to):
+        await asyncio.sleep(0)
+        if value in failures:
+            failures.remove(value)
+            raise RuntimeError('boom')
+        executed.append((value, to))
+
+    queue = DurableQueue(path, retry_delay=0.01, acknowledge=True)
+    asignal.connect(queue.register('send', send))
+    # notifications are only written, nothing is executed yet
+    await asignal.notify(0, to='a')
+    await asignal.notify(1, to='b')
+    assert queue.backlog == 2
+    await queue.close()
+    assert executed == []
+
+    # the notifications survive a restart
+    queue = DurableQueue(path, retry_delay=0.01, flush_interval=0)
+    queue.register('send', send)
+    await queue.start()
+    await asyncio.sleep(0.1)
+    assert executed == [(0, 'a'), (1, 'b')]
+    # the failed one has been retried
+    assert failures == []
+    assert queue.backlog == 0
+    await queue.close()
+
+
+async def test_durable_queue_max_attempts(caplog):
+
+    path = os.path.join(tempfile.mkdtemp(), 'queue.db')
+    attempts = []
+
+    def send(value):
+        attempts.append(value)
+        raise RuntimeError('boom')
+
+    queue = DurableQueue(path, retry_delay=0.01, flush_interval=0,
+                         max_attempts=3)
+    subscriber = queue.register('send', send)
+    await queue.start()
+    subscriber(1)
+    await asyncio.sleep(0.2)
+    assert attempts == [1, 1, 1]
+    assert queue.backlog == 0
+    assert 'Giving up on the notification' in caplog.text
+    await queue.close()
+
+    import sqlite3
+    db = sqlite3.connect(path)
+    assert db.execute('SELECT handler, attempts FROM '
+                      'dead_notifications').fetchall() == [('send', 3)]
+    db.close()
+
+
+async def test_durable_queue_failed_write():
+
+    path = os.path.join(tempfile.mkdtemp(), 'queue.db')
+    queue = DurableQueue(path, flush_interval=0.01)
+    subscriber = queue.register('send', lambda value: None)
+    write = queue._write
+    failures = []
+
+    def failing(*args):
+        if not failures:
+            failures.append(args)
+            raise OSError('disk full')
+        return write(*args)
+
+    queue._write = failing
+    subscriber(1)
+    assert not await queue.flush()
+    assert failures
+    # the notification is kept and written again without further appends
+    assert queue.backlog == 1
+    await asyncio.sleep(0.05)
+    assert queue._buffer == []
+    assert queue.backlog == 1
+    await queue.close()
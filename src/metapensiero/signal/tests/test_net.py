@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- socket signallers tests
+# :Created: dom 18 ott 2026 14:48:36 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from metapensiero.signal import handler, Signal, SignalAndHandlerInitMeta
+from metapensiero.signal.net import UnixSocketHub, UnixSocketSignaller
+
+
+# All test coroutines will be treated as marked
+pytestmark = pytest.mark.asyncio()
+
+
+class KeyedSignaller(UnixSocketSignaller):
+
+    def __init__(self, path, instances, **options):
+        super().__init__(path, **options)
+        self.instances = instances
+
+    def instance_key(self, instance):
+        return instance.key
+
+    def resolve_instance(self, signal, key):
+        return self.instances.get(key)
+
+
+async def test_unix_socket_signaller():
+
+    path = os.path.join(tempfile.mkdtemp(), 'hub.sock')
+    hub = UnixSocketHub(path)
+    await hub.start()
+
+    # two "processes", each with its own signals and instances
+    received = {1: [], 2: []}
+    instances = {1: {}, 2: {}}
+    classes = {}
+    signallers = {}
+    for pid in (1, 2):
+        signaller = KeyedSignaller(path, instances[pid])
+        meta = SignalAndHandlerInitMeta.with_external(signaller)
+
+        class Item(metaclass=meta):
+
+            changed = Signal()
+
+            def __init__(self, key, pid=pid):
+                self.key = key
+                self.pid = pid
+
+            @handler('changed')
+            def on_changed(self, value):
+                received[self.pid].append((self.key, value))
+
+        assert signaller.signals == {'changed': Item.changed}
+        assert list(signaller.classes.values()) == [Item]
+        await signaller.start(timeout=1)
+        classes[pid] = Item
+        signallers[pid] = signaller
+        instances[pid]['a'] = Item('a')
+
+    instances[1]['a'].changed.notify(1)
+    instances[1]['a'].changed.notify(2)
+    await signallers[1].flush()
+    await asyncio.sleep(0.05)
+    assert received == {1: [('a', 1), ('a', 2)], 2: [('a', 1), ('a', 2)]}
+
+    # the hub goes away and comes back
+    await hub.close()
+    await asyncio.sleep(0.05)
+    assert not signallers[1].connected.is_set()
+    instances[2]['a'].changed.notify(3)
+    await signallers[2].flush()
+    hub = UnixSocketHub(path)
+    await hub.start()
+    await signallers[1].start(timeout=1)
+    await signallers[2].start(timeout=1)
+    await asyncio.sleep(0.05)
+    assert received[1][-1] == ('a', 3)
+
+    for signaller in signallers.values():
+        await signaller.close()
+    await hub.close()
+
+
+async def test_hub_slow_client():
+
+    from metapensiero.signal.net import pack_frame
+
+    path = os.path.join(tempfile.mkdtemp(), 'hub.sock')
+    hub = UnixSocketHub(path, max_buffer=1 << 16)
+    await hub.start()
+    # a client that never reads
+    slow_reader, slow_writer = await asyncio.open_unix_connection(path)
+    reader, writer = await asyncio.open_unix_connection(path)
+    for i in range(10):
+        await asyncio.sleep(0.01)
+        if len(hub.clients) == 2:
+            break
+    frame = pack_frame(b'x' * (1 << 16))
+    for i in range(200):
+        writer.write(frame)
+        await writer.drain()
+        if hub.disconnected:
+            break
+    assert hub.disconnected == 1
+    assert len(hub.clients) == 1
+    writer.close()
+    slow_writer.close()
+    await hub.close()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- recording tests
+# :Created: dom 18 ott 2026 20:38:50 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from metapensiero.signal import Executor, Signal, SignalAndHandlerInitMeta
+from metapensiero.signal.recording import (read_recording, Recorder,
+                                           segments)
+
+
+class Item(metaclass=SignalAndHandlerInitMeta):
+
+    changed = Signal()
+
+    def __init__(self, key):
+        self.key = key
+
+
+def test_recorder():
+
+    directory = os.path.join(tempfile.mkdtemp(), 'rec')
+    asignal = Signal(name='asignal')
+    item = Item('a')
+
+    def double(value):
+        return asignal.notify(value * 2)
+
+    item.changed.connect(double)
+
+    with Recorder(directory, segment_size=512, max_segments=2,
+                  instance_key=lambda i: i.key) as recorder:
+        assert recorder in Executor.recorders
+        item.changed.notify(1)
+        asignal.notify(b'x' * 1000)
+        for i in range(20):
+            asignal.notify(i, kw='v')
+    assert Executor.recorders == ()
+    assert recorder.errors == 1
+    assert recorder.recorded == 22
+
+    records = list(read_recording(directory))
+    assert len(segments(directory)) == 2
+    # the oldest have been rotated away
+    assert len(records) < 22
+    assert records[-1].name == 'asignal'
+    assert records[-1].args == (19,)
+    assert records[-1].kwargs == {'kw': 'v'}
+    assert records[-1].depth == 0
+
+    directory = os.path.join(tempfile.mkdtemp(), 'rec')
+    with Recorder(directory, instance_key=lambda i: i.key):
+        item.changed.notify(1)
+    nested, outer = read_recording(directory)
+    assert outer.name == '{}:Item.changed'.format(__name__)
+    assert (outer.key, outer.args, outer.depth) == ('a', (1,), 0)
+    assert (nested.name, nested.key, nested.args, nested.depth) == (
+        'asignal', None, (2,), 1)
+    assert outer.timestamp <= nested.timestamp
+    assert outer.duration >= nested.duration
+    # the timings of the handlers
+    timing, = outer.handlers
+    assert timing.name == 'test_recorder.<locals>.double'
+    assert 0 <= timing.start <= timing.end <= outer.duration
+    assert not timing.pending
+    assert nested.handlers == ()
+
+
+@pytest.mark.asyncio
+async def test_recorder_execution_modes():
+
+    from metapensiero.signal import ResultPolicy
+
+    directory = os.path.join(tempfile.mkdtemp(), 'rec')
+    inner = Signal(name='inner')
+
+    async def check(value):
+        await asyncio.sleep(0)
+        inner.notify(value)
+        return value > 0
+
+    def positive(value):
+        return value > 0
+
+    signals = [Signal(name='policy', policy=ResultPolicy.UNTIL_FALSE),
+               Signal(Signal.FLAGS.EXEC_CONCURRENT, name='concurrent',
+                      policy=ResultPolicy.UNTIL_FALSE),
+               Signal(name='chunked', chunk_size=1)]
+    for asignal in signals:
+        asignal.connect(positive)
+        asignal.connect(check)
+
+    with Recorder(directory) as recorder:
+        assert (await signals[0].notify(1)) is True
+        assert (await signals[1].notify(1)) is True
+        assert (await signals[2].notify(1)) == (True, True)
+    assert recorder.recorded == 6
+    records = list(read_recording(directory))
+    timings = [[(t.name.rpartition('.')[2], t.pending) for t in r.handlers]
+               for r in records if r.depth == 0]
+    assert timings == [[('positive', False), ('check', True)],
+                       [('positive', False), ('check', True)],
+                       [('positive', False)]]
+    depths = {(r.name, r.depth) for r in read_recording(directory)}
+    assert depths == {('policy', 0), ('concurrent', 0), ('chunked', 0),
+                      ('inner', 1)}
+
+
+def test_recorder_buffer():
+
+    import weakref
+
+    directory = os.path.join(tempfile.mkdtemp(), 'rec')
+    asignal = Signal(name='buffered')
+    called = []
+
+    def handler(value):
+        called.append(value)
+
+    asignal.connect(handler)
+    with Recorder(directory, buffer_size=10) as recorder:
+        for i in range(15):
+            asignal.notify(i)
+        # the notifications are encoded ten at a time
+        assert recorder.recorded == 10
+        recorder.flush()
+        assert recorder.recorded == 15
+        # the handlers aren't kept alive by the recording
+        ref = weakref.ref(handler)
+        del handler
+        assert ref() is None
+        asignal.notify(15)
+    assert called == list(range(15))
+    assert recorder.recorded == 16
+    records = list(read_recording(directory))
+    assert [r.args for r in records] == [(i,) for i in range(16)]
+    assert records[-1].handlers == ()
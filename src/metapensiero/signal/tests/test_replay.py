@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- replay tests
+# :Created: dom 18 ott 2026 21:40:12 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+import io
+import os
+import tempfile
+import weakref
+
+import pytest
+
+from metapensiero.signal import (handler, Signal, SignalAndHandlerInitMeta)
+from metapensiero.signal.recording import read_recording, Recorder
+from metapensiero.signal.replay import (HandlerTimer, main, percentile,
+                                        recorded_latencies, Replayer)
+
+
+# All test coroutines will be treated as marked
+pytestmark = pytest.mark.asyncio()
+
+received = []
+total = Signal(name='total')
+
+
+class Account(metaclass=SignalAndHandlerInitMeta):
+
+    deposit = Signal()
+
+    def __init__(self, key):
+        self.key = key
+
+    @handler('deposit')
+    async def on_deposit(self, amount):
+        await asyncio.sleep(0)
+        received.append((self.key, amount))
+        total.notify(amount)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([], 50) is None
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile([1, 2, 3, 4, 5], 90) == 5
+    assert percentile([1, 2, 3, 4, 5], 0) == 1
+
+
+async def test_replay():
+
+    directory = os.path.join(tempfile.mkdtemp(), 'rec')
+    with Recorder(directory, instance_key=lambda i: i.key):
+        for i in range(10):
+            await Account('a' if i % 2 else 'b').deposit.notify(i)
+    assert len(list(read_recording(directory))) == 20
+    assert len(received) == 10
+    del received[:]
+
+    replayer = Replayer([__name__], speed=None, concurrency=4)
+    await replayer.replay(read_recording(directory))
+    # the nested notifications are made again by the handlers
+    assert replayer.replayed == 10
+    assert replayer.skipped == 0
+    assert sorted(received) == sorted(('a' if i % 2 else 'b', i)
+                                      for i in range(10))
+    latencies = replayer.timer.report()
+    assert latencies['Account.on_deposit'].count == 10
+    out = io.StringIO()
+    replayer.report(out)
+    assert 'replayed 10 notifications' in out.getvalue()
+    assert 'Account.on_deposit' in out.getvalue()
+
+
+async def test_recorded_latencies(capsys):
+
+    directory = os.path.join(tempfile.mkdtemp(), 'rec')
+    with Recorder(directory, instance_key=lambda i: i.key):
+        for i in range(10):
+            await Account('a').deposit.notify(i)
+    del received[:]
+    latencies = recorded_latencies(read_recording(directory))
+    assert set(latencies) == {'Account.on_deposit'}
+    assert latencies['Account.on_deposit'].count == 10
+    main(['--recorded', directory])
+    assert 'Account.on_deposit' in capsys.readouterr().out
+
+
+failing = Signal(name='failing')
+
+
+async def test_replay_errors():
+
+    directory = os.path.join(tempfile.mkdtemp(), 'rec')
+    with Recorder(directory):
+        for i in range(4):
+            failing.notify(i)
+
+    def sync_failure(value):
+        if value == 1:
+            raise ValueError(value)
+
+    async def async_failure(value):
+        await asyncio.sleep(0)
+        if value == 2:
+            raise ValueError(value)
+
+    failing.connect(sync_failure)
+    failing.connect(async_failure)
+    try:
+        replayer = Replayer([__name__], speed=None)
+        await replayer.replay(read_recording(directory))
+    finally:
+        failing.clear()
+    assert replayer.replayed == 4
+    assert replayer.errors == 2
+    # the one that raised synchronously stopped the others
+    assert replayer.timer.report()[
+        'test_replay_errors.<locals>.async_failure'].count == 3
+
+
+def test_timer_dead_handlers():
+
+    from metapensiero.signal import Executor
+
+    def dead(value):
+        pass
+
+    ref = weakref.ref(dead)
+    del dead
+    with HandlerTimer() as timer:
+        assert Executor([ref]).run(1).results == ()
+    assert not timer.latencies
+
+
+wrapped = Signal(name='wrapped')
+
+
+async def test_replay_notify_wrapper():
+
+    directory = os.path.join(tempfile.mkdtemp(), 'rec')
+    with Recorder(directory):
+        for i in range(3):
+            wrapped.notify(i)
+
+    @wrapped.on_notify
+    async def on_notify(subscribers, notify, value):
+        await asyncio.sleep(0)
+        if value == 1:
+            raise ValueError(value)
+        return await notify(value)
+
+    try:
+        replayer = Replayer([__name__], speed=None)
+        await replayer.replay(read_recording(directory))
+    finally:
+        wrapped.on_notify(None)
+    assert replayer.replayed == 3
+    assert replayer.errors == 1
+
+
+def test_main_speed(capsys):
+
+    with pytest.raises(SystemExit):
+        main(['--speed', '0', '--module', __name__, 'rec'])
+    assert 'the speed must be positive' in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        Replayer([], speed=0)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- codecs tests
+# :Created: dom 18 ott 2026 17:44:12 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+import pickle
+
+import pytest
+
+from metapensiero.signal import (BatchingExternalSignaller,
+                                 CompositeExternalSignaller,
+                                 ExternalSignaller, Signal, SignalError,
+                                 signal)
+from metapensiero.signal.serialization import (JSONCodec, PickleCodec,
+                                               StructCodec)
+
+
+@pytest.mark.parametrize('codec', [PickleCodec(), JSONCodec(),
+                                   StructCodec()])
+def test_roundtrip(codec):
+
+    args, kwargs = (1, 'two', 3.0), {'four': [4]}
+    payload, buffers = codec.encode('foo', 'key', args, kwargs)
+    assert buffers == []
+    assert codec.decode(payload) == ('foo', 'key', args, kwargs)
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5,
+                    reason="Needs pickle protocol 5")
+def test_pickle_out_of_band():
+
+    codec = PickleCodec(out_of_band_threshold=100)
+    blob = b'x' * 100
+    payload, buffers = codec.encode('foo', None, (blob, b'small'), {},
+                                    out_of_band=True)
+    assert len(buffers) == 1
+    assert len(payload) < 100
+    name, key, args, kwargs = codec.decode(payload, buffers)
+    assert isinstance(args[0], memoryview)
+    assert args == (blob, b'small')
+
+
+def test_struct_codec():
+
+    @signal
+    def price_changed(symbol: str, price: float, volume: int, *,
+                      final: bool = False, raw: bytes = b''):
+        pass
+
+    codec = StructCodec()
+    codec.register_signal(price_changed, 'price_changed')
+    assert 'price_changed' in codec.schemas
+
+    payload, buffers = codec.encode('price_changed', 42, ('ACME', 1.5),
+                                    {'volume': 10, 'raw': b'\x00\x01'})
+    assert codec.decode(payload) == ('price_changed', 42, ('ACME', 1.5, 10),
+                                     {'final': False, 'raw': b'\x00\x01'})
+    pickled, _ = PickleCodec().encode('price_changed', 42, ('ACME', 1.5),
+                                      {'volume': 10, 'raw': b'\x00\x01'})
+    assert len(payload) < len(pickled)
+
+    @signal
+    def moved(x: float, y: float):
+        pass
+
+    codec.register_signal(moved, 'moved')
+    payload, buffers = codec.encode('moved', 'àlfa', (1.0, 2.0), {})
+    assert codec.decode(memoryview(payload)) == ('moved', 'àlfa',
+                                                 (1.0, 2.0), {})
+    payload, buffers = codec.encode('moved', None, (1.0,), {'y': 2.0})
+    assert codec.decode(payload) == ('moved', None, (1.0, 2.0), {})
+
+    with pytest.raises(SignalError):
+        StructCodec().decode(payload)
+
+
+def test_encoding_reuse():
+
+    encoded = []
+
+    class CountingCodec(PickleCodec):
+
+        def _encode(self, *args):
+            encoded.append(args)
+            return super()._encode(*args)
+
+    codec = CountingCodec()
+    payloads = []
+
+    class Transport(ExternalSignaller):
+
+        def publish_signal(self, signal, instance, loop, args, kwargs):
+            payloads.append(codec.encode(signal.name, None, args, kwargs))
+
+        def register_signal(self, signal, name):
+            pass
+
+    asignal = Signal(name='foo', external=CompositeExternalSignaller(
+        Transport(), Transport()))
+    asignal.notify(1, a=2)
+    assert len(payloads) == 2
+    assert payloads[0] is payloads[1]
+    assert len(encoded) == 1
+    asignal.notify(1, a=2)
+    assert len(encoded) == 2
+
+
+@pytest.mark.asyncio
+async def test_encoding_reuse_batches():
+
+    encoded = []
+
+    class CountingCodec(PickleCodec):
+
+        def _encode(self, *args):
+            encoded.append(args)
+            return super()._encode(*args)
+
+    codec = CountingCodec()
+    payloads = []
+
+    class Transport(BatchingExternalSignaller):
+
+        async def send_batch(self, name, signal, batch):
+            payloads.append([codec.encode(name, None, args, kwargs)
+                             for instance, args, kwargs in batch])
+
+    asignal = Signal(name='foo', external=CompositeExternalSignaller(
+        Transport(), Transport()))
+    for i in range(10):
+        asignal.notify(i)
+    await asyncio.sleep(0.001)
+    assert len(payloads) == 2
+    assert payloads[0] == payloads[1]
+    assert len(encoded) == 10
+
+    codec.reuse_size = 4
+    for i in range(10):
+        asignal.notify(i)
+    await asyncio.sleep(0.001)
+    assert len(encoded) == 30
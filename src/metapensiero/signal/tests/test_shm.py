@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- shared memory signaller tests
+# :Created: dom 18 ott 2026 16:21:44 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from metapensiero.signal import Signal
+from metapensiero.signal import shm
+
+
+def test_ring_buffer_wrap_and_overrun():
+
+    ring = shm.RingBuffer(capacity=256, create=True)
+    try:
+        reader = shm.RingReader(ring)
+        for i in range(10):
+            ring.write(bytes([i]) * 40, [b'x' * 8])
+            records = reader.read()
+            assert len(records) == 1
+            position, views = records[0]
+            assert reader.valid(position)
+            assert bytes(views[0]) == bytes([i]) * 40
+            assert bytes(views[1]) == b'x' * 8
+            del views, records
+        assert reader.lost == 0
+        for i in range(10):
+            ring.write(bytes([i]) * 40)
+        assert reader.read() == []
+        assert reader.lost == 1
+        with pytest.raises(shm.SignalError):
+            ring.write(b'x' * 256)
+    finally:
+        ring.close()
+
+
+def test_ring_buffer_attached_by_another_process():
+
+    ring = shm.RingBuffer(capacity=256, create=True)
+    try:
+        # the block survives the exit of a process that attached to it
+        code = ("from metapensiero.signal import shm; "
+                "shm.RingBuffer({!r}).close()".format(ring.name))
+        subprocess.run([sys.executable, '-c', code], check=True)
+        again = shm.RingBuffer(ring.name)
+        assert again.capacity == 256
+        again.close()
+    finally:
+        ring.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_memory_signaller():
+
+    producer = shm.SharedMemorySignaller(create=True, capacity=1 << 16)
+    consumer = shm.SharedMemorySignaller(producer.ring.name)
+    await consumer.start()
+
+    source = Signal(name='data', external=producer)
+    target = Signal(name='data', external=consumer)
+    received = []
+
+    def on_data(blob, tag=None):
+        received.append((type(blob), bytes(blob), tag))
+
+    target.connect(on_data)
+    source.notify(b'small', tag=1)
+    source.notify(b'x' * 2048, tag=2)
+    # consumers don't publish
+    target.notify(b'local', tag=3)
+    for _ in range(100):
+        if len(received) == 3:
+            break
+        await asyncio.sleep(0.005)
+
+    assert received == [(bytes, b'local', 3),
+                        (bytes, b'small', 1),
+                        (memoryview, b'x' * 2048, 2)]
+    del received
+    await consumer.close()
+    await producer.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_memory_overwritten_views():
+
+    producer = shm.SharedMemorySignaller(create=True, capacity=4096)
+    consumer = shm.SharedMemorySignaller(producer.ring.name)
+    await consumer.start()
+
+    source = Signal(name='data', external=producer)
+    target = Signal(name='data', external=consumer)
+    started = asyncio.Event()
+    resume = asyncio.Event()
+    checks = []
+
+    async def on_data(blob):
+        checks.append(shm.views_valid())
+        started.set()
+        await resume.wait()
+        # the copy made now isn't the notified data
+        bytes(blob)
+        checks.append(shm.views_valid())
+
+    target.connect(on_data)
+    source.notify(b'a' * 1024)
+    await asyncio.wait_for(started.wait(), 1)
+    # the producer doesn't wait for the slow consumer
+    for i in range(8):
+        source.notify(b'b' * 1024)
+    resume.set()
+    for _ in range(100):
+        if len(checks) == 2:
+            break
+        await asyncio.sleep(0.005)
+    assert checks == [True, False]
+    assert shm.views_valid()
+    await consumer.close()
+    await producer.close()
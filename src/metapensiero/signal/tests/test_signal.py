@@ -11,7 +11,8 @@ import pytest
 
 from metapensiero.signal import handler, Signal, SignalAndHandlerInitMeta
 from metapensiero.signal.core import InstanceProxy
-from metapensiero.signal.utils import MultipleResults, ExecutionError, signal
+from metapensiero.signal.utils import (MultipleResults, ExecutionError,
+                                       SignalError, signal)
 
 
 @pytest.mark.asyncio
@@ -915,3 +916,950 @@ def test_19_validation():
     assert c['handler_called'] is False
 
     assert exc_info.match('validation.*failed')
+
+
+@pytest.mark.asyncio
+async def test_20_emit():
+
+    c = dict(called=[], errors=[])
+
+    asignal = Signal()
+
+    @asignal.on_emit_error
+    def asignal(error):
+        c['errors'].append(error)
+
+    def sync_handler(arg):
+        c['called'].append(('sync', arg))
+
+    async def async_handler(arg):
+        await asyncio.sleep(0)
+        if arg == 'fail':
+            raise ValueError(arg)
+        c['called'].append(('async', arg))
+
+    asignal.connect(sync_handler)
+    asignal.connect(async_handler)
+
+    task = asignal.emit('a')
+    assert c['called'] == [('sync', 'a')]
+    assert not task.done()
+
+    asignal.emit('fail')
+    assert await asignal.drain() is True
+    assert task.done()
+    assert c['called'] == [('sync', 'a'), ('sync', 'fail'), ('async', 'a')]
+    assert len(c['errors']) == 1
+    assert isinstance(c['errors'][0], ValueError)
+    assert await asignal.drain(timeout=0) is True
+
+    asignal.disconnect(async_handler)
+    assert asignal.emit('b') is None
+
+    class A(metaclass=SignalAndHandlerInitMeta):
+
+        click = Signal()
+
+        @handler('click')
+        async def onclick(self, arg):
+            await asyncio.sleep(0)
+            c['called'].append(('method', arg))
+
+    a = A()
+    a.click.emit('c')
+    assert await A.click.drain(timeout=1) is True
+    assert c['called'][-1] == ('method', 'c')
+
+    # the timeout applies to the whole drain, even if the emitted handlers
+    # keep emitting
+    relay = Signal()
+    relayed = []
+
+    async def relaying(count):
+        await asyncio.sleep(0.01)
+        relayed.append(count)
+        if count < 50:
+            relay.emit(count + 1)
+
+    relay.connect(relaying)
+    relay.emit(0)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await relay.drain(timeout=0.05) is False
+    assert loop.time() - start < 0.2
+    assert len(relayed) < 50
+    assert await relay.drain() is True
+    assert relayed == list(range(51))
+
+
+@pytest.mark.asyncio
+async def test_21_discard_results():
+
+    asignal = Signal(Signal.FLAGS.DISCARD_RESULTS)
+    called = []
+
+    def handler1(arg):
+        called.append(arg)
+        return 1
+
+    async def handler2(arg):
+        called.append(arg)
+        return 2
+
+    asignal.connect(handler1)
+    asignal.connect(handler2)
+
+    assert await asignal.notify('a') == ()
+    assert called == ['a', 'a']
+    res = await asignal.notify_prepared(('b',), collect_results=True)
+    assert res == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_22_batching_external_signaller():
+
+    from metapensiero.signal import BatchingExternalSignaller
+
+    sent = []
+
+    class MySignaller(BatchingExternalSignaller):
+
+        async def send_batch(self, name, signal, batch):
+            await asyncio.sleep(0)
+            sent.append((name, [args for instance, args, kwargs in batch]))
+
+    signaller = MySignaller(max_size=3, max_age=None, flush_on_idle=False)
+    asignal = Signal(name='foo', external=signaller)
+    assert signaller.signals == {'foo': asignal}
+
+    for i in range(5):
+        asignal.notify(i)
+    await asyncio.sleep(0.01)
+    assert sent == [('foo', [(0,), (1,), (2,)])]
+    await signaller.flush()
+    assert sent == [('foo', [(0,), (1,), (2,)]), ('foo', [(3,), (4,)])]
+
+    del sent[:]
+    signaller = MySignaller(flush_on_idle=False, max_age=0.01,
+                            acknowledge=True)
+    asignal = Signal(name='bar', external=signaller)
+    res = asignal.notify(1)
+    asignal.notify(2)
+    assert sent == []
+    assert await res == (None,)
+    assert sent == [('bar', [(1,), (2,)])]
+
+    del sent[:]
+    signaller = MySignaller()
+    asignal = Signal(name='baz', external=signaller)
+    asignal.notify(1)
+    asignal.notify(2)
+    await asyncio.sleep(0.001)
+    assert sent == [('baz', [(1,), (2,)])]
+
+
+@pytest.mark.asyncio
+async def test_23_cached_handlers():
+
+    asignal = Signal()
+    calls = []
+
+    def price(symbol, *, currency='EUR'):
+        calls.append(symbol)
+        return (symbol, currency)
+
+    async def lookup(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0.001)
+        return str(symbol).lower()
+
+    asignal.connect(price, cache={'maxsize': 2})
+    asignal.connect(lookup, cache=True)
+    assert price in asignal.subscribers
+
+    # the awaits in flight are shared
+    res1 = asignal.notify('A', extra=1)
+    res2 = asignal.notify('A')
+    assert await res1 == (('A', 'EUR'), 'a')
+    assert await res2 == (('A', 'EUR'), 'a')
+    assert calls == ['A', 'A']
+    # now the awaited result is cached too
+    res = asignal.notify('A')
+    assert res.done
+    assert res.results == (('A', 'EUR'), 'a')
+    assert calls == ['A', 'A']
+
+    await asignal.notify('B')
+    await asignal.notify('C')
+    await asignal.notify('A', currency='USD')
+    stats = asignal.get_cache(price).stats
+    assert stats['hits'] == 2
+    assert stats['misses'] == 4
+    assert stats['evictions'] == 2
+    assert stats['size'] == 2
+
+    # unhashable arguments are not cached
+    await asignal.notify(['X'])
+    await asignal.notify(['X'])
+    assert asignal.get_cache(lookup).misses == 5
+
+    # a policy cancelling the pending handlers doesn't cancel the shared
+    # await
+    from metapensiero.signal import ResultPolicy
+    from metapensiero.signal.cache import ResultCache
+
+    async def slow(symbol):
+        await asyncio.sleep(0.01)
+        return 'slow'
+
+    async def fast(symbol):
+        return 'fast'
+
+    slow_cache = ResultCache()
+    first = Signal(Signal.FLAGS.EXEC_CONCURRENT, policy=ResultPolicy.FIRST)
+    first.connect(slow, cache=slow_cache)
+    first.connect(fast)
+    other = Signal()
+    other.connect(slow, cache=slow_cache)
+    shared = other.notify('S')
+    assert (await first.notify('S')) == 'fast'
+    assert (await shared) == ('slow',)
+    await asyncio.sleep(0)
+    assert slow_cache.stats['size'] == 1
+
+    # clearing drops the awaits in flight and their results
+    del calls[:]
+    res1 = asignal.notify('D')
+    asignal.get_cache(lookup).clear()
+    res2 = asignal.notify('D')
+    await res1
+    await res2
+    assert calls == ['D', 'D', 'D']
+    await asyncio.sleep(0)
+    assert asignal.get_cache(lookup).stats['size'] == 1
+    await asignal.notify('D')
+    assert calls == ['D', 'D', 'D']
+
+    # disconnecting and garbage collection work as usual
+    asignal.disconnect(price)
+    assert asignal.get_cache(price) is None
+    del lookup
+    assert len(asignal.subscribers) == 0
+
+    # ttl
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    del calls[:]
+    asignal.connect(square, cache={'ttl': 0.01})
+    asignal.notify(2)
+    asignal.notify(2)
+    await asyncio.sleep(0.02)
+    asignal.notify(2)
+    assert calls == [2, 2]
+
+    class A(metaclass=SignalAndHandlerInitMeta):
+
+        click = Signal()
+
+        @handler('click', cache=10)
+        def on_click(self, x):
+            calls.append(x)
+            return x + 1
+
+    del calls[:]
+    a = A()
+    assert a.click.notify(1).results == (2,)
+    assert a.click.notify(1).results == (2,)
+    assert A().click.notify(1).results == (2,)
+    assert calls == [1, 1]
+    assert a.click.get_cache(a.on_click).stats['hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_24_result_policies():
+
+    from metapensiero.signal import AggregatedResults, ResultPolicy
+
+    checked = []
+
+    class Document(metaclass=SignalAndHandlerInitMeta):
+
+        can_edit = Signal(policy=ResultPolicy.UNTIL_FALSE)
+
+        @handler('can_edit')
+        def check_1_owner(self, user):
+            checked.append('owner')
+            return user != 'guest'
+
+        @handler('can_edit')
+        async def check_2_lock(self, user):
+            checked.append('lock')
+            return True
+
+    doc = Document()
+    res = doc.can_edit.notify('guest')
+    assert isinstance(res, AggregatedResults)
+    assert res.done
+    assert res.value is False
+    assert checked == ['owner']
+    assert await doc.can_edit.notify('admin') is True
+    assert checked == ['owner', 'owner', 'lock']
+    # the policy can be chosen per notification
+    res = doc.can_edit.notify_prepared(('admin',),
+                                       policy=ResultPolicy.FIRST)
+    assert await res is True
+
+    total = Signal(policy=ResultPolicy.REDUCE, freduce=lambda a, v: a + v,
+                   reduce_initial=0)
+
+    def one():
+        return 1
+
+    async def two():
+        return 2
+
+    total.connect(one)
+    total.connect(two)
+    assert await total.notify() == 3
+
+
+@pytest.mark.asyncio
+async def test_25_chunked_dispatch():
+
+    asignal = Signal(chunk_size=100)
+    called = []
+    handlers = []
+    for i in range(1000):
+        def handler(value, i=i):
+            called.append(i)
+            return i
+        handlers.append(handler)
+        asignal.connect(handler)
+
+    observed = []
+
+    async def observer():
+        while len(called) < 1000:
+            observed.append(len(called))
+            await asyncio.sleep(0)
+
+    obs = asyncio.ensure_future(observer())
+    res = asignal.notify(1)
+    assert not res.done
+    assert len(called) == 100
+    assert sorted(await res) == list(range(1000))
+    await obs
+    # the loop has been able to run the observer between the chunks
+    assert len(observed) > 1
+
+
+@pytest.mark.asyncio
+async def test_26_dependency_levels():
+
+    log = []
+
+    class Order(metaclass=SignalAndHandlerInitMeta):
+
+        placed = Signal()
+
+        @handler('placed')
+        async def reserve_stock(self):
+            log.append('reserve start')
+            await asyncio.sleep(0.01)
+            log.append('reserve end')
+
+        @handler('placed')
+        async def charge(self):
+            log.append('charge start')
+            await asyncio.sleep(0.01)
+            log.append('charge end')
+
+        @handler('placed', after=('reserve_stock', 'charge'))
+        def confirm(self):
+            log.append('confirm')
+
+    async def notify_customer():
+        log.append('notify')
+
+    order = Order()
+    order.placed.connect(notify_customer, after='confirm')
+    await order.placed.notify()
+    # both started before any of them completed
+    assert set(log[:2]) == {'reserve start', 'charge start'}
+    assert log[-2:] == ['confirm', 'notify']
+
+    asignal = Signal()
+
+    def first():
+        log.append('first')
+
+    def second():
+        log.append('second')
+
+    asignal.connect(second)
+    asignal.connect(first, before='second')
+    del log[:]
+    res = asignal.notify()
+    assert res.done
+    assert log == ['first', 'second']
+
+
+@pytest.mark.asyncio
+async def test_27_keyed_routing():
+
+    called = []
+
+    def make(name):
+        def handler(amount, account_id):
+            called.append((name, account_id, amount))
+        return handler
+
+    asignal = Signal(key_arg='account_id')
+    handlers = {i: make(i) for i in range(1000)}
+    for i, h in handlers.items():
+        asignal.connect(h, key=i)
+
+    def audit(amount):
+        called.append(('audit', amount))
+
+    asignal.connect(audit)
+    await asignal.notify(10, account_id=42)
+    # only the matching handler, after the unkeyed ones
+    assert called == [('audit', 10), (42, 42, 10)]
+    del called[:]
+    await asignal.notify(5, account_id='nobody')
+    assert called == [('audit', 5)]
+
+    asignal.disconnect(handlers[42])
+    del called[:]
+    await asignal.notify(10, account_id=42)
+    assert called == [('audit', 10)]
+
+    # positional keys and instance level handlers
+    class Account(metaclass=SignalAndHandlerInitMeta):
+
+        deposit = Signal()
+
+    acc = Account()
+    acc.deposit.connect(handlers[1], key='EUR', key_arg=1)
+    acc.deposit.connect(handlers[2], key='USD', key_arg=1)
+    del called[:]
+    await acc.deposit.notify(3, 'USD')
+    assert called == [(2, 'USD', 3)]
+    acc.deposit.disconnect(handlers[2], key='USD')
+    await acc.deposit.notify(3, 'USD')
+    assert called == [(2, 'USD', 3)]
+
+    with pytest.raises(SignalError):
+        Signal().connect(audit, key=1)
+
+    # the key passed positionally is found using the validation signature
+    @signal(key_arg='account_id')
+    def changed(account_id, amount):
+        pass
+
+    def on_changed(account_id, amount):
+        called.append(('changed', account_id, amount))
+
+    changed.connect(on_changed, key=7)
+    del called[:]
+    await changed.notify(7, 100)
+    await changed.notify(amount=50, account_id=7)
+    await changed.notify(8, 100)
+    assert called == [('changed', 7, 100), ('changed', 7, 50)]
+
+    # and it's an error without one
+    with pytest.raises(SignalError):
+        asignal.notify(42, 10)
+
+
+@pytest.mark.asyncio
+async def test_28_where_predicates():
+
+    from metapensiero.signal.filters import Predicate
+
+    called = []
+
+    def big(amount, status=None):
+        called.append('big')
+
+    def paid(amount, status):
+        called.append('paid')
+
+    def big_paid(amount, status):
+        called.append('big_paid')
+
+    asignal = Signal()
+    asignal.connect(big, where={'amount': ('>', 1000)})
+    asignal.connect(paid, where={'status': ('in', ['paid', 'shipped'])})
+    asignal.connect(big_paid, where=[('amount', '>', 1000),
+                                     ('status', '==', 'paid')])
+
+    evaluated = []
+    original = Predicate.__call__
+
+    def counting(self, *args):
+        evaluated.append(self)
+        return original(self, *args)
+
+    Predicate.__call__ = counting
+    try:
+        await asignal.notify(amount=2000, status='paid')
+    finally:
+        Predicate.__call__ = original
+    assert sorted(called) == ['big', 'big_paid', 'paid']
+    # the shared predicate is evaluated once
+    assert len(evaluated) == 3
+
+    del called[:]
+    await asignal.notify(amount=10, status='shipped')
+    assert called == ['paid']
+    del called[:]
+    # a missing argument doesn't match
+    await asignal.notify(amount=2000)
+    assert called == ['big']
+
+    asignal.disconnect(big)
+    del called[:]
+    await asignal.notify(amount=2000, status='new')
+    assert called == []
+
+    with pytest.raises(SignalError):
+        asignal.connect(big, where=[('amount', '~', 1)])
+    with pytest.raises(SignalError):
+        asignal.connect(big, where={'amount': 1}, key=1)
+    # an unhashable operator
+    with pytest.raises(SignalError):
+        asignal.connect(big, where={'amount': (['>'], 1)})
+
+    # the arguments passed positionally are found using the validation
+    # signature
+    @signal
+    def payment(amount, status=None):
+        pass
+
+    payment.connect(big_paid, where=[('amount', '>', 1000),
+                                     ('status', '==', 'paid')])
+    del called[:]
+    await payment.notify(2000, 'paid')
+    await payment.notify(2000, status='paid')
+    await payment.notify(10, 'paid')
+    assert called == ['big_paid', 'big_paid']
+    # and it's an error without one
+    with pytest.raises(SignalError):
+        asignal.notify(2000, 'paid')
+
+
+@pytest.mark.asyncio
+async def test_29_limited_subscriptions():
+
+    called = []
+
+    def once(value):
+        called.append(('once', value))
+
+    def twice(value):
+        called.append(('twice', value))
+
+    asignal = Signal()
+    asignal.connect_once(once)
+    asignal.connect(twice, times=2)
+    for i in range(3):
+        await asignal.notify(i)
+    assert called == [('once', 0), ('twice', 0), ('twice', 1)]
+    # the expired ones have been removed
+    assert len(asignal.subscribers) == 0
+
+    # lots of one-shot subscriptions are compacted together
+    handlers = [once] * 1000
+    for h in handlers:
+        asignal.connect_once(h)
+    del called[:]
+    await asignal.notify('x')
+    assert len(called) == 1000
+    assert len(asignal.subscribers) == 0
+
+    waiter = asyncio.ensure_future(asignal.next())
+    await asyncio.sleep(0)
+    asignal.notify(1, reply='pong')
+    args, kwargs = await waiter
+    assert args == (1,)
+    assert kwargs == {'reply': 'pong'}
+    asignal.notify(2)
+    assert len(asignal.subscribers) == 0
+
+    class Client(metaclass=SignalAndHandlerInitMeta):
+
+        response = Signal()
+
+    client = Client()
+    fut = client.response.next()
+    client.response.notify('ok')
+    assert (await fut).args == ('ok',)
+
+    with pytest.raises(SignalError):
+        asignal.connect(once, times=0)
+
+
+@pytest.mark.asyncio
+async def test_30_strong_references():
+
+    import gc
+
+    called = []
+    asignal = Signal()
+    asignal.connect(lambda value: called.append(('weak', value)))
+    asignal.connect(lambda value: called.append(('strong', value)),
+                    weak=False)
+
+    class Handler:
+
+        def method(self, value):
+            called.append(('method', value))
+
+    asignal.connect(Handler().method, weak=False)
+    asignal.connect(lambda value: called.append(('once', value)),
+                    weak=False, times=1)
+    gc.collect()
+    await asignal.notify(1)
+    await asignal.notify(2)
+    assert called == [('strong', 1), ('method', 1), ('once', 1),
+                      ('strong', 2), ('method', 2)]
+
+    def handler(value):
+        called.append(('handler', value))
+
+    assert handler not in asignal.subscribers
+    strong = Signal(weak=False)
+    strong.connect(handler)
+    assert handler in strong.subscribers
+    strong.connect(handler)
+    assert len(strong.subscribers) == 1
+    strong.disconnect(handler)
+    assert handler not in strong.subscribers
+    assert len(strong.subscribers) == 0
+
+
+@pytest.mark.asyncio
+async def test_31_reused_executor():
+
+    called = []
+
+    def first(value):
+        called.append(('first', value))
+
+    def second(value):
+        called.append(('second', value))
+
+    asignal = Signal()
+    asignal.connect(first)
+    asignal.notify(1)
+    executor = asignal._executor
+    asignal.notify(2)
+    assert asignal._executor is executor
+    # it's prepared again when the handlers change
+    asignal.connect(second)
+    asignal.notify(3)
+    assert asignal._executor is not executor
+    assert called == [('first', 1), ('first', 2), ('first', 3),
+                      ('second', 3)]
+    executor = asignal._executor
+    asignal.disconnect(first)
+    asignal.notify(4)
+    assert called[-1] == ('second', 4)
+    assert asignal._executor is not executor
+
+    @asignal.on_notify
+    def wrapper(handlers, notify, value):
+        called.append(('wrapper', value))
+        return notify(value)
+
+    await asignal.notify(5)
+    assert called[-2:] == [('wrapper', 5), ('second', 5)]
+
+    class Model(metaclass=SignalAndHandlerInitMeta):
+
+        changed = Signal()
+
+        @handler('changed')
+        def on_changed(self, value):
+            called.append(('model', self, value))
+
+    a = Model()
+    b = Model()
+    a.changed.notify(1)
+    b.changed.notify(2)
+    assert a.changed._executor is not b.changed._executor
+    executor = a.changed._executor
+    a.changed.notify(3)
+    assert a.changed._executor is executor
+    assert called[-3:] == [('model', a, 1), ('model', b, 2),
+                           ('model', a, 3)]
+
+
+@pytest.mark.asyncio
+async def test_32_eager_tasks():
+
+    cache = {1: 'one'}
+
+    async def lookup(key):
+        if key in cache:
+            return cache[key]
+        await asyncio.sleep(0.001)
+        cache[key] = str(key)
+        return cache[key]
+
+    asignal = Signal(Signal.FLAGS.EXEC_CONCURRENT, Signal.FLAGS.EAGER_TASKS)
+    asignal.connect(lookup)
+    res = asignal.notify(1)
+    # completed without going through the loop
+    assert res.done
+    assert res.results == ('one',)
+    res = asignal.notify(2)
+    assert not res.done
+    assert await res == ('2',)
+
+    with pytest.raises(ValueError):
+        Signal(Signal.FLAGS.EAGER_TASKS)
+
+
+@pytest.mark.asyncio
+async def test_33_selected_handlers_connected_later():
+
+    called = []
+
+    def keyed(amount, acct):
+        called.append(('keyed', acct))
+
+    def filtered(amount, acct):
+        called.append(('filtered', amount))
+
+    asignal = Signal(key_arg='acct')
+    await asignal.notify(1, acct=1)
+    asignal.connect(keyed, key=2)
+    await asignal.notify(1, acct=2)
+    assert called == [('keyed', 2)]
+    asignal.connect(filtered, where={'amount': ('>', 10)})
+    await asignal.notify(amount=20, acct=2)
+    assert called[1:] == [('keyed', 2), ('filtered', 20)]
+
+    class Account(metaclass=SignalAndHandlerInitMeta):
+
+        deposit = Signal(key_arg='acct')
+
+    acc = Account()
+    await acc.deposit.notify(1, acct=1)
+    acc.deposit.connect(keyed, key=1)
+    await acc.deposit.notify(1, acct=1)
+    assert called[-1] == ('keyed', 1)
+
+    # the reduce initial value is part of the preparation
+    from metapensiero.signal import ResultPolicy
+
+    def value():
+        return 1
+
+    reducing = Signal(policy=ResultPolicy.REDUCE, freduce=lambda a, v: a + v,
+                      reduce_initial=0)
+    reducing.connect(value)
+    assert (await reducing.notify()) == 1
+    reducing._reduce_initial = 10
+    assert (await reducing.notify()) == 11
+
+
+@pytest.mark.asyncio
+async def test_34_selected_handlers_configuration():
+
+    from metapensiero.signal import ResultPolicy
+
+    called = []
+
+    def first(acct):
+        called.append('first')
+        return 'first'
+
+    def second(acct):
+        called.append('second')
+        return 'second'
+
+    def log(acct):
+        called.append('log')
+
+    async def slow(acct):
+        await asyncio.sleep(0)
+        return 'slow'
+
+    # results discarded like those of the other handlers
+    asignal = Signal(Signal.FLAGS.DISCARD_RESULTS, key_arg='acct')
+    asignal.connect(first, key=1)
+    asignal.connect(slow, key=1)
+    res = asignal.notify(acct=1)
+    assert (await res) == ()
+
+    del called[:]
+    # the policy stops at the first value
+    asignal = Signal(policy=ResultPolicy.FIRST, key_arg='acct')
+    asignal.connect(first, key=1)
+    asignal.connect(second, key=1)
+    assert (await asignal.notify(acct=1)) == 'first'
+    assert called == ['first']
+
+    # and the dependencies are honoured
+    asignal = Signal(key_arg='acct')
+    asignal.connect(second, key=1)
+    asignal.connect(log, key=1, after='first')
+    asignal.connect(first, key=1, before='second')
+    del called[:]
+    await asignal.notify(acct=1)
+    assert called == ['first', 'second', 'log']
+
+
+@pytest.mark.asyncio
+async def test_35_execution_modes_combined():
+
+    from metapensiero.signal import ResultPolicy
+
+    def first():
+        return 1
+
+    def second():
+        return 2
+
+    async def third():
+        return 3
+
+    asignal = Signal(policy=ResultPolicy.FIRST)
+    asignal.connect(second, after='first')
+    asignal.connect(first)
+    with pytest.raises(SignalError):
+        asignal.notify()
+    with pytest.raises(SignalError):
+        Signal(policy=ResultPolicy.FIRST, chunk_size=1).notify()
+    asignal = Signal(chunk_size=1)
+    asignal.connect(second, after='first')
+    asignal.connect(first)
+    with pytest.raises(SignalError):
+        asignal.notify()
+
+    # the coroutines are started eagerly with the other modes too
+    for options in ({'chunk_size': 10},
+                    {'policy': ResultPolicy.REDUCE,
+                     'freduce': lambda a, v: a + v, 'reduce_initial': 0}):
+        asignal = Signal(Signal.FLAGS.EXEC_CONCURRENT,
+                         Signal.FLAGS.EAGER_TASKS, **options)
+        asignal.connect(first)
+        asignal.connect(third)
+        res = asignal.notify()
+        assert res.done
+    assert res.value == 4
+    asignal = Signal(Signal.FLAGS.EXEC_CONCURRENT, Signal.FLAGS.EAGER_TASKS)
+    asignal.connect(third, after='first')
+    asignal.connect(first)
+    res = asignal.notify()
+    assert res.done
+    assert res.results == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_36_next_notification_connection():
+
+    from metapensiero.signal.subscribers import NextNotification
+
+    connected = []
+    asignal = Signal()
+
+    @asignal.on_connect
+    def on_connect(handler, subscribers, connect, notify):
+        connected.append(handler)
+        connect(handler)
+
+    fut = asignal.next()
+    assert len(connected) == 1
+    assert isinstance(connected[0], NextNotification)
+    asignal.notify('first')
+    assert (await fut).args == ('first',)
+    executor = asignal._executor
+    # the round trips don't prepare the executor again
+    for i in range(3):
+        fut = asignal.next()
+        asignal.notify(i)
+        assert (await fut).args == (i,)
+    assert asignal._executor is executor
+    assert len(asignal.subscribers.waiting) == 0
+
+
+@pytest.mark.asyncio
+async def test_37_nested_notifications():
+
+    from metapensiero.signal import ResultPolicy
+
+    def one():
+        return 1
+
+    async def two():
+        await asyncio.sleep(0)
+        return 2
+
+    chunked = Signal(chunk_size=1)
+    chunked.connect(one)
+    chunked.connect(two)
+    first = Signal(policy=ResultPolicy.FIRST)
+    first.connect(two)
+    quiet = Signal(Signal.FLAGS.DISCARD_RESULTS)
+    quiet.connect(two)
+
+    # the pending results of every kind of notification can be returned by
+    # a handler, their values are spliced in those of the outer one
+    for flags in ((), (Signal.FLAGS.EXEC_CONCURRENT,)):
+        outer = Signal(*flags)
+        outer.connect(chunked.notify)
+        outer.connect(first.notify)
+        outer.connect(quiet.notify)
+        outer.connect(one)
+        assert (await outer.notify()) == (1, 2, 2, 1)
+        outer = Signal(*flags, chunk_size=1)
+        outer.connect(chunked.notify)
+        outer.connect(first.notify)
+        assert (await outer.notify()) == (1, 2, 2)
+    # and the policies account them
+    total = Signal(policy=ResultPolicy.REDUCE, freduce=lambda a, v: a + v,
+                   reduce_initial=0)
+    total.connect(chunked.notify)
+    total.connect(first.notify)
+    assert (await total.notify()) == 5
+
+
+@pytest.mark.asyncio
+async def test_38_selected_handlers_nested():
+
+    called = []
+
+    def first(acct):
+        called.append('first')
+        return 'first'
+
+    async def second(acct):
+        await asyncio.sleep(0)
+        called.append('second')
+        return 'second'
+
+    def audit(acct):
+        return 'audit'
+
+    # the keyed handlers executed in chunks
+    asignal = Signal(chunk_size=1, key_arg='acct')
+    asignal.connect(audit)
+    asignal.connect(first, key=1)
+    asignal.connect(second, key=1)
+    assert (await asignal.notify(acct=1)) == ('audit', 'first', 'second')
+
+    # and in levels
+    asignal = Signal(key_arg='acct')
+    asignal.connect(audit)
+    asignal.connect(first, key=1, after='second')
+    asignal.connect(second, key=1)
+    del called[:]
+    assert (await asignal.notify(acct=1)) == ('audit', 'second', 'first')
+    assert called == ['second', 'first']
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- special subscribers tests
+# :Created: dom 18 ott 2026 11:52:19 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+
+import pytest
+
+from metapensiero.signal import (Notification, QueuePolicy, Signal,
+                                 SignalAndHandlerInitMeta)
+
+
+# All test coroutines will be treated as marked
+pytestmark = pytest.mark.asyncio()
+
+
+async def test_queue_subscriber_policies():
+
+    asignal = Signal()
+
+    drop_old = asignal.subscribe_queue(2, QueuePolicy.DROP_OLDEST)
+    drop_new = asignal.subscribe_queue(2, QueuePolicy.DROP_NEWEST)
+    coalesce = asignal.subscribe_queue(2, QueuePolicy.COALESCE)
+
+    for i in range(4):
+        await asignal.notify(i, kw=i)
+
+    assert [drop_old.get_nowait().args for _ in range(2)] == [(2,), (3,)]
+    assert [drop_new.get_nowait().args for _ in range(2)] == [(0,), (1,)]
+    assert [coalesce.get_nowait() for _ in range(2)] == [
+        Notification((0,), {'kw': 0}), Notification((3,), {'kw': 3})]
+
+    assert drop_old.metrics == {'depth': 0, 'maxsize': 2,
+                                'high_watermark': 2, 'enqueued': 4,
+                                'dropped': 2, 'coalesced': 0}
+    assert drop_new.dropped == 2
+    assert coalesce.coalesced == 2
+
+    drop_old.close()
+    await asignal.notify(5)
+    assert drop_old.depth == 0
+    assert drop_new.depth == 1
+
+    # subscribers are weakly referenced
+    del drop_new
+    assert len(asignal.subscribers) == 1
+
+
+async def test_queue_subscriber_backpressure():
+
+    class A(metaclass=SignalAndHandlerInitMeta):
+
+        click = Signal()
+
+    a = A()
+    sub = a.click.subscribe_queue(1)
+    assert sub.source is a.click
+    assert sub in a.click.subscribers
+
+    await a.click.notify(1)
+    res = a.click.notify(2)
+    assert not res.done
+    blocked = asyncio.ensure_future(res)
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert sub.depth == 1
+
+    assert (await sub.get()).args == (1,)
+    await blocked
+    assert (await sub.get()).args == (2,)
+    assert sub.enqueued == 2
+
+
+async def test_stream():
+
+    asignal = Signal()
+    received = []
+
+    async def consume(stream):
+        async for args, kwargs in stream:
+            received.append((args, kwargs))
+
+    stream = asignal.stream(maxsize=2)
+    consumer = asyncio.ensure_future(consume(stream))
+    for i in range(5):
+        await asignal.notify(i, kw=i)
+    stream.close()
+    await consumer
+
+    assert received == [((i,), {'kw': i}) for i in range(5)]
+    assert stream not in asignal.subscribers
+
+    async with asignal.stream() as stream:
+        await asignal.notify('a')
+        assert len(asignal.subscribers) == 1
+        assert (await stream.__anext__()).args == ('a',)
+    assert len(asignal.subscribers) == 0
+    # garbage collected streams are disconnected
+    asignal.stream()
+    assert len(asignal.subscribers) == 0
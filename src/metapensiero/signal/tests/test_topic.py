@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- TopicRegistry tests
+# :Created: dom 18 ott 2026 10:51:03 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import pytest
+
+from metapensiero.signal import Signal, SignalError, TopicRegistry
+
+
+def test_topic_patterns():
+
+    reg = TopicRegistry()
+    created = Signal(name='orders.created')
+    deleted = Signal(name='orders.deleted')
+    added = Signal(name='orders.item.added')
+    reg.register_signal(created)
+    reg.register_signal(deleted)
+
+    called = []
+
+    def on_order(*args):
+        called.append(('order',) + args)
+
+    def on_deleted(*args):
+        called.append(('deleted',) + args)
+
+    def on_all(*args):
+        called.append(('all',) + args)
+
+    reg.subscribe('orders.*', on_order)
+    reg.subscribe('*.deleted', on_deleted)
+    reg.subscribe('orders.**', on_all)
+
+    # signals registered after the subscription are resolved too
+    reg.register_signal(added)
+    users_deleted = Signal()
+    reg.register_signal(users_deleted, 'users.deleted')
+
+    assert set(reg) == {'orders.created', 'orders.deleted',
+                        'orders.item.added', 'users.deleted'}
+    assert reg['users.deleted'] is users_deleted
+    assert set(reg.matching('orders.**')) == {created, deleted, added}
+
+    created.notify(1)
+    assert called == [('order', 1), ('all', 1)]
+    del called[:]
+
+    deleted.notify(2)
+    assert called == [('order', 2), ('deleted', 2), ('all', 2)]
+    del called[:]
+
+    added.notify(3)
+    assert called == [('all', 3)]
+    del called[:]
+
+    users_deleted.notify(4)
+    assert called == [('deleted', 4)]
+    del called[:]
+
+    # on_all is still subscribed to orders.deleted via another pattern
+    reg.subscribe('orders.deleted', on_all)
+    reg.unsubscribe('orders.**', on_all)
+    deleted.notify(5)
+    added.notify(6)
+    assert called == [('order', 5), ('deleted', 5), ('all', 5)]
+    del called[:]
+
+    assert reg.unregister_signal('orders.deleted') is deleted
+    deleted.notify(7)
+    assert called == []
+    assert 'orders.deleted' not in reg
+
+    with pytest.raises(SignalError):
+        reg.register_signal(Signal(name='orders.*'))
+    with pytest.raises(SignalError):
+        reg.register_signal(Signal(), 'orders.created')
+
+
+def test_topic_own_connections():
+
+    import gc
+
+    reg = TopicRegistry()
+    created = Signal(name='orders.created')
+    reg.register_signal(created)
+    called = []
+
+    def direct(*args):
+        called.append(('direct',) + args)
+
+    created.connect(direct)
+    reg.subscribe('orders.*', direct)
+    reg.unsubscribe('orders.*', direct)
+    # it was connected before the subscription
+    created.notify(1)
+    assert called == [('direct', 1)]
+
+    def temporary(*args):
+        called.append(('temporary',) + args)
+
+    reg.subscribe('orders.**', temporary)
+    assert 'orders' in reg._patterns.children
+    del temporary
+    gc.collect()
+    assert not reg._patterns.children
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# :Project: metapensiero.signal -- tracing tests
+# :Created: lun 19 ott 2026 03:14:27 CEST
+# :Author:  Alberto Berti <alberto@metapensiero.it>
+# :License: GNU General Public License version 3 or later
+#
+
+import asyncio
+import json
+import os
+import tempfile
+
+import pytest
+
+from metapensiero.signal import Signal
+from metapensiero.signal.tracing import Tracer
+
+
+# All test coroutines will be treated as marked
+pytestmark = pytest.mark.asyncio()
+
+
+async def test_tracer():
+
+    outer = Signal(name='outer')
+    inner = Signal(name='inner')
+
+    def sync_handler(value):
+        inner.notify(value)
+
+    async def async_handler(value):
+        await asyncio.sleep(0.001)
+        inner.notify(value)
+
+    def inner_handler(value):
+        pass
+
+    outer.connect(sync_handler)
+    outer.connect(async_handler)
+    inner.connect(inner_handler)
+
+    with Tracer() as tracer:
+        await outer.notify(1)
+    await outer.notify(2)
+
+    events = tracer.events
+    spans = {e['args']['span']: e for e in events if e['ph'] == 'X'}
+    by_name = {}
+    for e in spans.values():
+        by_name.setdefault(e['name'], []).append(e)
+    assert len(by_name['outer']) == 1
+    assert len(by_name['inner']) == 2
+    assert len(by_name['test_tracer.<locals>.inner_handler']) == 2
+    outer_span = by_name['outer'][0]['args']['span']
+    sync_span = by_name['test_tracer.<locals>.sync_handler'][0]
+    assert sync_span['args']['parent'] == outer_span
+    # the notification made by the synchronous handler is nested in it
+    parents = sorted(e['args']['parent'] for e in by_name['inner'])
+    async_span = by_name['test_tracer.<locals>.async_handler'][0]
+    assert parents == sorted([sync_span['args']['span'],
+                              async_span['args']['span']])
+    # the completion of the asynchronous handler
+    completion = [e for e in events if e['cat'] == 'completion']
+    assert [e['ph'] for e in completion] == ['b', 'e']
+    assert completion[0]['id'] == async_span['args']['span']
+
+    path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+    tracer.write(path)
+    with open(path) as f:
+        data = json.load(f)
+    assert len(data['traceEvents']) == len(events)
+
+
+async def test_tracer_with_other_recorders():
+
+    from metapensiero.signal.replay import HandlerTimer
+    from metapensiero.signal.utils import Executor
+
+    asignal = Signal(name='keyed', key_arg='key')
+
+    def keyed(value, key):
+        pass
+
+    asignal.connect(keyed, key=1)
+
+    with Tracer() as tracer:
+        with HandlerTimer() as timer:
+            assert Executor.recorders == (tracer, timer)
+            await asignal.notify(1, key=1)
+        assert Executor.recorders == (tracer,)
+    assert Executor.recorders == ()
+    name = 'test_tracer_with_other_recorders.<locals>.keyed'
+    # the handlers selected by key are nested in the selection
+    assert [e['name'] for e in tracer.events if e['cat'] == 'handler'] == [
+        name, 'Signal._exec_selected']
+    assert len(timer.latencies[name]) == 1
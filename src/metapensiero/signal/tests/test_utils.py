@@ -6,10 +6,14 @@
 #
 
 import asyncio
+import contextvars
 
 import pytest
 
-from metapensiero.signal.utils import Executor, ExecutionError, MultipleResults
+from metapensiero.signal.utils import (ChunkedResults, Executor,
+                                       ExecutionError, MultipleResults,
+                                       NoResult, ResultPolicy, SignalError,
+                                       dependency_levels, start_eagerly)
 
 
 # All test coroutines will be treated as marked
@@ -66,3 +70,229 @@ async def test_executor_signature():
     assert exc_info.match('validation.*failed')
     assert d['sub_called'] is False
     assert d['valid_called'] is True
+
+
+async def test_executor_discard_results():
+
+    called = []
+
+    def sync_handler(arg):
+        called.append(arg)
+        return 'sync'
+
+    async def async_handler(arg):
+        called.append(arg)
+        return 'async'
+
+    ex = Executor([sync_handler], collect_results=False)
+    mr = ex.run('a')
+    assert mr.done is True
+    assert mr.results == ()
+    assert await mr == ()
+    # the empty results are shared
+    assert ex.run('b') is mr
+
+    ex = Executor([sync_handler, async_handler], collect_results=False)
+    mr = ex.run('c')
+    assert mr.done is False
+    assert mr.discard is True
+    assert await mr == ()
+    assert called == ['a', 'b', 'c', 'c']
+    # awaiting again is harmless
+    assert await mr == ()
+
+
+async def test_executor_result_policies():
+
+    called = []
+
+    def make(name, value):
+        def handler(arg):
+            called.append(name)
+            return value
+        return handler
+
+    def make_async(name, value):
+        async def handler(arg):
+            called.append(name)
+            await asyncio.sleep(0.001 if value else 0.01)
+            return value
+        return handler
+
+    handlers = [make('none', None), make('noresult', NoResult),
+                make('zero', 0), make('one', 1), make('two', 2)]
+
+    mr = Executor(handlers, policy=ResultPolicy.FIRST).run('a')
+    assert mr.done
+    assert mr.value == 0
+    assert await mr == 0
+    assert called == ['none', 'noresult', 'zero']
+
+    del called[:]
+    mr = Executor(handlers, policy=ResultPolicy.UNTIL_TRUE).run('a')
+    assert mr.value is True
+    assert called == ['none', 'noresult', 'zero', 'one']
+
+    del called[:]
+    mr = Executor(handlers, policy=ResultPolicy.UNTIL_FALSE).run('a')
+    assert mr.value is False
+    assert called == ['none', 'noresult', 'zero']
+
+    mr = Executor(handlers, policy=ResultPolicy.REDUCE,
+                  freduce=lambda acc, v: acc + [v],
+                  reduce_initial=[]).run('a')
+    assert mr.results == ([0, 1, 2],)
+
+    with pytest.raises(ExecutionError):
+        Executor(handlers, policy=ResultPolicy.REDUCE)
+
+    # sequentially the following handlers wait for the asynchronous ones
+    del called[:]
+    handlers = [make_async('a0', 0), make('s1', 1), make_async('a2', 2)]
+    mr = Executor(handlers, policy=ResultPolicy.UNTIL_TRUE).run('a')
+    assert not mr.done
+    assert await mr is True
+    assert called == ['a0', 's1']
+
+    # concurrently the pending ones are cancelled once decided
+    del called[:]
+    handlers = [make_async('slow', 0), make_async('fast', 3)]
+    mr = Executor(handlers, policy=ResultPolicy.FIRST,
+                  concurrent=True).run('a')
+    assert await mr == 3
+    assert called == ['slow', 'fast']
+    # a synchronous outcome discards the awaitables
+    handlers = [make_async('slow', 0), make('s1', 1)]
+    mr = Executor(handlers, policy=ResultPolicy.FIRST,
+                  concurrent=True).run('a')
+    assert mr.done
+    assert mr.value == 1
+
+
+async def test_executor_chunked():
+
+    called = []
+
+    def make(value):
+        def handler(arg):
+            called.append(value)
+            return value
+        return handler
+
+    async def ahandler(arg):
+        return 'async'
+
+    handlers = [make(i) for i in range(10)] + [ahandler]
+    ticks = []
+    loop = asyncio.get_event_loop()
+    loop.call_soon(lambda: ticks.append(len(called)))
+    mr = Executor(handlers, chunk_size=4).run('a')
+    assert isinstance(mr, ChunkedResults)
+    # only the first chunk has been executed
+    assert called == [0, 1, 2, 3]
+    res = await mr
+    assert res == tuple(range(10)) + ('async',)
+    assert mr.done and mr.results == res
+    # the loop has run between the first chunk and the second
+    assert ticks == [4]
+
+    # a single chunk completes immediately
+    mr = Executor(handlers[:3], chunk_size=4).run('a')
+    assert mr.done
+    assert mr.results == (0, 1, 2)
+
+    # the chunks are executed even without awaiting
+    del called[:]
+    Executor(handlers[:10], chunk_time=0, collect_results=False).run('a')
+    assert called == [0]
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert called == list(range(10))
+
+
+async def test_executor_levels():
+
+    assert dependency_levels([('a', (), ()), ('b', ('a',), ()),
+                              ('c', (), ('a',)), ('d', (), ())]) == [
+        [2, 3], [0], [1]]
+    # unknown names are ignored
+    assert dependency_levels([('a', ('x',), ('y',))]) == [[0]]
+    with pytest.raises(SignalError):
+        dependency_levels([('a', ('b',), ()), ('b', ('a',), ())])
+
+    running = []
+    events = []
+
+    def make_async(name):
+        async def handler(arg):
+            running.append(name)
+            events.append(('start', name, len(running)))
+            await asyncio.sleep(0.001)
+            running.remove(name)
+            return name
+        return handler
+
+    def sync(arg):
+        events.append(('sync', len(running)))
+        return 'sync'
+
+    handlers = [make_async('a'), make_async('b'), sync, make_async('c')]
+    mr = Executor(handlers, levels=[[0, 1], [2, 3]]).run(1)
+    assert isinstance(mr, ChunkedResults)
+    assert await mr == ('a', 'b', 'sync', 'c')
+    # a and b run together, the second level only after both completed
+    assert events == [('start', 'a', 1), ('start', 'b', 2), ('sync', 0),
+                      ('start', 'c', 1)]
+
+    # synchronous levels complete immediately
+    mr = Executor([sync, sync], levels=[[1], [0]]).run(1)
+    assert mr.done and mr.results == ('sync', 'sync')
+
+
+async def test_start_eagerly():
+
+    var = contextvars.ContextVar('var', default=None)
+    steps = []
+
+    async def immediate(value):
+        steps.append('immediate')
+        return value
+
+    async def suspending(value):
+        var.set(value)
+        steps.append('before')
+        await asyncio.sleep(0.001)
+        steps.append('after')
+        # the context is kept across the steps
+        assert var.get() == value
+        return value * 2
+
+    async def failing():
+        raise ValueError()
+
+    assert start_eagerly(immediate(1)) == 1
+    assert steps == ['immediate']
+    task = start_eagerly(suspending(2))
+    assert steps == ['immediate', 'before']
+    # the context of the caller isn't touched
+    assert var.get() is None
+    assert isinstance(task, asyncio.Future)
+    assert await task == 4
+    assert steps[-1] == 'after'
+    with pytest.raises(ValueError):
+        start_eagerly(failing())
+
+    # a suspended one can be cancelled
+    task = start_eagerly(suspending(3))
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    mr = Executor([immediate, immediate], concurrent=True,
+                  eager=True).run(5)
+    assert mr.done
+    assert mr.results == (5, 5)
+    mr = Executor([immediate, suspending], concurrent=True,
+                  eager=True).run(5)
+    assert not mr.done
+    assert await mr == (5, 10)
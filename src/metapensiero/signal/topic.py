@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- topic based signal registry
+# :Created:   dom 18 ott 2026 10:12:31 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+from functools import partial
+
+from .utils import SignalError
+from .weak import MethodAwareWeakList
+
+
+SEPARATOR = '.'
+"The separator between the segments of a signal name."
+
+ONE = '*'
+"The wildcard segment that matches exactly one segment."
+
+ANY = '**'
+"The wildcard segment that matches zero or more segments."
+
+
+class _Node:
+    """A node of a trie indexed by name segments."""
+
+    __slots__ = ('children', 'name', 'value')
+
+    def __init__(self):
+        self.children = {}
+        self.name = None
+        self.value = None
+
+    def find(self, segments, create=False):
+        node = self
+        for seg in segments:
+            child = node.children.get(seg)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[seg] = _Node()
+            node = child
+        return node
+
+    def descendants(self):
+        """Yield this node and all the ones below it."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children.values())
+
+    def prune(self, segments):
+        """Remove the empty nodes along the path of `segments`."""
+        if not segments:
+            return
+        child = self.children.get(segments[0])
+        if child is not None:
+            child.prune(segments[1:])
+            if child.value is None and not child.children:
+                del self.children[segments[0]]
+
+
+class _PatternHandlers(MethodAwareWeakList):
+    """The handlers subscribed with a pattern, that calls `prune` when it
+    becomes empty, also because they have been garbage collected."""
+
+    def __init__(self, prune):
+        super().__init__()
+        self.prune = prune
+
+    def remove_all(self, item):
+        super().remove_all(item)
+        if not len(self):
+            self.prune()
+
+
+class TopicRegistry:
+    """A registry that indexes signals by their dotted name and allows to
+    connect handlers to all the signals whose name matches a *pattern*.
+
+    A pattern is a dotted name where a segment can be ``*``, that matches
+    exactly one segment, or ``**``, that matches zero or more segments. So
+    ``orders.*`` matches ``orders.created`` but not ``orders.item.added``,
+    while ``*.deleted`` matches ``orders.deleted`` and ``orders.**`` matches
+    all of them.
+
+    Patterns are resolved when a signal is registered or when a handler is
+    subscribed, by connecting the handler to every matching signal: the
+    notification of a signal doesn't pay anything for the pattern matching.
+
+    Names and patterns are kept in two tries, so that resolving a new signal
+    against the registered patterns costs proportionally to the depth of its
+    name and resolving a new pattern only visits the matching branches of the
+    names.
+
+    The registry keeps track of the connections it makes and it removes only
+    those, so a handler that was already connected to a signal stays
+    connected when it's unsubscribed.
+    """
+
+    def __init__(self):
+        self._signals = _Node()
+        self._patterns = _Node()
+        self._names = {}
+        self._connected = {}
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __getitem__(self, name):
+        return self._names[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def _match_names(self, node, segments):
+        """Yield the nodes of the signal trie matched by the pattern
+        `segments`."""
+        if not segments:
+            if node.value is not None:
+                yield node
+            return
+        seg, rest = segments[0], segments[1:]
+        if seg == ANY:
+            for desc in node.descendants():
+                yield from self._match_names(desc, rest)
+        elif seg == ONE:
+            for child in node.children.values():
+                yield from self._match_names(child, rest)
+        else:
+            child = node.children.get(seg)
+            if child is not None:
+                yield from self._match_names(child, rest)
+
+    def _match_patterns(self, node, segments):
+        """Yield the nodes of the pattern trie that match the name
+        `segments`."""
+        any_node = node.children.get(ANY)
+        if any_node is not None:
+            # ``**`` can swallow any number of the remaining segments
+            for ix in range(len(segments) + 1):
+                yield from self._match_patterns(any_node, segments[ix:])
+        if not segments:
+            if node.value is not None:
+                yield node
+            return
+        seg, rest = segments[0], segments[1:]
+        for key in (seg, ONE):
+            child = node.children.get(key)
+            if child is not None:
+                yield from self._match_patterns(child, rest)
+
+    def _names_for(self, segments):
+        """Return the nodes of the signals matched by the pattern
+        `segments`, each one only once."""
+        # a name can be reached more than once by patterns containing
+        # ``**``
+        nodes = self._match_names(self._signals, segments)
+        return list({id(n): n for n in nodes}.values())
+
+    def _patterns_for(self, segments):
+        """Return the nodes of the patterns matching the name `segments`,
+        each one only once."""
+        nodes = self._match_patterns(self._patterns, segments)
+        return list({id(n): n for n in nodes}.values())
+
+    def _connect(self, name, signal, cback):
+        """Connect `cback` to `signal`, unless it's already connected, and
+        keep track of it."""
+        if cback in signal.subscribers:
+            return
+        signal.connect(cback)
+        connected = self._connected.get(name)
+        if connected is None:
+            connected = self._connected[name] = MethodAwareWeakList()
+        connected.append(cback)
+
+    def _disconnect(self, name, signal, cback):
+        """Disconnect `cback` from `signal` if the registry connected it."""
+        connected = self._connected.get(name)
+        if connected is not None and cback in connected:
+            connected.remove_all(cback)
+            signal.disconnect(cback)
+
+    def _prune_pattern(self, segments):
+        node = self._patterns.find(segments)
+        if node is not None and node.value is not None and not len(
+                node.value):
+            node.value = None
+            self._patterns.prune(segments)
+
+    def _split(self, name):
+        if not name:
+            raise SignalError("Empty names or patterns aren't allowed")
+        return tuple(name.split(SEPARATOR))
+
+    def matching(self, pattern):
+        """Return the signals whose name matches `pattern`."""
+        return [n.value for n in self._names_for(self._split(pattern))]
+
+    def register_signal(self, signal, name=None):
+        """Index `signal` with the given `name` or with its own one and
+        connect to it the handlers of all the matching patterns.
+
+        :param signal: a `~.core.Signal`:class: instance
+        :param str name: an optional name, defaults to ``signal.name``
+        """
+        if name is None:
+            name = signal.name
+        if name is None:
+            raise SignalError("Cannot register a signal without a name")
+        segments = self._split(name)
+        if ONE in segments or ANY in segments:
+            raise SignalError("Wildcards aren't allowed in signal names")
+        node = self._signals.find(segments, create=True)
+        if node.value is not None and node.value is not signal:
+            raise SignalError("A signal named {!r} is already "
+                              "registered".format(name))
+        node.name = name
+        node.value = signal
+        self._names[name] = signal
+        for pnode in self._patterns_for(segments):
+            for cback in pnode.value:
+                self._connect(name, signal, cback)
+
+    def unregister_signal(self, name):
+        """Remove the signal registered with `name`. The handlers connected
+        by the patterns are disconnected from it."""
+        signal = self._names.pop(name)
+        segments = self._split(name)
+        for pnode in self._patterns_for(segments):
+            for cback in pnode.value:
+                self._disconnect(name, signal, cback)
+        self._connected.pop(name, None)
+        node = self._signals.find(segments)
+        node.name = node.value = None
+        self._signals.prune(segments)
+        return signal
+
+    def subscribe(self, pattern, cback):
+        """Connect `cback` to all the signals, present and future, whose name
+        matches `pattern`.
+
+        Like with `~.core.Signal.connect`:meth: only a weak reference to
+        `cback` is kept, and the subscription is removed when it's garbage
+        collected.
+
+        :param str pattern: a dotted name optionally containing wildcards
+        :param cback: the handler
+        """
+        segments = self._split(pattern)
+        node = self._patterns.find(segments, create=True)
+        if node.value is None:
+            node.value = _PatternHandlers(partial(self._prune_pattern,
+                                                  segments))
+        if cback not in node.value:
+            node.value.append(cback)
+        for snode in self._names_for(segments):
+            self._connect(snode.name, snode.value, cback)
+
+    def unsubscribe(self, pattern, cback):
+        """Disconnect `cback` previously subscribed with `pattern` from all
+        the matching signals."""
+        segments = self._split(pattern)
+        node = self._patterns.find(segments)
+        if node is None or node.value is None or cback not in node.value:
+            return
+        # prunes the node when it's the last one
+        node.value.remove_all(cback)
+        for snode in self._names_for(segments):
+            # keep it connected if another pattern still matches
+            if not any(cback in pnode.value for pnode in
+                       self._patterns_for(self._split(snode.name))):
+                self._disconnect(snode.name, snode.value, cback)
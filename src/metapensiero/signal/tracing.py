@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# :Project:   metapensiero.signal -- tracing of the notifications
+# :Created:   lun 19 ott 2026 02:48:15 CEST
+# :Author:    Alberto Berti <alberto@metapensiero.it>
+# :License:   GNU General Public License version 3 or later
+# :Copyright: © 2026 Alberto Berti
+#
+
+import contextvars
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+
+from .recording import notification_name
+from .utils import Executor, MultipleResults
+
+
+_SPAN = contextvars.ContextVar('span', default=None)
+
+
+class Tracer:
+    """Traces the notifications, the execution of each handler and the
+    completion of the asynchronous ones, to be inspected with `Perfetto`__
+    or ``chrome://tracing``:
+
+    .. code:: python
+
+      with Tracer() as tracer:
+          await handle_request()
+      tracer.write('request.json')
+
+    Once installed, it's called by every `~.utils.Executor`:class: around
+    the execution and each handler, like a `~.recording.Recorder`:class:,
+    that can be installed at the same time, so it costs nothing when it
+    isn't. The notifications and the synchronous part of the handlers are
+    written as complete events, the completions of the asynchronous
+    handlers as async events, with their own track. Every
+    event has the id of its span and of the enclosing one, tracked by a
+    context variable, so that the notifications made by the handlers, even
+    the asynchronous ones, can be related to them.
+
+    __ https://ui.perfetto.dev
+
+    :keyword int max_events: the maximum number of events kept, the
+      following are counted in `dropped`
+    """
+
+    def __init__(self, *, max_events=1000000):
+        self.max_events = max_events
+        self.events = []
+        """The trace events collected."""
+        self.dropped = 0
+        """The number of events discarded because `max_events` was
+        reached."""
+        self._ids = itertools.count(1)
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.uninstall()
+
+    def _now(self):
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _event(self, event):
+        if len(self.events) < self.max_events:
+            event['pid'] = self._pid
+            event['tid'] = threading.get_ident()
+            self.events.append(event)
+        else:
+            self.dropped += 1
+
+    def record_call(self, name, call, args, kwargs):
+        """Execute a handler, tracing it."""
+        span = next(self._ids)
+        parent = _SPAN.get()
+        token = _SPAN.set(span)
+        start = self._now()
+        try:
+            result = call(*args, **kwargs)
+        finally:
+            _SPAN.reset(token)
+            self._event({'name': name, 'cat': 'handler', 'ph': 'X',
+                         'ts': start, 'dur': self._now() - start,
+                         'args': {'span': span, 'parent': parent}})
+        if inspect.isawaitable(result) and not (
+                isinstance(result, MultipleResults) and result.done):
+            return self._complete(result, name, span)
+        return result
+
+    async def _complete(self, awaitable, name, span):
+        token = _SPAN.set(span)
+        event = {'name': name, 'cat': 'completion', 'id': span}
+        self._event(dict(event, ph='b', ts=self._now(),
+                         args={'span': span}))
+        try:
+            return await awaitable
+        finally:
+            self._event(dict(event, ph='e', ts=self._now()))
+            _SPAN.reset(token)
+
+    def clear(self):
+        """Discard the events collected."""
+        self.events = []
+        self.dropped = 0
+
+    def install(self):
+        """Start tracing the notifications."""
+        Executor.add_recorder(self)
+
+    def record_run(self, executor, args, kwargs, run):
+        """Execute the handlers of `executor` calling `run`, tracing it."""
+        name = notification_name(executor) or repr(executor.owner)
+        span = next(self._ids)
+        parent = _SPAN.get()
+        token = _SPAN.set(span)
+        start = self._now()
+        try:
+            return run()
+        finally:
+            _SPAN.reset(token)
+            self._event({'name': name, 'cat': 'notify', 'ph': 'X',
+                         'ts': start, 'dur': self._now() - start,
+                         'args': {'span': span, 'parent': parent}})
+
+    def uninstall(self):
+        """Stop tracing."""
+        Executor.remove_recorder(self)
+
+    def write(self, path):
+        """Write the events to `path` in the Chrome trace event format."""
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.events,
+                       'displayTimeUnit': 'ms'}, f)
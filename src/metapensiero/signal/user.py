@@ -9,10 +9,11 @@
 from abc import ABCMeta
 from collections import ChainMap, defaultdict
 from functools import partial
-from weakref import WeakSet
+from weakref import WeakKeyDictionary, WeakSet
 
+from .cache import CachedHandler
 from .external import ExternalSignallerAndHandler
-from .utils import SignalError, SignalOptions
+from .utils import SignalError, SignalOptions, handler_names
 
 
 SPEC_CONTAINER_MEMBER_NAME = '_publish'
@@ -20,7 +21,9 @@ SPEC_CONTAINER_MEMBER_NAME = '_publish'
 
 
 class SignalNameHandlerDecorator(object):
-    "A decorator used to mark a method as handler for a particular signal."
+    """A decorator used to mark a method as handler for a particular signal.
+    The configuration can contain the ``cache``, ``after`` and ``before``
+    keys, see `~.core.Signal.connect`:meth:."""
 
     def __init__(self, signal_name, **config):
         self.signal_name = signal_name
@@ -97,6 +100,17 @@ class SignalAndHandlerInitMeta(InheritanceToolsMeta):
     _signal_handlers_configs = None
     """Container for additional handler config."""
 
+    _signal_handlers_caches = None
+    """Contains a Dict[handler_name, cache_spec] of the handlers whose
+    results are cached."""
+
+    _signal_handlers_dependencies = None
+    """Contains a Dict[handler_name, (after, before)] of the handlers
+    declared with dependencies."""
+
+    _cached_handlers = WeakKeyDictionary()
+    """Contains a Dict[handler_name, CachedHandler] per instance."""
+
     _registered_classes = WeakSet()
     """Store a weak ref of the classes already managed."""
 
@@ -130,6 +144,16 @@ class SignalAndHandlerInitMeta(InheritanceToolsMeta):
         cls._signals = signals
         cls._signal_handlers = handlers
         cls._signal_handlers_configs = configs
+        cls._signal_handlers_caches = {
+            hname: config['cache'] for hname, config in configs.items()
+            if hname in handlers and
+            config.get('cache') not in (None, False)}
+        cls._signal_handlers_dependencies = {
+            hname: (handler_names(config.get('after')),
+                    handler_names(config.get('before')))
+            for hname, config in configs.items()
+            if hname in handlers and (config.get('after') or
+                                      config.get('before'))}
 
     def _build_instance_handler_mapping(cls, instance, handle_d):
         """For every unbound handler, get the bound version."""
@@ -191,7 +215,31 @@ class SignalAndHandlerInitMeta(InheritanceToolsMeta):
         """Returns the handlers registered at class level.
         """
         handlers = cls._signal_handlers_sorted[signal_name]
-        return [getattr(instance, hname) for hname in handlers]
+        if not cls._signal_handlers_caches:
+            return [getattr(instance, hname) for hname in handlers]
+        return [cls._get_cached_handler(instance, hname)
+                if hname in cls._signal_handlers_caches
+                else getattr(instance, hname) for hname in handlers]
+
+    def _get_cached_handler(cls, instance, hname):
+        """Returns the `~.cache.CachedHandler` of a class handler declared
+        with the ``cache`` option, creating it the first time."""
+        cached = cls._cached_handlers.get(instance)
+        if cached is None:
+            cached = cls._cached_handlers[instance] = {}
+        result = cached.get(hname)
+        if result is None:
+            result = cached[hname] = CachedHandler(
+                getattr(instance, hname), cls._signal_handlers_caches[hname])
+        return result
+
+    def _get_handler_cache(cls, instance, method):
+        """Returns the `~.cache.ResultCache` of a class handler, given the
+        bound method, or ``None``."""
+        hname = getattr(method, '__name__', None)
+        if hname not in (cls._signal_handlers_caches or ()):
+            return None
+        return cls._get_cached_handler(instance, hname).cache
 
     def _sort_handlers(cls, signals, handlers, configs):
         """Sort class defined handlers to give precedence to those declared at
@@ -8,9 +8,14 @@
 
 from collections.abc import Awaitable
 import asyncio
+import contextvars
 from enum import Enum
+from functools import partial
 import inspect
 import logging
+import sys
+import time
+import types
 import weakref
 
 
@@ -33,16 +38,70 @@ class Executor:
       the arguments passed to `~.run()`. If the args aren't compatible with
       the signature of such callable or if the callable returns ``False``
       execution will be aborted by raising an `~.ExecutionError`
+    :keyword bool collect_results: a flag indicating if the executor should
+      collect the values returned by the endpoints. When ``False`` only the
+      awaitables are kept, to be awaited, and the final results are always
+      empty. ``True`` by default
+    :keyword instance: the optional instance the notification is made on
+    :keyword policy: an optional `ResultPolicy`:class: that aggregates the
+      values returned by the endpoints into an `AggregatedResults`:class:,
+      stopping the execution as soon as the outcome is decided
+    :keyword freduce: the function used by the `ResultPolicy.REDUCE`
+      policy
+    :keyword reduce_initial: the initial value of the accumulator of the
+      `ResultPolicy.REDUCE` policy
+    :keyword int chunk_size: if given, the endpoints are executed in chunks
+      of at most this size, see `exec_chunked`:meth:
+    :keyword float chunk_time: if given, the endpoints are executed in
+      chunks that last at most this number of seconds, see
+      `exec_chunked`:meth:
+    :keyword levels: an optional sequence of lists of indexes of the
+      endpoints, see `exec_levels`:meth: and `dependency_levels`:func:
+    :keyword bool eager: if ``True``, and `concurrent` is ``True`` too, the
+      coroutines returned by the endpoints are started immediately, see
+      `start_eagerly`:func:
+
+    The executor isn't changed by the executions, so it can be reused for
+    many of them, see `~.core.Signal.notify`:meth:.
     """
 
+    __slots__ = ('owner', 'instance', 'policy', 'freduce', 'reduce_initial',
+                 'endpoints', 'concurrent', 'loop', 'exec_wrapper',
+                 'adapt_params', 'collect_results', 'chunk_size',
+                 'chunk_time', 'levels', 'fvalidation', 'eager',
+                 '_recorded')
+
+    recorders = ()
+    """The objects installed with `add_recorder`:meth:, that observe the
+    executions, see `~.recording.Recorder`:class:."""
+
     def __init__(self, endpoints, *, owner=None, concurrent=False, loop=None,
-                 exec_wrapper=None, adapt_params=True, fvalidation=None):
+                 exec_wrapper=None, adapt_params=True, fvalidation=None,
+                 collect_results=True, instance=None, policy=None,
+                 freduce=None, reduce_initial=None, chunk_size=None,
+                 chunk_time=None, levels=None, eager=False):
         self.owner = owner
+        self.instance = instance
+        if policy is not None:
+            if not isinstance(policy, ResultPolicy):
+                raise ExecutionError("``policy`` must be an instance of "
+                                     "`ResultPolicy`")
+            if policy is ResultPolicy.REDUCE and freduce is None:
+                raise ExecutionError("The reduce policy needs ``freduce``")
+        self.policy = policy
+        self.freduce = freduce
+        self.reduce_initial = reduce_initial
         self.endpoints = list(endpoints)
         self.concurrent = concurrent
         self.loop = loop
         self.exec_wrapper = exec_wrapper
         self.adapt_params = adapt_params
+        self.collect_results = collect_results
+        self.chunk_size = chunk_size
+        self.chunk_time = chunk_time
+        self.levels = levels
+        self.eager = eager and concurrent
+        self._recorded = None
         if fvalidation is None:
             self.fvalidation = None
         else:
@@ -51,6 +110,36 @@ class Executor:
             else:
                 raise ExecutionError("Wrong value for ``fvalidation``")
 
+    @classmethod
+    def add_recorder(cls, recorder):
+        """Install `recorder`, that will observe every execution. Its
+        ``record_run(executor, args, kwargs, run)`` method is called in
+        place of the execution and must call ``run()`` to actually execute
+        it. Its ``record_call(name, call, args, kwargs)`` method is called in
+        place of each endpoint, with the arguments already adapted to it,
+        and must return ``call(*args, **kwargs)``. Many recorders can be
+        installed, the first being the outermost."""
+        if recorder in cls.recorders:
+            raise ExecutionError("The recorder is already installed")
+        cls.recorders = cls.recorders + (recorder,)
+
+    @classmethod
+    def remove_recorder(cls, recorder):
+        """Uninstall `recorder`, if it's installed."""
+        cls.recorders = tuple(r for r in cls.recorders if r is not recorder)
+
+    def replace(self, **changes):
+        """Return a copy of this executor with some attributes changed."""
+        new = object.__new__(type(self))
+        for name in Executor.__slots__:
+            if name != '_recorded':
+                setattr(new, name, changes.pop(name, getattr(self, name)))
+        new._recorded = None
+        if changes:
+            raise ExecutionError("Unknown attributes {}".format(
+                ', '.join(sorted(changes))))
+        return new
+
     def _adapt_call_params(self, func, args, kwargs):
         signature = inspect.signature(func, follow_wrapped=False)
         if (not inspect.ismethod(func) and
@@ -70,7 +159,21 @@ class Executor:
     def exec_all_endpoints(self, *args, **kwargs):
         """Execute each passed endpoint and collect the results. If a result
         is anoter `MultipleResults` it will extend the results with those
-        contained therein. If the result is `NoResult`, skip the addition."""
+        contained therein, once they are available. If the result is
+        `NoResult`, skip the addition.
+
+        A `policy`, the `levels` and the chunking exclude each other, while
+        the eager start applies to all of them."""
+        if self.policy is not None:
+            return self._exec_aggregating(args, kwargs)
+        if self.levels is not None:
+            return self.exec_levels(*args, **kwargs)
+        if self.chunk_size is not None or self.chunk_time is not None:
+            return self.exec_chunked(*args, **kwargs)
+        if self.eager:
+            return self._exec_eagerly(args, kwargs)
+        if not self.collect_results:
+            return self._exec_all_discarding(args, kwargs)
         results = []
         for handler in self.endpoints:
             if isinstance(handler, weakref.ref):
@@ -83,12 +186,211 @@ class Executor:
             if isinstance(res, MultipleResults):
                 if res.done:
                     results += res.results
-                else:
+                elif _is_plain(res):
                     results += res._results
+                else:
+                    # its values are spliced once it completes
+                    results.append(res)
             elif res is not NoResult:
                 results.append(res)
         return MultipleResults(results, concurrent=self.concurrent, owner=self)
 
+    def _exec_eagerly(self, args, kwargs):
+        """Like `exec_all_endpoints` but starts the coroutines returned by
+        the endpoints immediately, keeping only those that didn't complete
+        synchronously."""
+        results = []
+        self._exec_chunk(iter(self.endpoints), args, kwargs, results)
+        return self._chunks_results(results)
+
+    def _exec_all_discarding(self, args, kwargs):
+        """Like `exec_all_endpoints` but keeps just the awaitables. If there
+        are none, no new `MultipleResults` is created."""
+        pending = None
+        for handler in self.endpoints:
+            if isinstance(handler, weakref.ref):
+                handler = handler()
+            if self.adapt_params:
+                bind = self._adapt_call_params(handler, args, kwargs)
+                res = handler(*bind.args, **bind.kwargs)
+            else:
+                res = handler(*args, **kwargs)
+            # most of the synchronous handlers return nothing, skip the
+            # more expensive checks for them
+            if res is None or res is NoResult:
+                continue
+            if isinstance(res, MultipleResults) and res.done:
+                continue
+            if inspect.isawaitable(res):
+                if pending is None:
+                    pending = []
+                pending.append(res)
+        if pending is None:
+            return NO_RESULTS
+        return MultipleResults(pending, concurrent=self.concurrent,
+                               owner=self, discard=True)
+
+    def _call_endpoint(self, handler, args, kwargs):
+        if isinstance(handler, weakref.ref):
+            handler = handler()
+        if self.adapt_params:
+            bind = self._adapt_call_params(handler, args, kwargs)
+            return handler(*bind.args, **bind.kwargs)
+        return handler(*args, **kwargs)
+
+    def _exec_aggregating(self, args, kwargs):
+        """Like `exec_all_endpoints` but feeds the results to an aggregator
+        as soon as they are available, stopping when the outcome is
+        decided."""
+        aggregator = _Aggregator(self.policy, self.freduce,
+                                 self.reduce_initial)
+        endpoints = iter(self.endpoints)
+        pending = []
+        for handler in endpoints:
+            res = self._call_endpoint(handler, args, kwargs)
+            if self.eager and inspect.iscoroutine(res):
+                res = start_eagerly(res, self.loop)
+            if _is_pending(res):
+                if not self.concurrent:
+                    # the next handlers are called once this completes
+                    return AggregatedResults(
+                        aggregator, [res], resume=(self, endpoints, args,
+                                                   kwargs),
+                        owner=self)
+                pending.append(res)
+            elif aggregator.feed_result(res):
+                _discard(pending)
+                pending = []
+                break
+        return AggregatedResults(aggregator, pending, concurrent=True,
+                                 owner=self)
+
+    def _exec_chunk(self, endpoints, args, kwargs, results, size=None,
+                    budget=None):
+        """Execute the endpoints until the chunk is complete, returning
+        ``False`` when there are no more of them."""
+        if budget is not None:
+            deadline = time.perf_counter() + budget
+        count = 0
+        collect = self.collect_results
+        eager = self.eager
+        for handler in endpoints:
+            res = self._call_endpoint(handler, args, kwargs)
+            if eager and inspect.iscoroutine(res):
+                res = start_eagerly(res, self.loop)
+            if isinstance(res, MultipleResults):
+                if res.done:
+                    if collect:
+                        results += res.results
+                elif collect and _is_plain(res):
+                    results += res._results
+                else:
+                    results.append(res)
+            elif res is not NoResult:
+                if collect or inspect.isawaitable(res):
+                    results.append(res)
+            count += 1
+            if ((size is not None and count >= size) or
+                (budget is not None and time.perf_counter() >= deadline)):
+                return True
+        return False
+
+    async def _exec_remaining_chunks(self, endpoints, args, kwargs, results):
+        try:
+            while True:
+                # let the loop run the other callbacks
+                await asyncio.sleep(0)
+                if not self._exec_chunk(endpoints, args, kwargs, results,
+                                        self.chunk_size, self.chunk_time):
+                    break
+        except Exception as e:
+            if __debug__:
+                logger.exception("Error while executing handlers")
+            else:
+                logger.error("Error while executing handlers")
+            raise ExecutionError("Error while executing handlers") from e
+        return self._chunks_results(results)
+
+    def _chunks_results(self, results):
+        if self.collect_results:
+            return MultipleResults(results, concurrent=self.concurrent,
+                                   owner=self)
+        elif results:
+            return MultipleResults(results, concurrent=self.concurrent,
+                                   owner=self, discard=True)
+        return NO_RESULTS
+
+    def exec_chunked(self, *args, **kwargs):
+        """Like `exec_all_endpoints` but executes the endpoints in chunks,
+        limited by `chunk_size` or `chunk_time`, to avoid blocking the loop
+        for too long when there are lots of them. The first chunk is
+        executed immediately and the others by a task, that lets the loop run
+        its other callbacks between a chunk and the next. In that case a
+        `ChunkedResults`:class: is returned, that completes when the last
+        chunk has been executed and the awaitables returned by the endpoints
+        have completed."""
+        endpoints = iter(self.endpoints)
+        results = []
+        if not self._exec_chunk(endpoints, args, kwargs, results,
+                                self.chunk_size, self.chunk_time):
+            return self._chunks_results(results)
+        task = asyncio.ensure_future(
+            self._exec_remaining_chunks(endpoints, args, kwargs, results),
+            loop=self.loop)
+        return ChunkedResults(task, owner=self)
+
+    def _exec_level(self, level, args, kwargs, results):
+        """Execute the endpoints of a level, returning the indexes of the
+        awaitables added to `results`."""
+        start = len(results)
+        self._exec_chunk(map(self.endpoints.__getitem__, level), args,
+                         kwargs, results)
+        return [ix for ix in range(start, len(results))
+                if inspect.isawaitable(results[ix])]
+
+    async def _exec_remaining_levels(self, pending, levels, args, kwargs,
+                                     results):
+        try:
+            while True:
+                values = await asyncio.gather(
+                    *[results[ix] for ix in pending])
+                if self.collect_results:
+                    results[:] = _store_values(results, pending, values)
+                else:
+                    del results[:]
+                level = next(levels, None)
+                if level is None:
+                    break
+                pending = self._exec_level(level, args, kwargs, results)
+        except Exception as e:
+            if __debug__:
+                logger.exception("Error while executing handlers")
+            else:
+                logger.error("Error while executing handlers")
+            raise ExecutionError("Error while executing handlers") from e
+        return self._chunks_results(results)
+
+    def exec_levels(self, *args, **kwargs):
+        """Like `exec_all_endpoints` but executes the endpoints level by
+        level, as specified by `levels`. The asynchronous endpoints of a
+        level are executed concurrently and the next level starts only when
+        they have all completed. If the first levels are completely
+        synchronous they are executed immediately, the others are executed
+        by a task, as for `exec_chunked`:meth:, and a
+        `ChunkedResults`:class: is returned. The results follow the order of
+        the levels."""
+        levels = iter(self.levels)
+        results = []
+        for level in levels:
+            pending = self._exec_level(level, args, kwargs, results)
+            if pending:
+                task = asyncio.ensure_future(
+                    self._exec_remaining_levels(pending, levels, args, kwargs,
+                                                results),
+                    loop=self.loop)
+                return ChunkedResults(task, owner=self)
+        return self._chunks_results(results)
+
     def run(self, *args, **kwargs):
         """Call all the registered handlers with the arguments passed.
         If this signal is a class member, call also the handlers registered
@@ -97,6 +399,57 @@ class Executor:
 
         :returns: an instance of `~.utils.MultipleResults`
         """
+        recorders = self.recorders
+        if recorders:
+            return self._run_recorded(recorders, args, kwargs)
+        return self._run(args, kwargs)
+
+    def _run_recorded(self, recorders, args, kwargs):
+        # the copy is reused like this executor, until the recorders change
+        recorded = self._recorded
+        if recorded is None or recorded[0] is not recorders:
+            recorded = self._recorded = (recorders, self.recorded(recorders))
+        executor = recorded[1]
+        run = partial(executor._run, args, kwargs)
+        for recorder in reversed(recorders):
+            run = partial(recorder.record_run, executor, args, kwargs, run)
+        return run()
+
+    def recorded(self, recorders):
+        """Return a copy of this executor whose endpoints are executed
+        through the ``record_call()`` method of the `recorders`, see
+        `add_recorder`:meth:."""
+        return self.replace(
+            endpoints=[self._recorded_endpoint(recorders, handler)
+                       for handler in self.endpoints],
+            adapt_params=False)
+
+    def _recorded_endpoint(self, recorders, endpoint):
+        if isinstance(endpoint, weakref.ref):
+            handler = endpoint()
+            if handler is None:
+                # garbage collected, keep its position for the levels
+                return _dead_endpoint
+            # the copy may be reused, don't keep the handler alive
+            call = partial(_call_ref, endpoint)
+        else:
+            handler = call = endpoint
+        name = _endpoint_name(handler)
+        for recorder in reversed(recorders):
+            call = _recorded_call(recorder.record_call, name, call)
+        if self.adapt_params:
+            return partial(self._call_adapted, endpoint, call)
+        return call
+
+    def _call_adapted(self, endpoint, call, *args, **kwargs):
+        if isinstance(endpoint, weakref.ref):
+            endpoint = endpoint()
+            if endpoint is None:
+                return NoResult
+        bind = self._adapt_call_params(endpoint, args, kwargs)
+        return call(*bind.args, **bind.kwargs)
+
+    def _run(self, args, kwargs):
         if self.fvalidation is not None:
             try:
                 if self.fvalidation(*args, **kwargs) is False:
@@ -147,6 +500,9 @@ class MultipleResults(Awaitable):
     :keyword concurrent: a flag indicating if the evaluation of the
       *awaitables* has to be done concurrently or sequentially
     :keyword owner: the optional creator instance
+    :keyword discard: a flag indicating that the iterable is a list
+      containing only awaitables whose values aren't needed. The final results
+      will be empty
     """
 
     results = None
@@ -161,11 +517,21 @@ class MultipleResults(Awaitable):
     owner = None
     """The optional creator of the instance passed in as a parameter, usually
     the `~.atom.Notifier` that created it."""
+    discard = False
+    """``True`` if the values of the awaitables are discarded."""
 
-    def __init__(self, iterable=None, *, concurrent=False, owner=None):
+    def __init__(self, iterable=None, *, concurrent=False, owner=None,
+                 discard=False):
         if owner is not None:
             self.owner = owner
         self.concurrent = concurrent
+        if discard:
+            # no need to copy or to scan it
+            self.discard = True
+            self.has_async = True
+            self._results = iterable
+            self._coro_ixs = range(len(iterable))
+            return
         self._results = list(iterable)
         self._coro_ixs = tuple(ix for ix, e in enumerate(self._results)
                                if inspect.isawaitable(e))
@@ -177,27 +543,284 @@ class MultipleResults(Awaitable):
             self.has_async = False
 
     def __await__(self):
-        task = self._completion_task(
-            map(self._results.__getitem__, self._coro_ixs),
-            concurrent=self.concurrent)
+        if self.done:
+            coro_iter = None
+        elif self.discard:
+            coro_iter = self._results
+        else:
+            coro_iter = map(self._results.__getitem__, self._coro_ixs)
+        task = self._completion_task(coro_iter, concurrent=self.concurrent)
         return task.__await__()
 
     async def _completion_task(self, coro_iter=None, concurrent=False):
-        if not self.done and coro_iter is not None:
-            if concurrent:
+        if self.done:
+            return self.results
+        if coro_iter is not None:
+            if self.discard:
+                if concurrent:
+                    await asyncio.gather(*coro_iter)
+                else:
+                    for coro in coro_iter:
+                        await coro
+                self._results = ()
+            elif concurrent:
                 results = await asyncio.gather(*coro_iter)
-                for ix, res in zip(self._coro_ixs, results):
-                    self._results[ix] = res
+                self._results = _store_values(self._results, self._coro_ixs,
+                                              results)
             else:
-                for ix, coro in zip(self._coro_ixs, coro_iter):
-                    res = await coro
-                    self._results[ix] = res
+                results = []
+                for coro in coro_iter:
+                    results.append(await coro)
+                self._results = _store_values(self._results, self._coro_ixs,
+                                              results)
         self.results = tuple(self._results)
         del self._results
         self.done = True
         return self.results
 
 
+class AggregatedResults(MultipleResults):
+    """The outcome of a notification made with a `ResultPolicy`:class:.
+    Awaiting on it returns the outcome, that's available also as
+    `value`:attr:, while `results` contains just the outcome.
+
+    When executing sequentially, the handlers following an asynchronous one
+    are called only after it has completed and only if the outcome isn't
+    decided yet. When executing concurrently, all the handlers are called
+    and, as soon as the outcome is decided, the awaitables still pending
+    are cancelled.
+    """
+
+    value = None
+    """The outcome, available when `done` is ``True``."""
+
+    def __init__(self, aggregator, pending, *, resume=None, concurrent=False,
+                 owner=None):
+        if owner is not None:
+            self.owner = owner
+        self.concurrent = concurrent
+        self._aggregator = aggregator
+        self._pending = pending
+        self._resume = resume
+        if pending:
+            self.has_async = True
+        else:
+            self._finish()
+
+    def __await__(self):
+        return self._completion_task().__await__()
+
+    async def _complete_concurrently(self):
+        aggregator = self._aggregator
+        pending = {asyncio.ensure_future(aw): aw for aw in self._pending}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    aw = pending.pop(fut)
+                    if aggregator.feed_awaited(aw, fut.result()):
+                        return
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+    async def _complete_sequentially(self):
+        aggregator = self._aggregator
+        executor, endpoints, args, kwargs = self._resume
+        aw = self._pending[0]
+        while True:
+            if aw is not None:
+                if aggregator.feed_awaited(aw, await aw):
+                    break
+            handler = next(endpoints, None)
+            if handler is None:
+                break
+            res = executor._call_endpoint(handler, args, kwargs)
+            if _is_pending(res):
+                aw = res
+            else:
+                aw = None
+                if aggregator.feed_result(res):
+                    break
+
+    async def _completion_task(self, coro_iter=None, concurrent=False):
+        if not self.done:
+            if self.concurrent:
+                await self._complete_concurrently()
+            else:
+                await self._complete_sequentially()
+            self._finish()
+        return self.value
+
+    def _finish(self):
+        self.value = self._aggregator.value
+        self.results = (self.value,)
+        self.done = True
+        self._pending = self._resume = None
+
+
+class ChunkedResults(MultipleResults):
+    """The outcome of a notification whose handlers are executed in chunks
+    by `Executor.exec_chunked`:meth: or in levels by
+    `Executor.exec_levels`:meth:. The task executing the remaining ones is
+    already scheduled, so the handlers are executed even if
+    nobody awaits on it. Awaiting on it returns the results of all the
+    handlers.
+    """
+
+    has_async = True
+
+    def __init__(self, task, *, owner=None):
+        if owner is not None:
+            self.owner = owner
+        self._task = task
+
+    def __await__(self):
+        return self._completion_task().__await__()
+
+    async def _completion_task(self, coro_iter=None, concurrent=False):
+        if not self.done:
+            self.results = await (await self._task)
+            self._task = None
+            self.done = True
+        return self.results
+
+
+class _Aggregator:
+    """Keeps the state of a `ResultPolicy`:class:."""
+
+    __slots__ = ('policy', 'freduce', 'value')
+
+    def __init__(self, policy, freduce=None, initial=None):
+        self.policy = policy
+        self.freduce = freduce
+        if policy is ResultPolicy.UNTIL_TRUE:
+            self.value = False
+        elif policy is ResultPolicy.UNTIL_FALSE:
+            self.value = True
+        elif policy is ResultPolicy.REDUCE:
+            self.value = initial
+        else:
+            self.value = None
+
+    def feed(self, value):
+        """Account a value, returning ``True`` if the outcome is decided."""
+        if value is None or value is NoResult:
+            return False
+        policy = self.policy
+        if policy is ResultPolicy.REDUCE:
+            self.value = self.freduce(self.value, value)
+            return False
+        elif policy is ResultPolicy.FIRST:
+            self.value = value
+            return True
+        elif policy is ResultPolicy.UNTIL_TRUE:
+            if value:
+                self.value = True
+                return True
+        elif not value:
+            self.value = False
+            return True
+        return False
+
+    def feed_awaited(self, awaitable, value):
+        """Account the value of an awaitable."""
+        if (isinstance(awaitable, MultipleResults) and
+            not isinstance(awaitable, AggregatedResults)):
+            return any(self.feed(v) for v in value)
+        return self.feed(value)
+
+    def feed_result(self, result):
+        """Account the value returned by an endpoint."""
+        if isinstance(result, AggregatedResults):
+            return self.feed(result.value)
+        elif isinstance(result, MultipleResults):
+            return any(self.feed(v) for v in result.results)
+        return self.feed(result)
+
+
+def _dead_endpoint(*args, **kwargs):
+    return NoResult
+
+
+def _call_ref(ref, *args, **kwargs):
+    handler = ref()
+    if handler is None:
+        return NoResult
+    return handler(*args, **kwargs)
+
+
+def _recorded_call(record_call, name, call):
+    def recorded(*args, **kwargs):
+        return record_call(name, call, args, kwargs)
+    return recorded
+
+
+_ENDPOINT_NAMES = weakref.WeakKeyDictionary()
+
+
+def _endpoint_name(endpoint):
+    """Return the name of `endpoint` used by the recorders, cached."""
+    key = getattr(endpoint, '__func__', endpoint)
+    try:
+        return _ENDPOINT_NAMES[key]
+    except (KeyError, TypeError):
+        pass
+    func = endpoint.func if isinstance(endpoint, partial) else endpoint
+    name = getattr(func, '__qualname__', None) or repr(endpoint)
+    try:
+        _ENDPOINT_NAMES[key] = name
+    except TypeError:
+        pass
+    return name
+
+
+def _is_plain(results):
+    """Tell if the pending `results` keep the awaitables in ``_results``,
+    where they can be taken from to be awaited together with others."""
+    return type(results) is MultipleResults and not results.discard
+
+
+def _is_pending(result):
+    if isinstance(result, MultipleResults):
+        return not result.done
+    return inspect.isawaitable(result)
+
+
+def _store_values(results, ixs, values):
+    """Replace the awaitables at the indexes `ixs` of the list `results`
+    with their `values`, splicing those of the nested notifications, like
+    those of the completed ones. Return the list."""
+    nested = None
+    for ix, value in zip(ixs, values):
+        aw = results[ix]
+        if (isinstance(aw, MultipleResults) and
+            not isinstance(aw, AggregatedResults)):
+            if nested is None:
+                nested = set()
+            nested.add(ix)
+        results[ix] = value
+    if nested is None:
+        return results
+    spliced = []
+    for ix, value in enumerate(results):
+        if ix in nested:
+            spliced.extend(value)
+        else:
+            spliced.append(value)
+    return spliced
+
+
+def _discard(awaitables):
+    """Dispose of the awaitables that won't be awaited."""
+    for aw in awaitables:
+        if inspect.iscoroutine(aw):
+            aw.close()
+        elif isinstance(aw, asyncio.Future):
+            aw.cancel()
+
+
 class TokenClass:
     """A token class whose instances always generate a ``False`` bool."""
 
@@ -209,6 +832,161 @@ NoResult = TokenClass()
 """A value that is returned by a callable when there's no return value and
 when ``None`` can be considered a value."""
 
+NO_RESULTS = MultipleResults(())
+"""An already completed and empty `MultipleResults`, shared by all the
+executions that don't collect results and have nothing to await."""
+
+
+@types.coroutine
+def _resume(coro, yielded, context):
+    """Continue the execution of a coroutine started by `start_eagerly`,
+    passing to the task what it yields and back to it what the task
+    sends."""
+    while True:
+        try:
+            sent = yield yielded
+        except BaseException as e:
+            step, value = coro.throw, e
+        else:
+            step, value = coro.send, sent
+        try:
+            yielded = context.run(step, value)
+        except StopIteration as stop:
+            return stop.value
+
+
+def start_eagerly(coro, loop=None):
+    """Start the execution of the coroutine `coro` immediately, like a
+    task created with an eager task factory. If it completes without
+    suspending its value is returned, and it never reaches the loop,
+    otherwise a task that continues its execution is returned. The
+    exceptions raised before suspending are raised immediately.
+
+    With Python 3.12 and later it uses the ``eager_start`` feature of the
+    tasks, with older versions it executes the first step of the coroutine
+    in a copy of the current context, and the next ones in the same context
+    by a task.
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    if _EAGER_START:
+        task = asyncio.Task(coro, loop=loop, eager_start=True)
+        if task.done():
+            return task.result()
+        return task
+    context = contextvars.copy_context()
+    try:
+        yielded = context.run(coro.send, None)
+    except StopIteration as stop:
+        return stop.value
+    return asyncio.ensure_future(_resume(coro, yielded, context), loop=loop)
+
+
+_EAGER_START = sys.version_info >= (3, 12)
+
+
+def dependency_levels(entries):
+    """Sort handlers in levels, given their dependencies. Each handler is
+    placed in the level following those of the handlers it must be executed
+    after, the handlers without dependencies are in the first level.
+
+    :param entries: a sequence of ``(name, after, before)`` tuples, one for
+      each handler, where `after` and `before` are sequences of the names of
+      the handlers that must be executed before or after it. Unknown names
+      are ignored and all the handlers with the same name are affected
+    :returns: a list of lists of indexes of `entries`, keeping their order
+      in each level
+    """
+    by_name = {}
+    for ix, (name, after, before) in enumerate(entries):
+        by_name.setdefault(name, []).append(ix)
+    preds = [set() for _ in entries]
+    for ix, (name, after, before) in enumerate(entries):
+        for dep in after:
+            preds[ix].update(by_name.get(dep, ()))
+        for dep in before:
+            for succ in by_name.get(dep, ()):
+                preds[succ].add(ix)
+    depth = [None] * len(entries)
+    for ix in range(len(entries)):
+        if depth[ix] is not None:
+            continue
+        # iterative depth first visit, to compute the depth of the
+        # predecessors first
+        stack = [ix]
+        visiting = {ix}
+        while stack:
+            current = stack[-1]
+            missing = next((p for p in preds[current] if depth[p] is None),
+                           None)
+            if missing is not None:
+                if missing in visiting:
+                    raise SignalError("Circular dependency between the "
+                                      "handlers {!r} and {!r}".format(
+                                          entries[missing][0],
+                                          entries[current][0]))
+                visiting.add(missing)
+                stack.append(missing)
+            else:
+                depth[current] = 1 + max((depth[p] for p in preds[current]),
+                                         default=-1)
+                visiting.discard(current)
+                stack.pop()
+    levels = [[] for _ in range(max(depth, default=-1) + 1)]
+    for ix, d in enumerate(depth):
+        levels[d].append(ix)
+    return levels
+
+
+def find_argument(arg, args, kwargs, signature=None, default=None):
+    """Return the value of an argument of a notification, or `default` if
+    it isn't passed.
+
+    :param arg: the name of the keyword argument or the index of the
+      positional one
+    :param signature: the signature of the validation callable of the
+      signal, used to bind the arguments when `arg` is passed the other way
+      around, as a positional or as a keyword argument. Without it such a
+      call raises `SignalError`, because the argument cannot be found
+    """
+    if isinstance(arg, str):
+        if arg in kwargs:
+            return kwargs[arg]
+        if not args:
+            return default
+    else:
+        if arg < len(args):
+            return args[arg]
+        if not kwargs:
+            return default
+    if signature is None:
+        raise SignalError("Cannot find the argument {!r} of a notification "
+                          "without the signature of the signal, pass it as "
+                          "a {} argument".format(
+                              arg, 'keyword' if isinstance(arg, str)
+                              else 'positional'))
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError as e:
+        raise SignalError("The arguments of a notification don't match the "
+                          "signature of the signal") from e
+    if not isinstance(arg, str):
+        names = list(signature.parameters)
+        if arg >= len(names):
+            return default
+        arg = names[arg]
+    return bound.arguments.get(arg, default)
+
+
+def handler_names(value):
+    """Normalize the value of the ``after`` and ``before`` options to a
+    tuple of handler names."""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
 
 async def pull_result(result):
     """`An utility coroutine generator to `await`` on an awaitable until the
@@ -243,6 +1021,35 @@ class SignalOptions(Enum):
     EXEC_CONCURRENT = 3
     """Execute the subscribers concurrently by using an ``asyncio.gather()``
     call."""
+    DISCARD_RESULTS = 4
+    """Don't collect the values returned by the subscribers by default, the
+    notification only waits for the asynchronous ones to complete. Useful
+    for high volume signals whose results nobody reads."""
+    EAGER_TASKS = 5
+    """Together with `EXEC_CONCURRENT`, start the coroutines of the
+    subscribers immediately, so that those that complete without suspending
+    don't go through the loop, see `start_eagerly`:func:."""
+
+
+class ResultPolicy(Enum):
+    """How the values returned by the handlers are aggregated into the
+    outcome of a notification. The values ``None`` and `NoResult` are
+    ignored. See `AggregatedResults`:class:.
+    """
+
+    FIRST = 1
+    """The outcome is the first value returned. The remaining handlers
+    aren't executed."""
+    UNTIL_TRUE = 2
+    """The outcome is ``True`` as soon as a handler returns a true value,
+    ``False`` otherwise."""
+    UNTIL_FALSE = 3
+    """The outcome is ``False`` as soon as a handler returns a false value,
+    like a veto, ``True`` otherwise."""
+    REDUCE = 4
+    """The values are folded into an accumulator using a function that
+    receives the accumulator and a value and returns the new accumulator.
+    All the handlers are executed."""
 
 
 def signal(*args, **kwargs):
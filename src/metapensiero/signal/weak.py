@@ -11,11 +11,184 @@ import weakref
 
 from weakreflist import WeakList
 
+from .utils import NoResult
+
+
+class StrongRef:
+    """A strong reference to an object, with the same interface of
+    `weakref.ref`."""
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __call__(self):
+        return self.obj
+
+
+class Subscription:
+    """A base for the objects that wrap a handler to change the way it's
+    executed. It's stored by the `MethodAwareWeakList`:class: in place of
+    the handler and it keeps only a weak reference to it, disconnecting
+    itself when the handler is garbage collected, so that the handler
+    lifetime isn't affected. It compares equal to the handler, so that it
+    can be disconnected using the handler itself.
+
+    The subclasses implement `call`:meth:.
+
+    :param target: the handler
+    """
+
+    _subscribers = None
+    remaining = None
+    """The number of times the handler will still be executed, if limited.
+    When it reaches zero the subscription is expired and it's removed by
+    the `MethodAwareWeakList`:class: together with the others, see
+    `MethodAwareWeakList.expire`:meth:."""
+    after = ()
+    """The names of the handlers this must be executed after."""
+    before = ()
+    """The names of the handlers this must be executed before."""
+
+    def __init__(self, target):
+        if inspect.ismethod(target):
+            self.ref = weakref.WeakMethod(target, self._dead)
+        else:
+            try:
+                self.ref = weakref.ref(target, self._dead)
+            except TypeError:
+                self.ref = StrongRef(target)
+        try:
+            # let the executor adapt the arguments for the handler
+            self.__signature__ = inspect.signature(target,
+                                                   follow_wrapped=False)
+        except (TypeError, ValueError):
+            pass
+
+    def __call__(self, *args, **kwargs):
+        target = self.ref()
+        if target is None:
+            return NoResult
+        remaining = self.remaining
+        if remaining is not None:
+            if remaining <= 0:
+                return NoResult
+            self.remaining = remaining - 1
+            if remaining == 1:
+                subscribers = self._subscribers and self._subscribers()
+                if subscribers is not None:
+                    subscribers.expire()
+        return self.call(target, args, kwargs)
+
+    def __eq__(self, other):
+        if isinstance(other, Subscription):
+            return other is self
+        if isinstance(other, weakref.ref):
+            other = other()
+        return other is not None and self.ref() == other
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return '<{} of {!r}>'.format(self.__class__.__name__, self.ref())
+
+    def _dead(self, ref):
+        subscribers = self._subscribers and self._subscribers()
+        if subscribers is not None:
+            subscribers.remove_all(self)
+
+    def attach(self, subscribers):
+        """Record the `MethodAwareWeakList`:class: where this is stored, to
+        be removed from it when the handler is garbage collected."""
+        self._subscribers = weakref.ref(subscribers)
+
+    def call(self, target, args, kwargs):
+        """Execute the handler `target`."""
+        return target(*args, **kwargs)
+
 
 class MethodAwareWeakList(WeakList):
-    """A weaklist that supports methods"""
+    """A weaklist that supports methods. `Subscription`:class: instances
+    are stored as they are, they manage the reference to the handler by
+    themselves. The items added with `append_strong`:meth: are stored as
+    they are too, and referenced strongly."""
+
+    version = 0
+    """Incremented at every change of the items, so that the users can
+    tell if what they computed from them is still valid."""
+
+    routers = None
+    """An optional mapping of the `~.routing.KeyRouter`:class: instances
+    of the handlers connected with a key, by ``key_arg``."""
+    filters = None
+    """An optional `~.filters.FilterStage`:class: of the handlers connected
+    with predicates."""
+    waiting = None
+    """An optional `MethodAwareWeakList`:class: of the
+    `~.subscribers.NextNotification`:class: subscriptions, kept apart so
+    that adding and expiring them doesn't change `version`."""
+    _expired = 0
+    _strong = None
+
+    def _forget(self, item):
+        strong = self._strong
+        if strong and not isinstance(item, weakref.ref):
+            try:
+                if item in strong and not list.__contains__(self, item):
+                    strong.discard(item)
+            except TypeError:
+                pass
+
+    def append_strong(self, item):
+        """Append `item` keeping a strong reference to it, so that it isn't
+        dereferenced when executed and it stays alive as long as it's in
+        the list. It must be hashable."""
+        if self._strong is None:
+            self._strong = set()
+        self._strong.add(item)
+        list.append(self, item)
+        self.version += 1
+
+    def append(self, item):
+        super().append(item)
+        self.version += 1
+
+    def clear(self):
+        super().clear()
+        self.routers = self.filters = self.waiting = self._strong = None
+        self._expired = 0
+        self.version += 1
+
+    def compact(self):
+        """Remove the expired subscriptions in a single pass."""
+        list.__setitem__(self, slice(None), [
+            item for item in list.__iter__(self)
+            if not (isinstance(item, Subscription) and item.remaining == 0)])
+        self._expired = 0
+        self.version += 1
+
+    def expire(self):
+        """Account for a subscription that has expired. Expired
+        subscriptions aren't executed anymore and they're removed all
+        together when they are the majority, so that the cost of the
+        removal of each one is constant, on average. The notifications
+        execute a copy of the list, so it's safe to do even during their
+        execution."""
+        self._expired += 1
+        if self._expired * 2 > len(self):
+            self.compact()
 
     def ref(self, item):
+        if isinstance(item, Subscription):
+            return item
+        strong = self._strong
+        if strong:
+            try:
+                if item in strong:
+                    return item
+            except TypeError:
+                pass
         if inspect.ismethod(item):
             try:
                 item = weakref.WeakMethod(item, self.remove_all)
@@ -23,3 +196,21 @@ class MethodAwareWeakList(WeakList):
                 return item
         else:
             return super().ref(item)
+
+    def extend(self, items):
+        super().extend(items)
+        self.version += 1
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self.version += 1
+
+    def remove(self, item):
+        super().remove(item)
+        self._forget(item)
+        self.version += 1
+
+    def remove_all(self, item):
+        super().remove_all(item)
+        self._forget(item)
+        self.version += 1